@@ -1,7 +1,11 @@
-import pandas as pd
+import time
+
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
+
+import instrumentation
+
+# Modul analisis (pandas, plotly, pyarrow, ...) di-import di dalam fungsi halaman yang memakainya:
+# cold start hanya memuat modul halaman yang dibuka, dan sidebar tampil sebelum data dimuat
 
 st.set_page_config(
     page_title="Analisis Kompetitif: NAVI vs ONIC",
@@ -10,66 +14,56 @@ st.set_page_config(
 )
 
 
-@st.cache_data
-def load_data(file_path):
-    return pd.read_csv('data/' + file_path, sep=';')
-
-
-@st.cache_data
-def load_data_history():
-    return pd.read_csv('data/navi_match_history_s15.csv', sep=',')
-
-
-# Load semua data
-team_stats = load_data('team_statistics.csv')
-navi_player_stats = load_data('player_navi_statistics.csv')
-onic_player_stats = load_data('player_onic_statistics.csv')
-navi_hero_stats = load_data('navi_hero.csv')
-onic_hero_stats = load_data('onic_hero.csv')
-hero_stats = load_data('hero_pick_ban_winrate.csv')
-navi_match_history = load_data_history()
-
-# Sidebar
-st.sidebar.title("Navigasi Analisis")
-page = st.sidebar.radio("Pilih Halaman",
-                        ["Ringkasan Tim", "Analisis Pemain [vs ONIC]", "Analisis Pemain [NAVI]", "Analisis Hero",
-                         "Rekomendasi Strategis", "All Data"])
-
-# Warna
-color_map = {'ONIC ID': '#ffcb00', 'NAVI': '#add8e6'}
+# --- Fungsi comparasion chart ---
+def create_comparison_chart(onic_player, navi_player, metric, title, **kwargs):
+    import charts
+    import data_store
+    import figure_cache
 
+    figure = figure_cache.get_figure(
+        'Analisis Pemain', 'player_comparison', data_store.data_version('onic_player_stats', 'navi_player_stats'),
+        lambda: charts.player_comparison_chart('ONIC ID', onic_player, 'NAVI', navi_player, metric, title, **kwargs),
+        onic_player=onic_player, navi_player=navi_player, metric=metric, title=title, **kwargs)
+    instrumentation.plotly_chart(figure)
 
-# --- Fungsi comparasion chart ---
-def create_comparison_chart(df_onic, df_navi, onic_player, navi_player, metric, title):
-    onic_val = df_onic[df_onic['Player'] == onic_player][metric].iloc[0]
-    navi_val = df_navi[df_navi['Player'] == navi_player][metric].iloc[0]
-
-    # Membuat dataframe kecil untuk plotting
-    chart_data = pd.DataFrame({
-        'Pemain': [f"{onic_player} (ONIC)", f"{navi_player} (NAVI)"],
-        metric: [onic_val, navi_val]
-    })
-
-    # Membuat bar chart dengan Plotly
-    figure = px.bar(chart_data, x='Pemain', y=metric, title=title,
-                    text_auto='.2s', color='Pemain', color_discrete_map={
-            f"{onic_player} (ONIC)": color_map['ONIC ID'],
-            f"{navi_player} (NAVI)": color_map['NAVI']
-        })
-    figure.update_traces(textfont_size=14, textangle=0, textposition="outside", cliponaxis=False)
-    figure.update_layout(showlegend=False, xaxis_title="", yaxis_title=metric)
-    st.plotly_chart(figure, use_container_width=True)
-
-
-team_stats_filtered = team_stats[team_stats['Team Name'].isin(['ONIC ID', 'NAVI'])].copy()
-team_stats_filtered = team_stats_filtered.sort_values(by='Team Name', ascending=False)
 
 # ==============================================================================
 # --- Halaman 1: Ringkasan Tim ---
 # ==============================================================================
 
-if page == "Ringkasan Tim":
+def page_team_summary(state):
+    import charts
+    import comparison
+    import data_store
+    import figure_cache
+    import ratings
+
     st.title("Ringkasan Performa Tim: Head-to-Head")
+
+    # Pilih musim & dua tim; default ONIC ID vs NAVI di musim berjalan
+    default_season, default_a, default_b = comparison.DEFAULT_MATCHUP
+    seasons = data_store.list_seasons()
+    sel_col1, sel_col2, sel_col3 = st.columns(3)
+    season = sel_col1.selectbox("Musim", seasons, index=seasons.index(default_season))
+    teams = comparison.season_teams(season)
+    team_a = sel_col2.selectbox("Tim A", teams, index=teams.index(default_a) if default_a in teams else 0)
+    opponents = [team for team in teams if team != team_a]
+    if not opponents:
+        st.warning(f"Butuh minimal dua tim di team_statistics musim {season}.")
+        return
+    team_b = sel_col3.selectbox("Tim B", opponents,
+                                index=opponents.index(default_b) if default_b in opponents else 0)
+    # Analisis tertulis di halaman ini khusus untuk matchup default
+    show_notes = (season, team_a, team_b) == comparison.DEFAULT_MATCHUP
+
+    team_stats_filtered, deltas = comparison.team_matchup(team_a, team_b, season)
+    deltas_a, deltas_b = deltas.loc[team_a], deltas.loc[team_b]
+    stats_a, stats_b = team_stats_filtered.loc[team_a], team_stats_filtered.loc[team_b]
+    short_a, short_b = comparison.short_name(team_a), comparison.short_name(team_b)
+    color_map = comparison.team_colors([team_a, team_b])
+    # Figure halaman ini di-cache per versi data + pilihan musim/tim
+    version = data_store.dataset_version('team_stats', season)
+    matchup = dict(season=season, team_a=team_a, team_b=team_b)
     st.markdown("---")
 
     # --- Sesi 1: Performa Keseluruhan ---
@@ -77,69 +71,78 @@ if page == "Ringkasan Tim":
     st.write("Perbandingan *win rate* antara kedua tim.")
 
     # Funnel Chart
-    df_winrate = team_stats_filtered[['Team Name', 'Match Win Rate%', 'Game Win Rate%']].copy()
-    df_winrate = df_winrate.melt(id_vars='Team Name', var_name='Type', value_name='Rate')
-
-    fig_funnel = px.funnel(df_winrate, x='Rate', y='Type', color='Team Name',
-                           title="Match WR vs Game WR",
-                           color_discrete_map=color_map)
-    st.plotly_chart(fig_funnel, use_container_width=True)
-
-    with st.expander("Lihat Analisis Performa Keseluruhan"):
-        st.write("""
-        - **ONIC** unggul secara signifikan dalam Match WR (70%) dan Game WR (61.67%).
-        - **NAVI** memiliki WR yang jauh lebih rendah (0% Match, 15.79% Game), menyoroti area perbaikan utama pada eksekusi strategi dan sinergi tim.
-        - **Insight:** Perbedaan konsistensi dan kemampuan untuk mengonversi setiap peluang menjadi hasil yang positif.
-        """)
+    fig_funnel = figure_cache.get_figure('Ringkasan Tim', 'winrate_funnel', version,
+                                         lambda: charts.winrate_funnel(team_stats_filtered, color_map), **matchup)
+    instrumentation.plotly_chart(fig_funnel)
+
+    # Rating Elo: kekuatan tim disesuaikan dengan kekuatan lawan yang dihadapi
+    engine = ratings.rating_engine(season)
+    rating_a, rating_b = engine.rating(team_a), engine.rating(team_b)
+    game_p = ratings.expected(rating_a, rating_b)
+    col1, col2, col3 = st.columns(3)
+    col1.metric(label=f"Rating Elo {short_a}", value=f"{rating_a:.0f}",
+                delta=f"{rating_a - rating_b:.0f} vs {short_b}")
+    col2.metric(label=f"Rating Elo {short_b}", value=f"{rating_b:.0f}",
+                delta=f"{rating_b - rating_a:.0f} vs {short_a}")
+    col3.metric(label=f"Peluang {short_a} Menang Bo3", value=f"{ratings.series_win_probability(game_p):.0%}",
+                delta=f"{game_p:.0%} per game", delta_color="off")
+    st.caption(f"Rating dihitung dari riwayat match {ratings.HISTORY_TEAM} "
+               f"({engine.games(team_a)} game {short_a}, {engine.games(team_b)} game {short_b}); "
+               f"tim tanpa riwayat match memakai rating awal {ratings.INITIAL_RATING:.0f}.")
+
+    if show_notes:
+        with st.expander("Lihat Analisis Performa Keseluruhan"):
+            st.write("""
+            - **ONIC** unggul secara signifikan dalam Match WR (70%) dan Game WR (61.67%).
+            - **NAVI** memiliki WR yang jauh lebih rendah (0% Match, 15.79% Game), menyoroti area perbaikan utama pada eksekusi strategi dan sinergi tim.
+            - **Insight:** Perbedaan konsistensi dan kemampuan untuk mengonversi setiap peluang menjadi hasil yang positif.
+            """)
     st.markdown("---")
 
     # --- Sesi 2: Gameplay ---
     st.header("Sesi 2: Analisis Gameplay")
 
-    # Data kedua tim
-    onic_stats = team_stats_filtered[team_stats_filtered['Team Name'] == 'ONIC ID'].iloc[0]
-    navi_stats = team_stats_filtered[team_stats_filtered['Team Name'] == 'NAVI'].iloc[0]
-
     col1, col2 = st.columns(2)
 
     with col1:
-        st.subheader("ONIC ID")
+        st.subheader(team_a)
         # st.markdown("---")
-        st.metric(label="Avg Kills per Game", value=f"{onic_stats['Kills per Game']:.2f}",
-                  delta=f"{onic_stats['Kills per Game'] - navi_stats['Kills per Game']:.2f} vs NAVI")
+        st.metric(label="Avg Kills per Game", value=f"{stats_a['Kills per Game']:.2f}",
+                  delta=f"{deltas_a['Kills per Game']:.2f} vs {short_b}")
 
-        st.metric(label="Avg Deaths per Game", value=f"{onic_stats['Deaths per Game']:.2f}",
-                  delta=f"{onic_stats['Deaths per Game'] - navi_stats['Deaths per Game']:.2f} vs NAVI",
+        st.metric(label="Avg Deaths per Game", value=f"{stats_a['Deaths per Game']:.2f}",
+                  delta=f"{deltas_a['Deaths per Game']:.2f} vs {short_b}",
                   delta_color="inverse")
 
-        st.metric(label="KDA Ratio", value=f"{onic_stats['KDA']:.2f}",
-                  delta=f"{onic_stats['KDA'] - navi_stats['KDA']:.2f} vs NAVI")
+        st.metric(label="KDA Ratio", value=f"{stats_a['KDA']:.2f}",
+                  delta=f"{deltas_a['KDA']:.2f} vs {short_b}")
 
-        st.metric(label="Team Kill Participation (%)", value=f"{onic_stats['Team Kill Participation%']:.2f}%",
-                  delta=f"{onic_stats['Team Kill Participation%'] - navi_stats['Team Kill Participation%']:.2f}% vs NAVI")
+        st.metric(label="Team Kill Participation (%)", value=f"{stats_a['Team Kill Participation%']:.2f}%",
+                  delta=f"{deltas_a['Team Kill Participation%']:.2f}% vs {short_b}")
 
     with col2:
-        st.subheader("NAVI")
+        st.subheader(team_b)
         # st.markdown("---")
-        st.metric(label="Avg Kills per Game", value=f"{navi_stats['Kills per Game']:.2f}",
-                  delta=f"{navi_stats['Kills per Game'] - onic_stats['Kills per Game']:.2f} vs ONIC")
+        st.metric(label="Avg Kills per Game", value=f"{stats_b['Kills per Game']:.2f}",
+                  delta=f"{deltas_b['Kills per Game']:.2f} vs {short_a}")
 
-        st.metric(label="Avg Deaths per Game", value=f"{navi_stats['Deaths per Game']:.2f}",
-                  delta=f"{navi_stats['Deaths per Game'] - onic_stats['Deaths per Game']:.2f} vs ONIC",
+        st.metric(label="Avg Deaths per Game", value=f"{stats_b['Deaths per Game']:.2f}",
+                  delta=f"{deltas_b['Deaths per Game']:.2f} vs {short_a}",
                   delta_color="inverse")
 
-        st.metric(label="KDA Ratio", value=f"{navi_stats['KDA']:.2f}",
-                  delta=f"{navi_stats['KDA'] - onic_stats['KDA']:.2f} vs ONIC")
+        st.metric(label="KDA Ratio", value=f"{stats_b['KDA']:.2f}",
+                  delta=f"{deltas_b['KDA']:.2f} vs {short_a}")
 
-        st.metric(label="Team Kill Participation (%)", value=f"{navi_stats['Team Kill Participation%']:.2f}%",
-                  delta=f"{navi_stats['Team Kill Participation%'] - onic_stats['Team Kill Participation%']:.2f}% vs ONIC")
+        st.metric(label="Team Kill Participation (%)", value=f"{stats_b['Team Kill Participation%']:.2f}%",
+                  delta=f"{deltas_b['Team Kill Participation%']:.2f}% vs {short_a}")
 
-    with st.expander("Lihat Analisis Gameplay"):
-        st.write("""
-        - **Produktivitas Kill:** ONIC mencetak lebih banyak Kills per Game (13.4) dengan Deaths per Game yang lebih sedikit (11).
-        - **Efektivitas:** KDA ONIC (8.36) jauh melampaui NAVI (3.41).
-        - **Insight:** NAVI sering terlibat dalam pertarungan (Kill Participation 70.23%) namun tidak efisien, menghasilkan lebih banyak *deaths* dan *trade-off* yang merugikan.
-        """)
+    if show_notes:
+        with st.expander("Lihat Analisis Gameplay"):
+            st.write("""
+            - **Produktivitas Kill:** ONIC mencetak lebih banyak Kills per Game (13.4) dengan Deaths per Game yang lebih sedikit (11).
+            - **Efektivitas:** KDA ONIC (8.36) jauh melampaui NAVI (3.41).
+            - **Insight:** NAVI sering terlibat dalam pertarungan (Kill Participation 70.23%) namun tidak efisien, menghasilkan lebih banyak *deaths* dan *trade-off* yang merugikan.
+            """)
     st.markdown("---")
 
     # --- Sesi 3: Kontrol Objektif ---
@@ -149,167 +152,83 @@ if page == "Ringkasan Tim":
 
     with col1:
         # --- Grafik 1: Tornado Chart untuk Control Rate ---
-        # Data untuk Tornado Chart
-        df_obj_rate = team_stats_filtered.copy()
-        onic_turtle_rate = df_obj_rate[df_obj_rate['Team Name'] == 'ONIC ID']['Cryoturtle Control Rate%'].iloc[0]
-        navi_turtle_rate = df_obj_rate[df_obj_rate['Team Name'] == 'NAVI']['Cryoturtle Control Rate%'].iloc[0]
-        onic_lord_rate = df_obj_rate[df_obj_rate['Team Name'] == 'ONIC ID']['lord Control Rate%'].iloc[0]
-        navi_lord_rate = df_obj_rate[df_obj_rate['Team Name'] == 'NAVI']['lord Control Rate%'].iloc[0]
-
-        y_labels_rate = ['Lord Control Rate (%)', 'Turtle Control Rate (%)']
-        fig_tornado = go.Figure()
-        fig_tornado.add_trace(go.Bar(
-            y=y_labels_rate,
-            x=[onic_lord_rate, onic_turtle_rate],
-            name='ONIC ID',
-            orientation='h',
-            marker=dict(color=color_map['ONIC ID'])
-        ))
-        fig_tornado.add_trace(go.Bar(
-            y=y_labels_rate,
-            x=[-navi_lord_rate, -navi_turtle_rate],
-            name='NAVI',
-            orientation='h',
-            marker=dict(color=color_map['NAVI'])
-        ))
-
-        fig_tornado.update_layout(
-            title='Kontrol Objektif (%)',
-            barmode='relative',
-            xaxis_title="Control Rate (%)",
-            yaxis_title="",
-            bargap=0.4,
-            xaxis=dict(
-                tickvals=[-75, -50, -25, 0, 25, 50, 75],
-                ticktext=['75', '50', '25', '0', '25', '50', '75']
-            ),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
-        st.plotly_chart(fig_tornado, use_container_width=True)
+        fig_tornado = figure_cache.get_figure(
+            'Ringkasan Tim', 'objective_tornado', version,
+            lambda: charts.objective_tornado(team_stats_filtered, team_a, team_b, color_map), **matchup)
+        instrumentation.plotly_chart(fig_tornado)
 
     with col2:
         # --- Grafik 2: Grouped Bar Chart untuk Slain per Game ---
-        objective_df = team_stats_filtered[
-            ['Team Name', 'Cryoturtle Kill Count per Game', 'Lord Kill Count per Game']].copy()
-        objective_df = objective_df.melt(id_vars='Team Name', var_name='Objective', value_name='Count per Game')
-
-        objective_df['Objective'] = objective_df['Objective'].replace({
-            'Cryoturtle Kill Count per Game': 'Turtle Slain',
-            'Lord Kill Count per Game': 'Lord Slain'
-        })
-
-        fig_grouped_bar = px.bar(objective_df, x="Team Name", y="Count per Game", color="Objective",
-                                 barmode='group', text_auto='.2f', title="Avg Turtle/Lord per Game")
-        fig_grouped_bar.update_layout(xaxis_title="", yaxis_title="Avg/game", legend_title="Objektif")
-        st.plotly_chart(fig_grouped_bar, use_container_width=True)
-
-    tower_df = team_stats_filtered[
-        ['Team Name', 'Tower Destroy Count per Game', 'Tower Destroyed Count per Game']].copy()
-    tower_df = tower_df.melt(id_vars='Team Name', var_name='Metric', value_name='Count per Game')
-
-    tower_df['Metric'] = tower_df['Metric'].replace({
-        'Tower Destroy Count per Game': 'Destroy',
-        'Tower Destroyed Count per Game': 'Destroyed'
-    })
-
-    fig_tower_bar = px.bar(tower_df, x="Team Name", y="Count per Game", color="Metric",
-                           barmode='group', text_auto='.2f',
-                           title="Objektif Turret/game",
-                           color_discrete_map={
-                               'Destroy': 'green',
-                               'Destroyed': 'red'
-                           })
-    fig_tower_bar.update_layout(xaxis_title="", yaxis_title="Avg/game", legend_title="Turret")
-    st.plotly_chart(fig_tower_bar, use_container_width=True)
-
-    with st.expander("Lihat Analisis Objektif"):
-        st.write("""
-        - **Kekuatan di Early Game:** Data menunjukkan NAVI cukup kompetitif dalam perebutan objektif awal (Turtle). Mereka mampu mengamankan rata-rata **1.26 Turtle per game**, angka yang hampir menyamai ONIC (1.4 per game). Ini menandakan bahwa strategi dan koordinasi mereka untuk 10 menit pertama permainan sudah cukup solid.
+        fig_grouped_bar = figure_cache.get_figure('Ringkasan Tim', 'objective_bar', version,
+                                                  lambda: charts.objective_bar(team_stats_filtered), **matchup)
+        instrumentation.plotly_chart(fig_grouped_bar)
 
-        - **Problem Transisi ke Late Game:** Namun, kekuatan ini tidak berlanjut. Terlihat adanya penurunan performa yang drastis saat game beralih ke perebutan Lord. NAVI hanya mampu mengamankan **0.42 Lord per game**, sangat jauh di bawah ONIC yang dominan dengan 1.12 Lord per game.
+    fig_tower_bar = figure_cache.get_figure('Ringkasan Tim', 'tower_bar', version,
+                                            lambda: charts.tower_bar(team_stats_filtered), **matchup)
+    instrumentation.plotly_chart(fig_tower_bar)
 
-        - **Kontrol Map (Turret):** NAVI kehilangan rata-rata **7.21 turret per game**, sementara hanya mampu menghancurkan **3.34 turret** milik lawan. Perbedaan signifikan ini menunjukkan bahwa mereka terus-menerus kehilangan kontrol *map* dan berada di bawah tekanan.
+    if show_notes:
+        with st.expander("Lihat Analisis Objektif"):
+            st.write("""
+            - **Kekuatan di Early Game:** Data menunjukkan NAVI cukup kompetitif dalam perebutan objektif awal (Turtle). Mereka mampu mengamankan rata-rata **1.26 Turtle per game**, angka yang hampir menyamai ONIC (1.4 per game). Ini menandakan bahwa strategi dan koordinasi mereka untuk 10 menit pertama permainan sudah cukup solid.
 
-        - **Insight Utama:** Pola ini mengindikasikan bahwa NAVI seringkali **kehilangan arah dan momentum setelah fase Turtle berakhir**. Mereka tampak kesulitan dalam **transisi strategi dari mid-game ke late-game**. Kegagalan mengontrol Lord secara konsisten inilah yang menjadi salah satu penyebab utama mereka kehilangan kontrol *map* dan akhirnya kalah dalam pertandingan.
-        """)
+            - **Problem Transisi ke Late Game:** Namun, kekuatan ini tidak berlanjut. Terlihat adanya penurunan performa yang drastis saat game beralih ke perebutan Lord. NAVI hanya mampu mengamankan **0.42 Lord per game**, sangat jauh di bawah ONIC yang dominan dengan 1.12 Lord per game.
+
+            - **Kontrol Map (Turret):** NAVI kehilangan rata-rata **7.21 turret per game**, sementara hanya mampu menghancurkan **3.34 turret** milik lawan. Perbedaan signifikan ini menunjukkan bahwa mereka terus-menerus kehilangan kontrol *map* dan berada di bawah tekanan.
+
+            - **Insight Utama:** Pola ini mengindikasikan bahwa NAVI seringkali **kehilangan arah dan momentum setelah fase Turtle berakhir**. Mereka tampak kesulitan dalam **transisi strategi dari mid-game ke late-game**. Kegagalan mengontrol Lord secara konsisten inilah yang menjadi salah satu penyebab utama mereka kehilangan kontrol *map* dan akhirnya kalah dalam pertandingan.
+            """)
     st.markdown("---")
 
     # --- Sesi 4: Ringkasan Analisis---
-    st.header("Ringkasan Analisis")
-    st.success(
-        """
-        **Kesimpulan Utama:**
-        1.  **Core Problem:** Masalah utama NAVI berakar pada **efektivitas team fight yang rendah** (KDA rendah walaupun Kill Participation tinggi) dan **kegagalan mengamankan objektif krusial (terutama Lord)**.
-        2.  **Siklus Negatif:** Dua masalah ini menciptakan siklus: Gagal mengontrol objektif -> kalah gold/level -> kalah team fight -> semakin sulit mengontrol objektif.
+    if show_notes:
+        st.header("Ringkasan Analisis")
+        st.success(
+            """
+            **Kesimpulan Utama:**
+            1.  **Core Problem:** Masalah utama NAVI berakar pada **efektivitas team fight yang rendah** (KDA rendah walaupun Kill Participation tinggi) dan **kegagalan mengamankan objektif krusial (terutama Lord)**.
+            2.  **Siklus Negatif:** Dua masalah ini menciptakan siklus: Gagal mengontrol objektif -> kalah gold/level -> kalah team fight -> semakin sulit mengontrol objektif.
+
+            **Selanjutnya:** Analisis pada level **Pemain** dan **Hero** akan bertujuan untuk mengidentifikasi area yang menjadi penyebab dari masalah-masalah ini.
+            """
+        )
+
 
-        **Selanjutnya:** Analisis pada level **Pemain** dan **Hero** akan bertujuan untuk mengidentifikasi area yang menjadi penyebab dari masalah-masalah ini.
-        """
-    )
 # ==============================================================================
 # --- Halaman 2: Analisis Pemain ---
 # ==============================================================================
 
-if page == "Analisis Pemain [vs ONIC]":
+def page_player_vs_onic(state):
+    import comparison
+
+    # Lineup per role diambil dari ROSTERS, bukan di-hardcode di halaman
+    onic = comparison.roster('ONIC ID')
+    navi = comparison.roster('NAVI')
+
     st.title("Analisis Pemain")
     st.markdown("---")
 
     # --- 1. Jungler: Kairi (ONIC) vs Woshipaul (NAVI) ---
-    st.subheader("Jungler: Kairi (ONIC) vs Woshipaul (NAVI)")
+    st.subheader(f"Jungler: {onic['Jungler']} (ONIC) vs {navi['Jungler']} (NAVI)")
     st.markdown(
         "Fokus analisis pada efisiensi *farming*, efektivitas war, dan kemampuan mengamankan objektif krusial.")
 
     col1, col2 = st.columns(2)
     with col1:
-        kairi_lord_pg = onic_player_stats[onic_player_stats['Player'] == 'Kairi']['Lord Secured'].iloc[0] / \
-                        onic_player_stats[onic_player_stats['Player'] == 'Kairi']['Games Played'].iloc[0]
-        woshipaul_lord_pg = navi_player_stats[navi_player_stats['Player'] == 'Woshipaul']['Lord Secured'].iloc[0] / \
-                            navi_player_stats[navi_player_stats['Player'] == 'Woshipaul']['Games Played'].iloc[0]
-
-        # Membuat DataFrame untuk chart
-        chart_data_lord = pd.DataFrame({
-            'Pemain': ['Kairi (ONIC)', 'Woshipaul (NAVI)'],
-            'Lord Secured per Game': [kairi_lord_pg, woshipaul_lord_pg]
-        })
-
-        # Membuat Bar Chart
-        fig_lord = px.bar(chart_data_lord, x='Pemain', y='Lord Secured per Game',
-                          title='Avg Lord/game', text_auto='.2f', color='Pemain',
-                          color_discrete_map={'Kairi (ONIC)': color_map['ONIC ID'],
-                                              'Woshipaul (NAVI)': color_map['NAVI']})
-        fig_lord.update_traces(textfont_size=14, textangle=0, textposition="outside", cliponaxis=False)
-        fig_lord.update_layout(showlegend=False, xaxis_title="", yaxis_title="Lord/Game")
-        st.plotly_chart(fig_lord, use_container_width=True)
+        create_comparison_chart(onic['Jungler'], navi['Jungler'], 'Lord Secured per Game', 'Avg Lord/game',
+                                text_auto='.2f', yaxis_title="Lord/Game")
 
     with col2:
-        # Menghitung metrik Turtle per game
-        kairi_turtle_pg = onic_player_stats[onic_player_stats['Player'] == 'Kairi']['Cryoturtle Secured'].iloc[0] / \
-                          onic_player_stats[onic_player_stats['Player'] == 'Kairi']['Games Played'].iloc[0]
-        woshipaul_turtle_pg = navi_player_stats[navi_player_stats['Player'] == 'Woshipaul']['Cryoturtle Secured'].iloc[
-                                  0] / \
-                              navi_player_stats[navi_player_stats['Player'] == 'Woshipaul']['Games Played'].iloc[0]
-
-        # Membuat DataFrame untuk chart
-        chart_data_turtle = pd.DataFrame({
-            'Pemain': ['Kairi (ONIC)', 'Woshipaul (NAVI)'],
-            'Turtle Secured per Game': [kairi_turtle_pg, woshipaul_turtle_pg]
-        })
-
-        # Membuat Bar Chart
-        fig_turtle = px.bar(chart_data_turtle, x='Pemain', y='Turtle Secured per Game',
-                            title='Avg Turtle/game', text_auto='.2f', color='Pemain',
-                            color_discrete_map={'Kairi (ONIC)': color_map['ONIC ID'],
-                                                'Woshipaul (NAVI)': color_map['NAVI']})
-        fig_turtle.update_traces(textfont_size=14, textangle=0, textposition="outside", cliponaxis=False)
-        fig_turtle.update_layout(showlegend=False, xaxis_title="", yaxis_title="Turtle/Game")
-        st.plotly_chart(fig_turtle, use_container_width=True)
+        create_comparison_chart(onic['Jungler'], navi['Jungler'], 'Turtle Secured per Game', 'Avg Turtle/game',
+                                text_auto='.2f', yaxis_title="Turtle/Game")
 
     col3, col4 = st.columns(2)
     with col3:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'Kairi', 'Woshipaul', 'KDA Ratio',
+        create_comparison_chart(onic['Jungler'], navi['Jungler'], 'KDA Ratio',
                                 'KDA')
 
     with col4:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'Kairi', 'Woshipaul', 'Gold Per Minute',
+        create_comparison_chart(onic['Jungler'], navi['Jungler'], 'Gold Per Minute',
                                 'GPM')
 
     with st.expander("Lihat Analisis Jungler"):
@@ -323,19 +242,19 @@ if page == "Analisis Pemain [vs ONIC]":
     st.markdown("---")
 
     # --- 2. Gold Laner: Savero (ONIC) vs Xyve (NAVI) ---
-    st.subheader("Gold Laner: Savero (ONIC) vs Xyve (NAVI)")
+    st.subheader(f"Gold Laner: {onic['Gold']} (ONIC) vs {navi['Gold']} (NAVI)")
     st.markdown("Fokus analisis pada efisiensi *farming*, output *damage*, dan push turret.")
 
     chart_col1, chart_col2, chart_col3 = st.columns(3)
     with chart_col1:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'Savero', 'Xyve', 'Gold Per Minute',
+        create_comparison_chart(onic['Gold'], navi['Gold'], 'Gold Per Minute',
                                 'GPM')
     with chart_col2:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'Savero', 'Xyve', 'Damage Per Minute',
+        create_comparison_chart(onic['Gold'], navi['Gold'], 'Damage Per Minute',
                                 'DPM')
     with chart_col3:
         # Building Damage Share
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'Savero', 'Xyve', 'Building Damage Share%',
+        create_comparison_chart(onic['Gold'], navi['Gold'], 'Building Damage Share%',
                                 'Push Turret (Share) %')
 
     with st.expander("Lihat Analisis Gold Laner"):
@@ -347,16 +266,16 @@ if page == "Analisis Pemain [vs ONIC]":
     st.markdown("---")
 
     # --- 3. Mid Laner: S A N Z (ONIC) vs xMagic (NAVI) ---
-    st.subheader("Mid Laner: S A N Z (ONIC) vs xMagic (NAVI)")
+    st.subheader(f"Mid Laner: {onic['Mid']} (ONIC) vs {navi['Mid']} (NAVI)")
     chart_col1, chart_col2, chart_col3 = st.columns(3)
     with chart_col1:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'S A N Z', 'xMagic', 'KDA Ratio',
+        create_comparison_chart(onic['Mid'], navi['Mid'], 'KDA Ratio',
                                 'KDA')
     with chart_col2:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'S A N Z', 'xMagic', 'Kill Participation%',
+        create_comparison_chart(onic['Mid'], navi['Mid'], 'Kill Participation%',
                                 'Kill Participation %')
     with chart_col3:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'S A N Z', 'xMagic', 'Damage Share%',
+        create_comparison_chart(onic['Mid'], navi['Mid'], 'Damage Share%',
                                 'Damage Share %')
     with st.expander("Lihat Analisis Mid Laner"):
         st.write("""
@@ -367,17 +286,17 @@ if page == "Analisis Pemain [vs ONIC]":
     st.markdown("---")
 
     # --- 4. Roamer: Kiboy (ONIC) vs Karss (NAVI) ---
-    st.subheader("Roamer: Kiboy (ONIC) vs Karss (NAVI)")
+    st.subheader(f"Roamer: {onic['Roam']} (ONIC) vs {navi['Roam']} (NAVI)")
     st.markdown("Fokus pada kemampuan *playmaking* dan *crowd control*.")
     chart_col1, chart_col2, chart_col3 = st.columns(3)
     with chart_col1:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'Kiboy', 'Karss', 'Average Assists',
+        create_comparison_chart(onic['Roam'], navi['Roam'], 'Average Assists',
                                 'Avg Assists per Game')
     with chart_col2:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'Kiboy', 'Karss', 'Damage Taken Per Minute',
+        create_comparison_chart(onic['Roam'], navi['Roam'], 'Damage Taken Per Minute',
                                 'Damage Taken / Min')
     with chart_col3:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'Kiboy', 'Karss', 'Control time per game/s',
+        create_comparison_chart(onic['Roam'], navi['Roam'], 'Control time per game/s',
                                 'Avg Control Time / Game (s)')
     with st.expander("Lihat Analisis Roamer"):
         st.write("""
@@ -387,16 +306,16 @@ if page == "Analisis Pemain [vs ONIC]":
     st.markdown("---")
 
     # --- 5. EXP Laner: Lutpiii (ONIC) vs bq syaii (NAVI) ---
-    st.subheader("EXP Laner: Lutpiii (ONIC) vs bq syaii (NAVI)")
+    st.subheader(f"EXP Laner: {onic['Exp']} (ONIC) vs {navi['Exp']} (NAVI)")
     chart_col1, chart_col2, chart_col3 = st.columns(3)
     with chart_col1:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'Lutpiii', 'bq syaii', 'KDA Ratio',
+        create_comparison_chart(onic['Exp'], navi['Exp'], 'KDA Ratio',
                                 'KDA')
     with chart_col2:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'Lutpiii', 'bq syaii', 'Average Deaths',
+        create_comparison_chart(onic['Exp'], navi['Exp'], 'Average Deaths',
                                 'Avg Deaths / game')
     with chart_col3:
-        create_comparison_chart(onic_player_stats, navi_player_stats, 'Lutpiii', 'bq syaii', 'Damage Taken Share%',
+        create_comparison_chart(onic['Exp'], navi['Exp'], 'Damage Taken Share%',
                                 'Damage Taken Share %')
     with st.expander("Lihat Analisis EXP Laner"):
         st.write("""
@@ -422,7 +341,39 @@ if page == "Analisis Pemain [vs ONIC]":
         """
     )
 
-if page == "Analisis Pemain [NAVI]":
+
+# ==============================================================================
+# --- Halaman 3: Analisis Pemain NAVI ---
+# ==============================================================================
+
+def role_row(role_stats, player, role):
+    # Baris dari riwayat match (bisa berkurang karena baris dikarantina): pemain yang tidak
+    # tercatat di role itu mendapat baris kosong, bukan KeyError
+    return role_stats.reindex([(player, role)]).iloc[0]
+
+
+def game_count(value):
+    # 'Games Won' kosong jika hasil per game tidak bisa dipastikan dari skor seri
+    return '–' if value != value else f"{int(value)}"
+
+
+def role_win_interval(role_row):
+    import confidence
+
+    if role_row['Games Won'] != role_row['Games Won'] or not role_row['Games'] > 0:
+        return "interval tidak tersedia"
+    # Interval Wilson 95% untuk win rate per role (jumlah game per role sangat kecil)
+    low, high = confidence.wilson(role_row['Games Won'], role_row['Games'])
+    return confidence.format_interval(low * 100, high * 100, '.1f', '%')
+
+
+def page_navi_players(state):
+    import assets
+    import confidence
+
+    navi_player_stats = state.navi_player_stats
+    role_stats = state.player_role_stats
+
     st.title("Analisis Pemain NAVI")
     st.info(
         "Analisis ini membandingkan pemain yang pernah mengisi role Jungler, EXP, dan Roam di NAVI selama MPL S15, berdasarkan statistik individu dan hasil pertandingan saat mereka bermain.")
@@ -436,8 +387,10 @@ if page == "Analisis Pemain [NAVI]":
         "Fokus analisis pada *winning impact* dan kontribusi damage.")
 
     # Data Prep
-    aether_stats = navi_player_stats[navi_player_stats['Player'] == 'Aether'].iloc[0]
-    woshipaul_stats = navi_player_stats[navi_player_stats['Player'] == 'Woshipaul'].iloc[0]
+    aether_stats = navi_player_stats.loc['Aether']
+    woshipaul_stats = navi_player_stats.loc['Woshipaul']
+    # Interval kepercayaan 95%: sampel tiap pemain hanya belasan game
+    navi_ci = confidence.team_intervals('NAVI')
 
     # Metrik Kunci
     aether_wins = aether_stats['Number of game wins']
@@ -449,28 +402,34 @@ if page == "Analisis Pemain [NAVI]":
 
     with col1:
         st.subheader("Aether")
-        st.image("images/Aether.png", width=250)
+        st.image(assets.player_photo("Aether"), width=250)
 
         st.metric("Total Games Won (from 17 games)", f"{aether_wins} Game",
                   delta=f"{aether_wins - woshipaul_wins} Game vs Woshipaul")
+        st.caption(f"WR {aether_stats['Games Win Ratio%']:.1f}% · "
+                   f"{confidence.describe(navi_ci.loc['Aether'], 'Games Win Ratio%', '.1f', '%')}")
         st.metric("Damage Per Minute (DPM)", f"{int(aether_dpm)}",
                   delta=f"{int(aether_dpm - woshipaul_dpm)} vs Woshipaul")
 
         st.markdown("---")
         st.write(f"**KDA:** {aether_stats['KDA Ratio']:.2f}")
+        st.caption(confidence.describe(navi_ci.loc['Aether'], 'KDA Ratio'))
         st.write(f"**Avg Deaths:** {aether_stats['Average Deaths']:.2f}")
 
     with col2:
         st.subheader("Woshipaul")
-        st.image("images/Woshipaul.png", width=250)
+        st.image(assets.player_photo("Woshipaul"), width=250)
 
         st.metric("Total Games Won (from 21 games)", f"{woshipaul_wins} Game",
                   delta=f"-{aether_wins - woshipaul_wins} Game vs Aether")
+        st.caption(f"WR {woshipaul_stats['Games Win Ratio%']:.1f}% · "
+                   f"{confidence.describe(navi_ci.loc['Woshipaul'], 'Games Win Ratio%', '.1f', '%')}")
         st.metric("Damage Per Minute (DPM)", f"{int(woshipaul_dpm)}",
                   delta=f"-{int(aether_dpm - woshipaul_dpm)} vs Aether")
 
         st.markdown("---")
         st.write(f"**KDA:** {woshipaul_stats['KDA Ratio']:.2f}")
+        st.caption(confidence.describe(navi_ci.loc['Woshipaul'], 'KDA Ratio'))
         st.write(f"**Avg Deaths:** {woshipaul_stats['Average Deaths']:.2f}")
 
     with st.expander("Lihat Analisis Jungler"):
@@ -498,37 +457,40 @@ if page == "Analisis Pemain [NAVI]":
     st.header("Analisis EXP Laner")
 
     # Data Prep
-    karss_stats = navi_player_stats[navi_player_stats['Player'] == 'Karss'].iloc[0]
-    bq_syaii_stats = navi_player_stats[navi_player_stats['Player'] == 'bq syaii'].iloc[0]
-    febbb_stats = navi_player_stats[navi_player_stats['Player'] == 'Febbb'].iloc[0]
+    karss_stats = navi_player_stats.loc['Karss']
+    bq_syaii_stats = navi_player_stats.loc['bq syaii']
+    febbb_stats = navi_player_stats.loc['Febbb']
 
-    karss_exp_matches = navi_match_history[navi_match_history['Player_Exp'].str.contains('Karss')]
-    bq_syaii_matches = navi_match_history[navi_match_history['Player_Exp'].str.contains('bq syaii')]
-    febbb_matches = navi_match_history[navi_match_history['Player_Exp'].str.contains('Febbb')]
+    karss_exp = role_row(role_stats, 'Karss', 'Exp')
+    bq_syaii_exp = role_row(role_stats, 'bq syaii', 'Exp')
+    febbb_exp = role_row(role_stats, 'Febbb', 'Exp')
 
     col1, col2, col3 = st.columns(3)
     with col1:
         st.subheader("Karss")
-        st.image("images/Karss.png", width=250)
-        st.metric("Games Won as EXP (from 15 games)", f"{karss_exp_matches['Score_NAVI'].sum()} Game")
-        st.write(f"**WR: 20.0%%**")
+        st.image(assets.player_photo("Karss"), width=250)
+        st.metric(f"Games Won as EXP (from {game_count(karss_exp['Games'])} games)", f"{game_count(karss_exp['Games Won'])} Game")
+        st.write(f"**WR: {karss_exp['Win Rate%']:.1f}%** ({role_win_interval(karss_exp)})")
         st.write(f"**KDA Ratio:** {karss_stats['KDA Ratio']:.2f} (all role)")
+        st.caption(confidence.describe(navi_ci.loc['Karss'], 'KDA Ratio'))
         st.write(f"**Avg Deaths:** {karss_stats['Average Deaths']:.2f}")
 
     with col2:
         st.subheader("bq syaii")
-        st.image("images/bq syaii.png", width=250)
-        st.metric("Games Won as EXP (from 16 games)", f"{bq_syaii_matches['Score_NAVI'].sum()} Game")
-        st.write(f"**WR: 12.5%**")
+        st.image(assets.player_photo("bq syaii"), width=250)
+        st.metric(f"Games Won as EXP (from {game_count(bq_syaii_exp['Games'])} games)", f"{game_count(bq_syaii_exp['Games Won'])} Game")
+        st.write(f"**WR: {bq_syaii_exp['Win Rate%']:.1f}%** ({role_win_interval(bq_syaii_exp)})")
         st.write(f"**KDA Ratio:** {bq_syaii_stats['KDA Ratio']:.2f}")
+        st.caption(confidence.describe(navi_ci.loc['bq syaii'], 'KDA Ratio'))
         st.write(f"**Avg Deaths:** {bq_syaii_stats['Average Deaths']:.2f}")
 
     with col3:
         st.subheader("Febbb")
-        st.image("images/Febbb.png", width=250)
-        st.metric("Games Won as EXP (from 7 games)", f"{febbb_matches['Score_NAVI'].sum()} Game")
-        st.write(f"**WR: 14.3%**")
+        st.image(assets.player_photo("Febbb"), width=250)
+        st.metric(f"Games Won as EXP (from {game_count(febbb_exp['Games'])} games)", f"{game_count(febbb_exp['Games Won'])} Game")
+        st.write(f"**WR: {febbb_exp['Win Rate%']:.1f}%** ({role_win_interval(febbb_exp)})")
         st.write(f"**KDA Ratio:** {febbb_stats['KDA Ratio']:.2f}")
+        st.caption(confidence.describe(navi_ci.loc['Febbb'], 'KDA Ratio'))
         st.write(f"**Avg Deaths:** {febbb_stats['Average Deaths']:.2f}")
 
     with st.expander("Lihat Analisis EXP Laner"):
@@ -546,28 +508,30 @@ if page == "Analisis Pemain [NAVI]":
     st.header("Analisis Roamer")
 
     # Data Prep
-    hanafi_stats = navi_player_stats[navi_player_stats['Player'] == 'Hanafi'].iloc[0]
+    hanafi_stats = navi_player_stats.loc['Hanafi']
     # Karss stats sudah di-load sebelumnya
 
-    hanafi_roam_matches = navi_match_history[navi_match_history['Player_Roam'].str.contains('Hanafi')]
-    karss_roam_matches = navi_match_history[navi_match_history['Player_Roam'].str.contains('Karss')]
+    hanafi_roam = role_row(role_stats, 'Hanafi', 'Roam')
+    karss_roam = role_row(role_stats, 'Karss', 'Roam')
 
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("Hanafi")
-        st.image("images/Hanafi.png", width=250)
-        st.metric("Games Won as Roamer (from 15 games)", f"{hanafi_roam_matches['Score_NAVI'].sum()} Game")
-        st.write(f"**WR: 20.0%**")
+        st.image(assets.player_photo("Hanafi"), width=250)
+        st.metric(f"Games Won as Roamer (from {game_count(hanafi_roam['Games'])} games)", f"{game_count(hanafi_roam['Games Won'])} Game")
+        st.write(f"**WR: {hanafi_roam['Win Rate%']:.1f}%** ({role_win_interval(hanafi_roam)})")
         st.write(f"**KDA Ratio:** {hanafi_stats['KDA Ratio']:.2f}")
+        st.caption(confidence.describe(navi_ci.loc['Hanafi'], 'KDA Ratio'))
         st.write(f"**Average Assists:** {hanafi_stats['Average Assists']:.2f}")
         st.write(f"**Control time per game/s:** {hanafi_stats['Control time per game/s']:.2f}s")
 
     with col2:
         st.subheader("Karss")
-        st.image("images/Karss.png", width=250)
-        st.metric("Games Won as Roamer (from 23 games)", f"{karss_roam_matches['Score_NAVI'].sum()} Game")
-        st.write(f"**WR: 13.0%**")
+        st.image(assets.player_photo("Karss"), width=250)
+        st.metric(f"Games Won as Roamer (from {game_count(karss_roam['Games'])} games)", f"{game_count(karss_roam['Games Won'])} Game")
+        st.write(f"**WR: {karss_roam['Win Rate%']:.1f}%** ({role_win_interval(karss_roam)})")
         st.write(f"**KDA Ratio:** {karss_stats['KDA Ratio']:.2f}  (all role)")
+        st.caption(confidence.describe(navi_ci.loc['Karss'], 'KDA Ratio'))
         st.write(f"**Average Assists:** {karss_stats['Average Assists']:.2f}")
         st.write(f"**Control time per game/s:** {karss_stats['Control time per game/s']:.2f}s")
 
@@ -608,13 +572,68 @@ if page == "Analisis Pemain [NAVI]":
         """
     )
 
+
 # ==============================================================================
 # --- Halaman 4: Analisis Hero ---
 # ==============================================================================
 
-if page == "Analisis Hero":
-    meta_hero_stats = hero_stats.copy()
-    meta_hero_stats['Contest Count'] = meta_hero_stats['Pick'] + meta_hero_stats['Ban']
+@st.fragment
+def draft_assistant(model):
+    import comparison
+    import draft
+
+    # Fragment: perubahan pick/ban hanya menjalankan ulang bagian ini, bukan seluruh halaman
+    teams = model.teams
+    col1, col2 = st.columns(2)
+    team = col1.selectbox("Tim", teams, index=teams.index('NAVI') if 'NAVI' in teams else 0, key='draft_team')
+    opponents = [t for t in teams if t != team]
+    if not opponents:
+        st.warning("Butuh minimal dua tim dengan data hero.")
+        return
+    opponent = col2.selectbox("Lawan", opponents,
+                              index=opponents.index('ONIC ID') if 'ONIC ID' in opponents else 0, key='draft_opponent')
+
+    heroes = sorted(model.heroes)
+    bans = st.multiselect("Hero yang sudah di-ban", heroes, key='draft_bans')
+    col1, col2 = st.columns(2)
+    picks = col1.multiselect(f"Pick {comparison.short_name(team)}", heroes, key='draft_picks')
+    enemy_picks = col2.multiselect(f"Pick {comparison.short_name(opponent)}", heroes, key='draft_enemy_picks')
+
+    with st.expander("Bobot skor"):
+        weights = {name: st.slider(label, 0.0, 1.0, draft.DEFAULT_WEIGHTS[name], 0.05, key=f'draft_w_{name}')
+                   for name, label in draft.COMPONENT_LABELS.items()}
+
+    start = time.perf_counter()
+    unavailable = set(bans) | set(picks) | set(enemy_picks)
+    pick_df = model.recommend(team, opponent, unavailable, weights=weights)
+    ban_df = model.recommend_bans(team, opponent, unavailable, weights=weights)
+    elapsed = time.perf_counter() - start
+
+    column_config = {name: st.column_config.NumberColumn(label, format="%.3f")
+                     for name, label in draft.COMPONENT_LABELS.items()}
+    column_config['Skor'] = st.column_config.NumberColumn("Skor", format="%.3f")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader(f"Rekomendasi Pick {comparison.short_name(team)}")
+        st.dataframe(pick_df, column_config=column_config)
+    with col2:
+        st.subheader("Rekomendasi Ban")
+        st.caption(f"Hero terkuat untuk {comparison.short_name(opponent)} yang masih tersedia.")
+        st.dataframe(ban_df, column_config=column_config)
+    st.caption(f"Dihitung dalam {elapsed * 1000:.1f} ms")
+
+
+def page_hero_analysis(state):
+    import charts
+    import confidence
+    import data_store
+    import draft
+    import figure_cache
+
+    navi_hero_stats = state.navi_hero_stats
+    onic_hero_stats = state.onic_hero_stats
+    meta_hero_stats = state.meta_hero_stats
+    meta_version = data_store.dataset_version('hero_stats')
 
     st.title("Analisis Hero")
     st.markdown(
@@ -629,21 +648,16 @@ if page == "Analisis Hero":
     col1, col2 = st.columns(2)
     with col1:
         # Top 10 Paling Diperebutkan berdasarkan jumlah absolut Pick + Ban
-        top_contested = meta_hero_stats.nlargest(10, 'Contest Count')
-        fig = px.bar(top_contested, x='Contest Count', y='Hero', orientation='h',
-                     title='Top 10 Hero Paling Diperebutkan (Total Pick+Ban)',
-                     text_auto=True, color='Contest Count', color_continuous_scale='Reds')
-        fig.update_layout(yaxis={'categoryorder': 'total ascending'}, xaxis_title="Total Pick + Ban")
-        st.plotly_chart(fig, use_container_width=True)
+        fig = figure_cache.get_figure('Analisis Hero', 'top_contested', meta_version,
+                                      lambda: charts.top_contested_bar(meta_hero_stats))
+        instrumentation.plotly_chart(fig)
     with col2:
         # Top 10 Win Rate Tertinggi (dengan minimal pick yang relevan)
         min_picks = 20  # Filter untuk hero yang cukup sering muncul agar WR relevan
-        top_winrate = meta_hero_stats[meta_hero_stats['Pick'] > min_picks].nlargest(10, 'Win Rate%')
-        fig = px.bar(top_winrate, x='Win Rate%', y='Hero', orientation='h',
-                     title=f'Top 10 Hero Win Rate Tertinggi (Min. {min_picks} Picks)',
-                     text_auto='.2f', color='Win Rate%', color_continuous_scale='Greens')
-        fig.update_layout(yaxis={'categoryorder': 'total ascending'})
-        st.plotly_chart(fig, use_container_width=True)
+        fig = figure_cache.get_figure('Analisis Hero', 'top_winrate', meta_version,
+                                      lambda: charts.top_winrate_bar(meta_hero_stats, min_picks=min_picks),
+                                      min_picks=min_picks)
+        instrumentation.plotly_chart(fig)
 
     st.info(
         """
@@ -659,45 +673,23 @@ if page == "Analisis Hero":
         "Membandingkan frekuensi pick hero oleh tim dengan popularitas hero tersebut di MPL (Total Pick+Ban). **Ukuran gelembung menunjukkan Win Rate tim dengan hero tersebut.**")
 
     # Menggabungkan data tim dengan data meta
-    onic_merged = pd.merge(onic_hero_stats, meta_hero_stats[['Hero', 'Contest Count']], on='Hero', how='left')
-    navi_merged = pd.merge(navi_hero_stats, meta_hero_stats[['Hero', 'Contest Count']], on='Hero', how='left')
+    onic_merged = onic_hero_stats.join(meta_hero_stats['Contest Count'])
+    navi_merged = navi_hero_stats.join(meta_hero_stats['Contest Count'])
 
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("Prioritas Pick ONIC")
-        onic_top_picks = onic_merged.nlargest(10, 'Pick Count')
-        fig = px.scatter(onic_top_picks, x='Pick Count', y='Contest Count',
-                         size='Game Win Rate%', color='Hero',
-                         title='Pick ONIC vs. Popularitas Meta',
-                         hover_name='Hero', size_max=40,
-                         labels={'Pick Count': 'Jumlah Pick oleh ONIC',
-                                 'Contest Count': 'Popularitas di MPL (Total Pick+Ban)'})
-        st.plotly_chart(fig, use_container_width=True)
+        fig = figure_cache.get_figure('Analisis Hero', 'pick_priority',
+                                      data_store.data_version('hero_stats', 'onic_hero_stats'),
+                                      lambda: charts.pick_priority_bubble(onic_merged, 'ONIC'), team='ONIC ID')
+        instrumentation.plotly_chart(fig)
 
     with col2:
         st.subheader("Prioritas Pick NAVI")
-        navi_top_picks = navi_merged.nlargest(10,
-                                              'Pick Count').copy()
-
-        navi_top_picks['Bubble Size'] = navi_top_picks['Game Win Rate%']
-        navi_top_picks.loc[navi_top_picks['Bubble Size'] == 0, 'Bubble Size'] = 1
-
-        fig = px.scatter(navi_top_picks, x='Pick Count', y='Contest Count',
-                         size='Bubble Size',
-                         color='Hero',
-                         title='Pick NAVI vs. Popularitas Meta',
-                         hover_name='Hero',
-
-                         hover_data={
-                             'Bubble Size': False,
-                             'Game Win Rate%': True
-                         },
-                         size_max=40,
-                         labels={'Pick Count': 'Jumlah Pick oleh NAVI',
-                                 'Contest Count': 'Popularitas di MPL (Total Pick+Ban)'})
-        # ==========================================================
-
-        st.plotly_chart(fig, use_container_width=True)
+        fig = figure_cache.get_figure('Analisis Hero', 'pick_priority',
+                                      data_store.data_version('hero_stats', 'navi_hero_stats'),
+                                      lambda: charts.pick_priority_bubble(navi_merged, 'NAVI'), team='NAVI')
+        instrumentation.plotly_chart(fig)
 
     with st.expander("Lihat Analisis Prioritas Pick"):
         st.write("""
@@ -714,24 +706,32 @@ if page == "Analisis Hero":
     hero_onic = 'Badang'
     hero_navi = 'Kalea'
 
-    onic_hero_perf = onic_merged[onic_merged['Hero'] == hero_onic].iloc[0]
-    meta_hero_perf_onic = meta_hero_stats[meta_hero_stats['Hero'] == hero_onic].iloc[0]
+    onic_hero_perf = onic_merged.loc[hero_onic]
+    meta_hero_perf_onic = meta_hero_stats.loc[hero_onic]
+
+    navi_hero_perf = navi_merged.loc[hero_navi]
+    meta_hero_perf_navi = meta_hero_stats.loc[hero_navi]
 
-    navi_hero_perf = navi_merged[navi_merged['Hero'] == hero_navi].iloc[0]
-    meta_hero_perf_navi = meta_hero_stats[meta_hero_stats['Hero'] == hero_navi].iloc[0]
+    # Interval kepercayaan 95% (jumlah pick hero per tim kecil)
+    onic_hero_ci = confidence.team_intervals('ONIC ID', 'hero_stats').loc[hero_onic]
+    navi_hero_ci = confidence.team_intervals('NAVI', 'hero_stats').loc[hero_navi]
 
     col1, col2 = st.columns(2)
     with col1:
         st.subheader(f"{hero_onic} ONIC")
         st.metric(f"Win Rate {hero_onic} ONIC", f"{onic_hero_perf['Game Win Rate%']:.1f}%",
                   f"{onic_hero_perf['Game Win Rate%'] - meta_hero_perf_onic['Win Rate%']:.1f}% vs Avg MPL")
+        st.caption(confidence.describe(onic_hero_ci, 'Game Win Rate%', '.1f', '%'))
         st.metric(f"KDA {hero_onic} ONIC", f"{onic_hero_perf['KDA']:.2f}")
+        st.caption(confidence.describe(onic_hero_ci, 'KDA'))
 
     with col2:
         st.subheader(f"{hero_navi} NAVI")
         st.metric(f"Win Rate {hero_navi} NAVI", f"{navi_hero_perf['Game Win Rate%']:.1f}%",
                   f"{navi_hero_perf['Game Win Rate%'] - meta_hero_perf_navi['Win Rate%']:.1f}% vs Avg MPL")
+        st.caption(confidence.describe(navi_hero_ci, 'Game Win Rate%', '.1f', '%'))
         st.metric(f"KDA {hero_navi} NAVI", f"{navi_hero_perf['KDA']:.2f}")
+        st.caption(confidence.describe(navi_hero_ci, 'KDA'))
 
     with st.expander("Lihat Analisis Efektivitas"):
         st.write(f"""
@@ -750,11 +750,20 @@ if page == "Analisis Hero":
         """
     )
 
+    st.subheader("Asisten Draft")
+    st.markdown(
+        "Masukkan hero yang sudah di-ban dan di-pick; hero yang tersisa diurutkan berdasarkan win rate meta, "
+        "comfort tim (jumlah pick & win rate), kecenderungan lawan mem-ban hero tersebut, dan comfort lawan.")
+    draft_assistant(draft.draft_model())
+
+
 # ==============================================================================
 # --- Halaman 5: Rekomendasi Strategis ---
 # ==============================================================================
 
-if page == "Rekomendasi Strategis":
+def page_strategy(state):
+    navi_player_stats = state.navi_player_stats
+
     st.title("Rekomendasi Strategis")
     st.markdown("---")
 
@@ -766,7 +775,7 @@ if page == "Rekomendasi Strategis":
     )
     # Visualisasi data Xyve
     col1, col2, col3, col4 = st.columns(4)
-    xyve_stats = navi_player_stats[navi_player_stats['Player'] == 'Xyve'].iloc[0]
+    xyve_stats = navi_player_stats.loc['Xyve']
     col1.metric("KDA Ratio (Peringkat #1 di Tim)", f"{xyve_stats['KDA Ratio']:.2f}")
     col2.metric("Damage/Minute (Peringkat #1 di Tim)", f"{int(xyve_stats['Damage Per Minute'])}")
     col3.metric("Avg Kills/Game (Peringkat #1 di Tim)", f"{xyve_stats['Average Kills per game']:.2f}")
@@ -795,7 +804,7 @@ if page == "Rekomendasi Strategis":
     )
     # Visualisasi perbandingan jungler
     col1, col2 = st.columns(2)
-    aether_stats = navi_player_stats[navi_player_stats['Player'] == 'Aether'].iloc[0]
+    aether_stats = navi_player_stats.loc['Aether']
     col1.metric("Games won by Aether", f"{aether_stats['Number of game wins']} Game", "2x Lebih Banyak")
     col2.metric("Damage Per Minute Aether", f"{int(aether_stats['Damage Per Minute'])}", "~24% Lebih Tinggi")
 
@@ -829,36 +838,93 @@ if page == "Rekomendasi Strategis":
         """
     )
 
+
 # ==============================================================================
-# --- Halaman 5: All Data ---
+# --- Halaman 6: All Data ---
 # ==============================================================================
 
-if page == "All Data":
+def all_data_table(name, df, file_stem):
+    import data_store
+    import export
+    import table_view
+
+    # Hanya halaman yang terlihat yang dikirim ke browser; download tetap berisi tabel lengkap
+    version = data_store.dataset_version(name)
+    report = data_store.validation_report(name)
+    if report and report['quarantined']:
+        st.warning(f"{report['quarantined']} dari {report['rows']} baris dikarantina karena gagal validasi "
+                   f"(lihat `python validation.py {name}`).")
+    table_view.paginated_table(name, df, version)
+    export.download_panel(('dataset', name), version, lambda: df, file_stem)
+
+
+def page_all_data(state):
     st.title("Bank Data")
 
     st.text("Semua data yang digunakan untuk analisis.")
 
     st.title("Team Statistics")
-    st.dataframe(team_stats)
+    all_data_table('team_stats', state.team_stats, 'team_statistics')
 
     st.title("Player NAVI Statistics")
-    st.dataframe(navi_player_stats)
+    all_data_table('navi_player_stats', state.navi_player_stats, 'player_navi_statistics')
 
     st.title("Player ONIC Statistics")
-    st.dataframe(onic_player_stats)
+    all_data_table('onic_player_stats', state.onic_player_stats, 'player_onic_statistics')
 
     st.title("NAVI Hero Statistics")
-    st.dataframe(navi_hero_stats)
+    all_data_table('navi_hero_stats', state.navi_hero_stats, 'navi_hero')
 
     st.title("ONIC ID Hero Statistics")
-    st.dataframe(onic_hero_stats)
+    all_data_table('onic_hero_stats', state.onic_hero_stats, 'onic_hero')
 
     st.title("All Teams Hero Statistics")
     st.text("Data from: https://id-mpl.com/statistics")
-    st.dataframe(hero_stats)
+    all_data_table('hero_stats', state.hero_stats, 'hero_pick_ban_winrate')
 
     st.title("NAVI Match History")
     st.text("Data from: ")
     st.text("https://liquipedia.net/mobilelegends/Natus_Vincere/Played_Matches")
     st.text("https://www.youtube.com/@MPLIndonesia")
-    st.dataframe(navi_match_history)
+    all_data_table('navi_match_history', state.navi_match_history, 'navi_match_history_s15')
+
+
+# --- MAIN APP LOGIC ---
+def main():
+    # Sidebar digambar lebih dulu: navigasi sudah tampil sebelum modul analisis dan data dimuat
+    st.sidebar.title("Navigasi Analisis")
+    page_options = {
+        "Ringkasan Tim": page_team_summary,
+        "Analisis Pemain [vs ONIC]": page_player_vs_onic,
+        "Analisis Pemain [NAVI]": page_navi_players,
+        "Analisis Hero": page_hero_analysis,
+        "Rekomendasi Strategis": page_strategy,
+        "All Data": page_all_data,
+    }
+    page = st.sidebar.radio("Pilih Halaman", list(page_options.keys()))
+
+    import validation
+    import watcher
+    from app_state import get_app_state
+
+    # Watcher file data (sekali per proses): dataset yang berubah dimuat ulang di background
+    watcher.start()
+
+    state = get_app_state()
+
+    # Profiling opsional (MLBB_PROFILE=1 atau ?profile=1)
+    with instrumentation.rerun("Main-challange.py", instrumentation.streamlit_enabled()) as profile:
+        # Setiap halaman hanya mengambil tabel yang dibutuhkan dari state
+        with instrumentation.span('page', page):
+            try:
+                page_options[page](state)
+            except validation.ValidationError as e:
+                # File sumber ditolak saat ingest: tampilkan alasannya daripada grafik dari data rusak
+                st.error(f"Data tidak valid: {e}")
+
+    if profile is not None:
+        instrumentation.render_panel(profile)
+
+
+if __name__ == "__main__":
+    main()
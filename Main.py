@@ -1,7 +1,11 @@
+import time
+
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
+
+import instrumentation
+
+# Modul analisis (pandas, plotly, pyarrow, ...) di-import di dalam fungsi halaman yang memakainya:
+# cold start hanya memuat modul halaman yang dibuka, dan sidebar tampil sebelum data dimuat
 
 # --- KONFIGURASI HALAMAN ---
 # Mengatur konfigurasi halaman sebagai perintah pertama
@@ -9,41 +13,44 @@ st.set_page_config(layout="wide", page_title="Analisis Jungler MLBB")
 
 
 # --- PEMUATAN & PEMROSESAN DATA (DENGAN CACHING) ---
-@st.cache_data
 def load_data():
     """
-    Memuat, memproses, dan menambahkan kolom metrik baru.
-    Fungsi ini di-cache untuk meningkatkan performa aplikasi.
+    Memuat data jungler beserta kolom metrik baru dari `data_store`.
+    Hasilnya di-cache sekali per proses dan dipakai bersama oleh semua sesi.
+    Hero pool baru dimuat oleh halaman yang memakainya; di sini hanya dicek keberadaannya.
     """
+    import data_store
+    import validation
+
     try:
-        stats_df = pd.read_csv('data_jungler/statistics.csv')
-        hero_pool_df = pd.read_csv('data_jungler/hero_pool.csv')
+        stats_df = data_store.load_jungler_stats()
+        if not data_store.has_dataset('jungler_hero_pool'):
+            raise FileNotFoundError('hero_pool.csv')
     except FileNotFoundError:
         st.error("Pastikan file 'statistics.csv' dan 'hero_pool.csv' ada.")
-        return None, None
-
-    # Filter data yang valid
-    stats_df = stats_df[stats_df['Games Played'] > 0].reset_index(drop=True)
-
-    # --- Feature Engineering ---
-    stats_df['Turtles per Game'] = stats_df['Cryoturtle Secured'] / stats_df['Games Played']
-    stats_df['Lords per Game'] = stats_df['Lord Secured'] / stats_df['Games Played']
-    stats_df['Towers per Game'] = stats_df['Towers Secured'] / stats_df['Games Played']
-    stats_df['First Blood Rate'] = stats_df['First Blood'] / stats_df['Games Played']
-    stats_df.replace([np.inf, -np.inf], 0, inplace=True)
+        return None
+    except validation.ValidationError as e:
+        st.error(f"Data tidak valid: {e}")
+        return None
 
-    return stats_df, hero_pool_df
+    return stats_df
 
 
-# --- FUNGSI UNTUK KONVERSI KE CSV ---
-@st.cache_data
-def convert_df_to_csv(df):
-    # Penting: Gunakan to_csv untuk mengonversi DataFrame ke CSV string
-    return df.to_csv(index=False).encode('utf-8')
+# --- BADGE PERINGKAT LIGA ---
+def league_badge(container, top_pct, metric):
+    # Badge "Top X%" diambil dari tabel peringkat liga yang sudah di-cache
+    pct = top_pct[metric]
+    color = 'green' if pct <= 25 else 'orange' if pct <= 50 else 'gray'
+    container.badge(f"Top {pct:.0f}%", color=color)
 
 
 # --- HALAMAN 1: ANALISIS DETAIL PEMAIN ---
-def page_player_analysis(stats_df, hero_pool_df):
+def page_player_analysis(stats_df):
+    import analytics
+    import confidence
+    import data_store
+    import export
+
     st.title("📊 Stats Jungler MLBB")
 
     # Pemilihan Pemain
@@ -51,9 +58,13 @@ def page_player_analysis(stats_df, hero_pool_df):
     selected_player = st.selectbox("Pilih Jungler:", player_list)
 
     # Filter data untuk pemain terpilih
-    player_stats = stats_df[stats_df['Player'] == selected_player].iloc[0]
-    player_hero_pool = hero_pool_df[hero_pool_df['Player ID'] == player_stats['ID']]
-    league_avg = stats_df.mean(numeric_only=True)
+    player_stats = stats_df.loc[selected_player]
+    # Interval kepercayaan 95% (sampel kecil) dihitung sekali per versi data
+    player_ci = confidence.with_intervals('jungler_stats').loc[selected_player]
+    player_hero_pool = data_store.lookup_rows(confidence.with_intervals('jungler_hero_pool'), player_stats['ID'])
+    league_summary, _, league_top_pct = analytics.jungler_league_table()
+    league_avg = league_summary['mean']
+    player_top_pct = league_top_pct.loc[selected_player]
 
     st.header(f"Stats: {selected_player}")
 
@@ -65,9 +76,12 @@ def page_player_analysis(stats_df, hero_pool_df):
         st.metric(label="Games Played", value=int(player_stats['Games Played']))
     with col3:
         st.metric(label="Games Win Ratio", value=f"{player_stats['Games Win Ratio%']:.2f}%")
+        st.caption(confidence.describe(player_ci, 'Games Win Ratio%', '.1f', '%'))
     with col4:
         st.metric(label="KDA Ratio", value=f"{player_stats['KDA Ratio']:.2f}",
                   delta=f"{(player_stats['KDA Ratio'] - league_avg['KDA Ratio']):.2f} vs Avg")
+        league_badge(st, player_top_pct, 'KDA Ratio')
+        st.caption(confidence.describe(player_ci, 'KDA Ratio'))
     st.markdown("---")
     cat1, cat2 = st.columns(2)
     with cat1:
@@ -75,19 +89,27 @@ def page_player_analysis(stats_df, hero_pool_df):
         obj_col1, obj_col2, obj_col3 = st.columns(3)
         obj_col1.metric("Turtles per Game", f"{player_stats['Turtles per Game']:.2f}",
                         f"{(player_stats['Turtles per Game'] - league_avg['Turtles per Game']):.2f}")
+        league_badge(obj_col1, player_top_pct, 'Turtles per Game')
         obj_col2.metric("Lords per Game", f"{player_stats['Lords per Game']:.2f}",
                         f"{(player_stats['Lords per Game'] - league_avg['Lords per Game']):.2f}")
+        league_badge(obj_col2, player_top_pct, 'Lords per Game')
         obj_col3.metric("Towers per Game", f"{player_stats['Towers per Game']:.2f}",
                         f"{(player_stats['Towers per Game'] - league_avg['Towers per Game']):.2f}")
+        league_badge(obj_col3, player_top_pct, 'Towers per Game')
     with cat2:
         st.subheader("2. Farming & Leveling")
         farm_col1, farm_col2, farm_col3 = st.columns(3)
         farm_col1.metric("Gold Per Minute (GPM)", f"{player_stats['Gold Per Minute']:.2f}",
                          f"{(player_stats['Gold Per Minute'] - league_avg['Gold Per Minute']):.2f}")
+        league_badge(farm_col1, player_top_pct, 'Gold Per Minute')
+        farm_col1.caption(confidence.describe(player_ci, 'Gold Per Minute', '.0f'))
         farm_col2.metric("EXP Per Minute (XPM)", f"{player_stats['Exp Per Minute']:.2f}",
                          f"{(player_stats['Exp Per Minute'] - league_avg['Exp Per Minute']):.2f}")
+        league_badge(farm_col2, player_top_pct, 'Exp Per Minute')
+        farm_col2.caption(confidence.describe(player_ci, 'Exp Per Minute', '.0f'))
         farm_col3.metric("Gold Share %", f"{player_stats['Gold Share%']:.2f}%",
                          f"{(player_stats['Gold Share%'] - league_avg['Gold Share%']):.2f}%")
+        league_badge(farm_col3, player_top_pct, 'Gold Share%')
     st.markdown("---")
     cat3, cat4 = st.columns(2)
     with cat3:
@@ -98,69 +120,60 @@ def page_player_analysis(stats_df, hero_pool_df):
         kda_col3.metric("Avg Assists", f"{player_stats['Average Assists']:.2f}")
         st.metric("Kill Participation %", f"{player_stats['Kill Participation%']:.2f}%",
                   f"{(player_stats['Kill Participation%'] - league_avg['Kill Participation%']):.2f}%")
+        league_badge(st, player_top_pct, 'Kill Participation%')
     with cat4:
         st.subheader("4. Output & Efisiensi Damage")
         dmg_col1, dmg_col2, dmg_col3 = st.columns(3)
         dmg_col1.metric("Damage Per Minute", f"{player_stats['Damage Per Minute']:.2f}",
                         f"{(player_stats['Damage Per Minute'] - league_avg['Damage Per Minute']):.2f}")
+        league_badge(dmg_col1, player_top_pct, 'Damage Per Minute')
+        dmg_col1.caption(confidence.describe(player_ci, 'Damage Per Minute', '.0f'))
         dmg_col2.metric("Damage Share %", f"{player_stats['Damage Share%']:.2f}%",
                         f"{(player_stats['Damage Share%'] - league_avg['Damage Share%']):.2f}%")
+        league_badge(dmg_col2, player_top_pct, 'Damage Share%')
         dmg_col3.metric("Damage/Gold %", f"{player_stats['Damage/Gold%']:.2f}%",
                         f"{(player_stats['Damage/Gold%'] - league_avg['Damage/Gold%']):.2f}%")
+        league_badge(dmg_col3, player_top_pct, 'Damage/Gold%')
     st.markdown("---")
 
     # Analisis Hero Pool
     st.header("Hero Pool")
     if not player_hero_pool.empty:
-        hero_pool_display = player_hero_pool[['Hero', 'Game Count', 'Game Win Rate%', 'KDA']].sort_values(
+        ci_cols = [confidence.low_col('Game Win Rate%'), confidence.high_col('Game Win Rate%'),
+                   confidence.low_col('KDA'), confidence.high_col('KDA')]
+        hero_pool_display = player_hero_pool[['Hero', 'Game Count', 'Game Win Rate%', 'KDA'] + ci_cols].sort_values(
             by="Game Count", ascending=False).reset_index(drop=True)
-        st.dataframe(hero_pool_display, use_container_width=True)
+        st.dataframe(hero_pool_display, use_container_width=True,
+                     column_config={col: st.column_config.NumberColumn(format="%.2f") for col in ci_cols})
+        st.caption("CI = interval kepercayaan 95% (Wilson untuk win rate, bootstrap untuk KDA).")
+        export.download_panel(('jungler_hero_pool', player_stats['ID']),
+                              data_store.dataset_version('jungler_hero_pool'),
+                              lambda: hero_pool_display, f"hero_pool_{player_stats['ID']}")
     else:
         st.write("Data hero pool tidak ditemukan untuk pemain ini.")
 
 
 # --- FUNGSI HALAMAN 2: TABEL STATISTIK KESELURUHAN ---
 def page_summary_table(stats_df):
-    st.title("📋 All Stats + Conclusion")
-
-    # Pilih dan ganti nama kolom
-    summary_cols = {
-        'Player': 'Player',
-        'Games Played': 'Total Game (Experience)',
-        'Games Win Ratio%': 'Win Rate %',
-        'KDA Ratio': 'KDA',
-        'Average Kills per game': 'Avg Kills',
-        'Average Deaths': 'Avg Deaths',
-        'Average Assists': 'Avg Assists',
-        'Gold Per Minute': 'GPM',
-        'Damage Per Minute': 'DPM',
-        'Kill Participation%': 'KP %',
-        'Turtles per Game': 'Turtle/Game',
-        'Lords per Game': 'Lord/Game'
-    }
-
-    # Buat dua salinan: satu untuk tampilan (string) dan satu untuk visualisasi (numeric)
-    summary_display_df = stats_df[list(summary_cols.keys())].copy()
-    summary_display_df.rename(columns=summary_cols, inplace=True)
+    import analytics
+    import charts
+    import data_store
+    import export
+    import figure_cache
 
-    summary_viz_df = summary_display_df.copy()  # Salinan ini tetap numeric
+    st.title("📋 All Stats + Conclusion")
 
-    # Format angka untuk tampilan tabel
-    for col in summary_display_df.columns:
-        if pd.api.types.is_numeric_dtype(summary_display_df[col]) and col != 'Total Game':
-            summary_display_df[col] = summary_display_df[col].apply(lambda x: f'{x:.2f}')
+    # Tabel ringkasan + matriks heatmap dihitung sekali per versi data
+    summary_df, heatmap_values, heatmap_normalized = analytics.jungler_summary_heatmap()
+    metric_cols = summary_df.columns.drop('Player')
 
-    # Download CSV
-    csv_data = convert_df_to_csv(summary_display_df)  # Gunakan df yang sudah diformat
-    st.download_button(
-        label="📥 Download CSV",
-        data=csv_data,
-        file_name='summary_stats_jungler.csv',
-        mime='text/csv',
-    )
+    # Download (CSV/Parquet/Excel), file di-cache per versi data
+    export.download_panel(('jungler_summary',), data_store.dataset_version('jungler_stats'),
+                          lambda: summary_df, 'summary_stats_jungler', float_format='%.2f')
 
-    # Tampilkan DataFrame
-    st.dataframe(summary_display_df, use_container_width=True)
+    # Tampilkan DataFrame (format 2 desimal lewat column_config, data tetap numeric)
+    st.dataframe(summary_df, use_container_width=True, hide_index=True,
+                 column_config={col: st.column_config.NumberColumn(format="%.2f") for col in metric_cols})
 
     st.markdown("---")
 
@@ -173,44 +186,11 @@ def page_summary_table(stats_df):
         "Warna hijau menandakan rank atas, dan warna merah menandakan rank bawah."
     )
 
-    # 1. Siapkan DataFrame asli untuk TEKS yang akan ditampilkan
-    heatmap_text_df = summary_viz_df.set_index('Player')
-
-    # 2. Buat salinan terpisah yang nilainya akan diubah untuk PEWARNAAN
-    heatmap_color_df = heatmap_text_df.copy()
-
-    # 3. Balik logika 'Avg Deaths' HANYA untuk DataFrame pewarnaan
-    if 'Avg Deaths' in heatmap_color_df.columns:
-        max_deaths = heatmap_color_df['Avg Deaths'].max()
-        heatmap_color_df['Avg Deaths'] = max_deaths - heatmap_color_df['Avg Deaths']
-
-    # 4. Normalisasi DataFrame pewarnaan agar skala warna benar
-    normalized_color_df = heatmap_color_df.apply(lambda x: (x - x.min()) / (x.max() - x.min()))
-
-    # 5. Buat heatmap menggunakan data normalisasi untuk WARNA
-    fig = px.imshow(
-        normalized_color_df,
-        text_auto=False,
-        aspect="auto",
-        color_continuous_scale='RdYlGn',
-        labels=dict(color="Relative Ranking"),
-        x=heatmap_text_df.columns,
-        y=heatmap_text_df.index
-    )
-
-    fig.update_traces(
-        text=heatmap_text_df,  # Gunakan DataFrame asli untuk teks
-        texttemplate="%{text:.2f}"  # Format teks dengan 2 angka desimal
-    )
-
-    fig.update_layout(
-        title_text='Perbandingan Statistik Antar Pemain',
-        title_x=0.5,
-        xaxis_title="Stats",
-        yaxis_title="Jungler"
-    )
-
-    st.plotly_chart(fig, use_container_width=True)
+    # Warna dari matriks normalisasi ('Avg Deaths' sudah dibalik), teks dari nilai asli
+    fig = figure_cache.get_figure('All Stats + Conclusion', 'jungler_heatmap',
+                                  data_store.dataset_version('jungler_stats'),
+                                  lambda: charts.jungler_heatmap(summary_df, heatmap_values, heatmap_normalized))
+    instrumentation.plotly_chart(fig)
 
     st.markdown("---")
 
@@ -261,22 +241,95 @@ def page_summary_table(stats_df):
     ---
     """)
 
+# --- HALAMAN 3: CARI PEMAIN SERUPA ---
+def page_similar_players():
+    import similarity
+
+    st.title("🔎 Cari Pemain Serupa")
+    st.markdown(
+        "Mencari pemain dengan gaya bermain paling mirip (metrik per game, per menit, dan share) "
+        "dari semua tim, musim, dan data jungler liga, untuk scouting pengganti.")
+    similar_players_search(similarity.player_index())
+
+
+@st.fragment
+def similar_players_search(index):
+    import similarity
+
+    # Fragment: mengganti pemain/filter hanya menjalankan ulang bagian ini
+    search = st.text_input("Cari nama pemain:", key='similar_search')
+    positions = index.search(search)
+    if len(positions) == 0:
+        st.warning("Pemain tidak ditemukan.")
+        return
+    position = st.selectbox("Pilih pemain:", positions, format_func=index.label, key='similar_player')
+    query = index.pool.iloc[position]
+
+    col1, col2, col3 = st.columns(3)
+    roles = ["Semua"] + similarity.ROLES
+    # Tanpa key agar default filter mengikuti role pemain yang dipilih
+    role = col1.selectbox("Filter role:", roles, index=roles.index(query['Role']))
+    k = col2.slider("Jumlah pemain:", 5, 50, 10, key='similar_k')
+    min_games = col3.number_input("Minimal game:", min_value=0, value=5, key='similar_min_games')
+
+    start = time.perf_counter()
+    result = index.similar(position, k, None if role == "Semua" else role, min_games)[0]
+    elapsed = time.perf_counter() - start
+
+    st.caption(f"Role {query['Role']} ({query['Role Source']}) · {query['Games Played']} game · "
+               f"WR {query['Games Win Ratio%']:.2f}%")
+    st.dataframe(result[['Similarity'] + similarity.POOL_COLUMNS], use_container_width=True, hide_index=True,
+                 column_config={'Similarity': st.column_config.ProgressColumn(
+                     "Kemiripan", format="%.3f", min_value=-1.0, max_value=1.0)})
+
+    with st.expander("Perbandingan metrik (5 teratas)"):
+        # Index pool = posisi baris, jadi index hasil bisa langsung dipakai sebagai posisi
+        rows = [position] + result.index[:5].tolist()
+        compared = index.pool.iloc[rows][similarity.FEATURES].T
+        compared.columns = [index.label(row) for row in rows]
+        st.dataframe(compared, use_container_width=True,
+                     column_config={col: st.column_config.NumberColumn(format="%.2f") for col in compared.columns})
+    st.caption(f"{len(index):,} player-season · dihitung dalam {elapsed * 1000:.1f} ms")
+
+
 # --- MAIN APP LOGIC ---
 def main():
-    stats_df, hero_pool_df = load_data()
-
-    if stats_df is not None and hero_pool_df is not None:
-        # Navigasi Sidebar
-        st.sidebar.title("Navigasi")
-        page_options = {
-            "All Stats + Conclusion": (page_summary_table, (stats_df,)),
-            "Detail Stats + Hero Pool": (page_player_analysis, (stats_df, hero_pool_df))
-        }
-        selected_page = st.sidebar.radio("Pilih Halaman:", list(page_options.keys()))
-
-        # Panggil fungsi halaman yang dipilih
-        page_function, args = page_options[selected_page]
-        page_function(*args)
+    # Navigasi Sidebar, digambar sebelum modul analisis dan data dimuat
+    st.sidebar.title("Navigasi")
+    page_options = {
+        "All Stats + Conclusion": (page_summary_table, True),
+        "Detail Stats + Hero Pool": (page_player_analysis, True),
+        "Cari Pemain Serupa": (page_similar_players, False),
+    }
+    selected_page = st.sidebar.radio("Pilih Halaman:", list(page_options.keys()))
+
+    import validation
+    import watcher
+
+    # Watcher file data (sekali per proses): dataset yang berubah dimuat ulang di background
+    watcher.start()
+
+    # Profiling opsional (MLBB_PROFILE=1 atau ?profile=1)
+    with instrumentation.rerun("Main.py", instrumentation.streamlit_enabled()) as profile:
+        # Halaman yang memakai statistik jungler menerimanya sebagai argumen; data dimuat saat dibutuhkan
+        page_function, needs_stats = page_options[selected_page]
+        args = ()
+        if needs_stats:
+            with instrumentation.span('load', 'load_data'):
+                stats_df = load_data()
+            args = (stats_df,)
+
+        if not needs_stats or stats_df is not None:
+            # Panggil fungsi halaman yang dipilih
+            with instrumentation.span('page', selected_page):
+                try:
+                    page_function(*args)
+                except validation.ValidationError as e:
+                    # Misal hero_pool.csv ditolak saat ingest
+                    st.error(f"Data tidak valid: {e}")
+
+    if profile is not None:
+        instrumentation.render_panel(profile)
 
 
 if __name__ == "__main__":
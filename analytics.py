@@ -0,0 +1,186 @@
+"""
+Tabel turunan (agregat liga, peringkat, dll.) yang dihitung sekali per versi data.
+
+Semua fungsi di sini memakai `data_store.get_or_build`, jadi halaman Streamlit
+cukup membaca hasilnya tanpa menghitung ulang setiap rerun.
+"""
+import numpy as np
+import pandas as pd
+
+import data_store
+
+# Metrik yang nilainya lebih baik jika lebih kecil (peringkat dibalik)
+LOWER_IS_BETTER = {
+    'Total Deaths', 'Average Deaths', 'Highest death in a single game',
+}
+
+LEAGUE_PERCENTILES = [0.25, 0.5, 0.75, 0.9]
+
+
+def _league_table(stats_df):
+    numeric_df = stats_df.select_dtypes('number')
+
+    summary = numeric_df.quantile(LEAGUE_PERCENTILES).T
+    summary.columns = [f'p{int(q * 100)}' for q in LEAGUE_PERCENTILES]
+    summary.insert(0, 'mean', numeric_df.mean())
+    summary.insert(1, 'median', summary.pop('p50'))
+
+    # Peringkat per metrik (1 = terbaik) dan posisi "Top X%" untuk badge di halaman pemain
+    ascending = numeric_df.columns.isin(LOWER_IS_BETTER)
+    higher = numeric_df.loc[:, ~ascending].rank(ascending=False, method='min')
+    lower = numeric_df.loc[:, ascending].rank(ascending=True, method='min')
+    ranks = higher.join(lower)[numeric_df.columns].astype('int32')
+    top_pct = ranks / len(numeric_df) * 100
+    return summary, ranks, top_pct
+
+
+def jungler_league_table():
+    """
+    Agregat liga untuk statistik jungler: (summary, ranks, top_pct).
+
+    - summary: index = metrik, kolom = mean, median, p25, p75, p90
+    - ranks:   index = pemain, kolom = metrik, 1 = terbaik
+    - top_pct: seperti ranks, dalam persen (Top X%)
+    """
+    return data_store.get_or_build(('derived', 'jungler_league_table'),
+                                   data_store.dataset_version('jungler_stats'),
+                                   lambda: _league_table(data_store.load_jungler_stats()))
+
+
+# --- META HERO ---
+def meta_hero_stats(season=None):
+    """Statistik pick/ban hero liga `season` + kolom 'Contest Count' (Pick + Ban)."""
+    def build():
+        meta_df = data_store.load_hero_stats(season).copy()
+        meta_df['Contest Count'] = meta_df['Pick'] + meta_df['Ban']
+        return meta_df
+
+    season = season or data_store.CURRENT_SEASON
+    return data_store.get_or_build(('derived', 'meta_hero_stats', season),
+                                   data_store.dataset_version('hero_stats', season), build)
+
+
+# --- TABEL RINGKASAN & HEATMAP JUNGLER ---
+JUNGLER_SUMMARY_COLUMNS = {
+    'Player': 'Player',
+    'Games Played': 'Total Game (Experience)',
+    'Games Win Ratio%': 'Win Rate %',
+    'KDA Ratio': 'KDA',
+    'Average Kills per game': 'Avg Kills',
+    'Average Deaths': 'Avg Deaths',
+    'Average Assists': 'Avg Assists',
+    'Gold Per Minute': 'GPM',
+    'Damage Per Minute': 'DPM',
+    'Kill Participation%': 'KP %',
+    'Turtles per Game': 'Turtle/Game',
+    'Lords per Game': 'Lord/Game'
+}
+
+# Kolom heatmap yang warnanya dibalik (nilai kecil = hijau)
+HEATMAP_INVERTED = {'Avg Deaths'}
+
+
+def normalize_columns(values, inverted=None):
+    """
+    Normalisasi min-max per kolom (0 = terburuk, 1 = terbaik) dalam satu operasi NumPy.
+    Kolom dengan nilai konstan diberi 0.5 agar tidak terjadi pembagian dengan nol.
+    """
+    low = np.nanmin(values, axis=0)
+    span = np.nanmax(values, axis=0) - low
+    normalized = np.divide(values - low, span, out=np.full(values.shape, 0.5), where=span > 0)
+    if inverted is not None:
+        normalized[:, inverted] = 1 - normalized[:, inverted]
+    return normalized
+
+
+def _summary_heatmap(stats_df):
+    summary_df = stats_df[list(JUNGLER_SUMMARY_COLUMNS)].rename(columns=JUNGLER_SUMMARY_COLUMNS)
+    metric_cols = summary_df.columns.drop('Player')
+    values = summary_df[metric_cols].to_numpy(dtype='float64')
+    normalized = normalize_columns(values, metric_cols.isin(HEATMAP_INVERTED))
+    return summary_df, values, normalized
+
+
+def jungler_summary_heatmap():
+    """
+    Tabel ringkasan jungler + matriks heatmap: (summary_df, values, normalized).
+    `values` dan `normalized` berurutan sesuai baris summary_df dan kolom selain 'Player'.
+    """
+    return data_store.get_or_build(('derived', 'jungler_summary_heatmap'),
+                                   data_store.dataset_version('jungler_stats'),
+                                   lambda: _summary_heatmap(data_store.load_jungler_stats()))
+
+
+# --- RIWAYAT MATCH FORMAT PANJANG ---
+# Kolom lineup di navi_match_history_s15.csv -> nama role
+LINEUP_ROLES = {
+    'Player_Mid': 'Mid',
+    'Player_Roam': 'Roam',
+    'Player_Gold': 'Gold',
+    'Player_Exp': 'Exp',
+    'Player_Jungler': 'Jungler',
+}
+
+
+def _match_games(history_df):
+    match_cols = ['Match', 'Opponent', 'Result', 'Score_NAVI', 'Score_Opponent', 'Game_Played']
+    long_df = history_df[match_cols + list(LINEUP_ROLES)].melt(
+        id_vars=match_cols, var_name='Role', value_name='Player')
+
+    # "Karss,Karss,Karss" -> satu baris per game, nomor game dari posisi di dalam string
+    long_df['Player'] = long_df['Player'].str.split(',')
+    long_df = long_df.explode('Player', ignore_index=True)
+    long_df['Game'] = long_df.groupby(['Match', 'Role'], sort=False).cumcount() + 1
+    long_df['Player'] = long_df['Player'].str.strip()
+    long_df = long_df[(long_df['Game'] <= long_df['Game_Played']) & (long_df['Player'] != '')]
+
+    long_df['Role'] = pd.Categorical(long_df['Role'].map(LINEUP_ROLES), categories=list(LINEUP_ROLES.values()))
+    long_df['Player'] = long_df['Player'].astype('category')
+    long_df['Game'] = long_df['Game'].astype('int8')
+    return long_df.sort_values(['Match', 'Game', 'Role'], ignore_index=True)[
+        ['Match', 'Game', 'Role', 'Player', 'Opponent', 'Result', 'Score_NAVI', 'Score_Opponent']]
+
+
+def match_games():
+    """
+    Riwayat match NAVI dalam format panjang: satu baris per (Match, Game, Role, Player).
+    Hasil game per baris mengikuti hasil match (Result / Score_NAVI), karena sumber
+    tidak mencatat pemenang tiap game.
+    """
+    return data_store.get_or_build(('derived', 'match_games'),
+                                   data_store.dataset_version('navi_match_history'),
+                                   lambda: _match_games(data_store.load_match_history()))
+
+
+def _player_role_stats(games_df):
+    # Satu baris per (Player, Role, Match): jumlah game yang dimainkan di match tsb + skor seri
+    per_match = games_df.groupby(['Player', 'Role', 'Match'], observed=True).agg(
+        Games=('Game', 'size'), Score_NAVI=('Score_NAVI', 'first'), Score_Opponent=('Score_Opponent', 'first'))
+
+    # Sumber tidak mencatat pemenang tiap game, jadi kemenangan pemain di satu match hanya diketahui
+    # dalam rentang [skor NAVI - game yang tidak dimainkan, min(skor NAVI, game dimainkan)]. Rentang
+    # satu titik (main semua game, atau semua game dimainkan menang/kalah) = jumlah pasti; selain itu
+    # (pemain pengganti di seri campuran) tidak diketahui dan tidak dikreditkan skor seri penuh.
+    sat_out = per_match['Score_NAVI'] + per_match['Score_Opponent'] - per_match['Games']
+    lower = (per_match['Score_NAVI'] - sat_out).clip(lower=0)
+    upper = np.minimum(per_match['Score_NAVI'], per_match['Games'])
+    per_match['Games Won'] = lower.where(lower == upper)
+
+    grouped = per_match.groupby(level=['Player', 'Role'], observed=True)
+    role_stats = grouped.agg(**{'Games': ('Games', 'sum'), 'Matches': ('Games', 'size')})
+    # Satu match tak pasti membuat total kemenangan (role) tersebut tidak terdefinisi (NaN)
+    role_stats['Games Won'] = grouped['Games Won'].sum().where(grouped['Games Won'].count() == role_stats['Matches'])
+    role_stats['Win Rate%'] = role_stats['Games Won'] / role_stats['Games'] * 100
+    return role_stats
+
+
+def player_role_stats():
+    """
+    Ringkasan per (Player, Role): Games, Matches, Games Won, Win Rate%.
+    Games Won / Win Rate% bernilai NaN jika pemain hanya memainkan sebagian game
+    di suatu seri dan hasil game-game tersebut tidak bisa dipastikan dari skor.
+    Diindex MultiIndex (Player, Role) sehingga bisa diambil dengan `.loc[(pemain, role)]`.
+    """
+    return data_store.get_or_build(('derived', 'player_role_stats'),
+                                   data_store.dataset_version('navi_match_history'),
+                                   lambda: _player_role_stats(match_games()))
@@ -0,0 +1,417 @@
+"""
+API JSON lokal (read-only) untuk angka di balik dashboard.
+
+Endpoint memakai pemuat dan tabel turunan yang sama dengan halaman Streamlit
+(`comparison`, `analytics`, `app_state`), jadi angkanya selalu sama dengan
+yang ditampilkan dashboard:
+
+    GET /api/teams?season=S15
+    GET /api/head-to-head?team_a=ONIC ID&team_b=NAVI&season=S15
+    GET /api/player-comparison?team_a=ONIC ID&player_a=Kairi&team_b=NAVI&player_b=Woshipaul&metric=KDA Ratio
+    GET /api/hero-contest?top=10
+    GET /api/jungler-league[?player=Woshipaul]
+
+Setiap respons diberi ETag dari (endpoint, parameter, versi data), sehingga
+`If-None-Match` yang cocok langsung dijawab 304 tanpa membangun body.
+Body JSON (dan versi gzip-nya) disimpan di LRU berbatas ukuran per versi
+data; data yang berubah otomatis menghasilkan ETag dan entri cache baru.
+
+    python api.py serve --port 8765
+    python api.py bench --requests 5000 --concurrency 8
+"""
+import argparse
+import gzip
+import hashlib
+import http.client
+import json
+import math
+import statistics
+import threading
+import time
+import traceback
+from collections import Counter
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import numpy as np
+
+import analytics
+import comparison
+import data_store
+import watcher
+from app_state import get_app_state
+from caching import BoundedLRU
+
+HOST = '127.0.0.1'
+PORT = 8765
+
+# Body lebih kecil dari ini tidak dikompresi (header gzip lebih besar dari penghematannya)
+GZIP_MIN_BYTES = 512
+
+# Batas total ukuran body (JSON + gzip) yang disimpan
+MAX_BYTES = 64 * 1024 * 1024
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# --- KONVERSI JSON ---
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} tidak bisa dijadikan JSON")
+
+
+def _clean(value):
+    # NaN/inf bukan JSON yang valid -> null
+    if isinstance(value, dict):
+        return {str(k): _clean(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_clean(v) for v in value]
+    if isinstance(value, (float, np.floating)) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _records(df):
+    return df.to_dict('records')
+
+
+def _param(params, name, default=None):
+    value = params.get(name, default)
+    if value is None:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"Parameter '{name}' wajib diisi")
+    return value
+
+
+def _season(params):
+    season = params.get('season', data_store.CURRENT_SEASON)
+    if season not in data_store.list_seasons():
+        raise ApiError(HTTPStatus.NOT_FOUND, f"Musim {season} tidak ada")
+    return season
+
+
+def _team(params, name, season):
+    # Dicek terhadap daftar tim musim itu sebelum dipakai sebagai nama file (team_code)
+    team = _param(params, name)
+    if team not in comparison.season_teams(season):
+        raise ApiError(HTTPStatus.NOT_FOUND, f"Tim {team} tidak ada di musim {season}")
+    return team
+
+
+# --- ENDPOINT ---
+# Setiap endpoint: version(params) -> versi data (murah, tanpa membangun body), build(params) -> objek JSON
+def _teams_version(params):
+    return data_store.dataset_version('team_stats', _season(params))
+
+
+def _teams(params):
+    return {'season': _season(params), 'teams': comparison.season_teams(_season(params))}
+
+
+def _head_to_head_version(params):
+    # team_matchup memakai tabel head-to-head semua musim
+    return '|'.join(data_store.dataset_version('team_stats', s) for s in data_store.list_seasons())
+
+
+def _head_to_head(params):
+    season = _season(params)
+    team_a, team_b = _team(params, 'team_a', season), _team(params, 'team_b', season)
+    if team_a == team_b:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "team_a dan team_b harus berbeda")
+    stats, deltas = comparison.team_matchup(team_a, team_b, season)
+    return {
+        'season': season,
+        'metrics': comparison.TEAM_METRICS,
+        'stats': {team: stats.loc[team, comparison.TEAM_METRICS].to_dict() for team in (team_a, team_b)},
+        # Selisih terhadap lawan: team_a - team_b dan team_b - team_a
+        'deltas': {team: deltas.loc[team].to_dict() for team in (team_a, team_b)},
+    }
+
+
+def _player_comparison_version(params):
+    season = _season(params)
+    codes = [data_store.team_code(_team(params, name, season)) for name in ('team_a', 'team_b')]
+    return '|'.join(data_store.dataset_version(f'{code}_player_stats', season) for code in codes)
+
+
+def _player_comparison(params):
+    # Nilai yang sama dengan bar chart `create_comparison_chart` di Main-challange.py
+    season, metric = _season(params), _param(params, 'metric')
+    players = []
+    for side in ('a', 'b'):
+        team, player = _team(params, f'team_{side}', season), _param(params, f'player_{side}')
+        try:
+            value = comparison.player_value(team, player, metric, season)
+        except KeyError:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Pemain {player} / metrik {metric} tidak ada untuk {team}")
+        players.append({'team': team, 'player': player, 'value': value})
+    return {'season': season, 'metric': metric, 'players': players}
+
+
+def _hero_contest_version(params):
+    return data_store.dataset_version('hero_stats')
+
+
+def _hero_contest(params):
+    try:
+        top = int(params.get('top', 10))
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "Parameter 'top' harus bilangan bulat")
+    ranking = get_app_state().meta_hero_stats.nlargest(top, 'Contest Count')
+    return {'heroes': _records(ranking[['Hero', 'Pick', 'Ban', 'Contest Count', 'Win', 'Win Rate%']])}
+
+
+def _jungler_league_version(params):
+    return data_store.dataset_version('jungler_stats')
+
+
+def _jungler_league(params):
+    summary, ranks, top_pct = analytics.jungler_league_table()
+    result = {'players': len(ranks), 'summary': _records(summary.rename_axis('Metric').reset_index())}
+    player = params.get('player')
+    if player is not None:
+        if player not in ranks.index:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Jungler {player} tidak ada")
+        result['player'] = {'name': player, 'rank': ranks.loc[player].to_dict(),
+                            'top_pct': top_pct.loc[player].to_dict()}
+    return result
+
+
+ENDPOINTS = {
+    '/api/teams': (_teams_version, _teams),
+    '/api/head-to-head': (_head_to_head_version, _head_to_head),
+    '/api/player-comparison': (_player_comparison_version, _player_comparison),
+    '/api/hero-contest': (_hero_contest_version, _hero_contest),
+    '/api/jungler-league': (_jungler_league_version, _jungler_league),
+}
+
+
+# --- CACHE RESPONS ---
+class Response:
+    def __init__(self, etag, body):
+        self.etag = etag
+        self.body = body
+        self.gzip_body = gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_BYTES else None
+        self.size = len(body) + len(self.gzip_body or b'')
+
+
+def etag(path, params, version):
+    key = json.dumps([path, sorted(params.items()), version])
+    return '"' + hashlib.sha1(key.encode()).hexdigest()[:20] + '"'
+
+
+def etag_matches(header, tag):
+    """True jika header If-None-Match memuat `tag` (daftar dipisah koma, `*`, prefiks lemah `W/`)."""
+    for value in header.split(','):
+        value = value.strip()
+        if value == '*' or value.removeprefix('W/') == tag:
+            return True
+    return False
+
+
+def accepts_gzip(header):
+    """True jika header Accept-Encoding mengizinkan gzip (q > 0; `gzip;q=0` menolak)."""
+    weights = {}
+    for item in header.split(','):
+        coding, *params = item.split(';')
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.strip().lower()] = weight
+    # Pengodean yang disebut eksplisit mengalahkan '*'
+    return weights.get('gzip', weights.get('x-gzip', weights.get('*', 0.0))) > 0
+
+
+class ResponseCache:
+    def __init__(self, max_bytes=MAX_BYTES):
+        self._responses = BoundedLRU(max_bytes, lambda response: response.size)
+
+    def get_or_build(self, tag, build):
+        """`Response` untuk ETag `tag`; `build()` (mengembalikan objek JSON) hanya dipanggil saat miss."""
+        response = self._responses.get(tag)
+        if response is not None:
+            return response
+
+        body = json.dumps(_clean(build()), default=_json_default, ensure_ascii=False).encode('utf-8')
+        return self._responses.put(tag, Response(tag, body))
+
+    def stats(self):
+        return self._responses.stats()
+
+
+_cache = ResponseCache()
+
+
+# --- SERVER HTTP ---
+class Handler(BaseHTTPRequestHandler):
+    # Keep-alive: klien bisa memakai satu koneksi untuk banyak request
+    protocol_version = 'HTTP/1.1'
+    server_version = 'MLBBApi/1.0'
+    # Header + body dikirim dalam satu write (di-flush setelah request selesai); tanpa buffer,
+    # dua write kecil beruntun tertahan Nagle + delayed ACK ~40 ms per respons keep-alive
+    wbufsize = 64 * 1024
+    verbose = False
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query))
+        endpoint = ENDPOINTS.get(url.path.rstrip('/') or url.path)
+        if endpoint is None:
+            if url.path in ('/', '/api', '/api/'):
+                return self._send_json(HTTPStatus.OK, {'endpoints': sorted(ENDPOINTS)})
+            return self._send_json(HTTPStatus.NOT_FOUND, {'error': f"Endpoint {url.path} tidak ada"})
+
+        version_fn, build = endpoint
+        try:
+            tag = etag(url.path, params, version_fn(params))
+            if etag_matches(self.headers.get('If-None-Match', ''), tag):
+                return self._send(HTTPStatus.NOT_MODIFIED, tag)
+            response = _cache.get_or_build(tag, lambda: build(params))
+        except ApiError as e:
+            return self._send_json(e.status, {'error': str(e)})
+        except (FileNotFoundError, KeyError) as e:
+            # Rinciannya (bisa berisi path absolut) hanya ke log server, bukan ke body respons
+            self.log_error('%s: %r', url.path, e)
+            return self._send_json(HTTPStatus.NOT_FOUND, {'error': "Data tidak ditemukan"})
+        except Exception:
+            # Misal ValidationError saat ingest: klien tetap mendapat respons, rinciannya ke log
+            self.log_error('%s: %s', url.path, traceback.format_exc())
+            return self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': "Kesalahan server"})
+
+        use_gzip = response.gzip_body is not None and accepts_gzip(self.headers.get('Accept-Encoding', ''))
+        self._send(HTTPStatus.OK, tag, response.gzip_body if use_gzip else response.body, use_gzip)
+
+    def _send(self, status, tag=None, body=b'', use_gzip=False):
+        self.send_response(status)
+        if tag is not None:
+            self.send_header('ETag', tag)
+            # Klien selalu revalidasi; jawaban 304 murah karena ETag dihitung dari versi data
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Vary', 'Accept-Encoding')
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            if use_gzip:
+                self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, payload):
+        self._send(status, body=json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+    def log_error(self, format, *args):
+        # Error selalu dicatat, juga tanpa --verbose
+        super().log_message(format, *args)
+
+
+def serve(host=HOST, port=PORT, verbose=False):
+    watcher.start()
+    Handler.verbose = verbose
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    print(f"API di http://{host}:{server.server_port}/api (Ctrl+C untuk berhenti)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+# --- KLIEN BENCHMARK ---
+BENCH_PATHS = [
+    '/api/head-to-head?' + urlencode({'team_a': 'ONIC ID', 'team_b': 'NAVI'}),
+    '/api/player-comparison?' + urlencode({'team_a': 'ONIC ID', 'player_a': 'Kairi', 'team_b': 'NAVI',
+                                           'player_b': 'Woshipaul', 'metric': 'KDA Ratio'}),
+    '/api/hero-contest?top=10',
+    '/api/jungler-league',
+    '/api/jungler-league?player=Woshipaul',
+    '/api/teams',
+]
+
+
+def bench(host, port, n_requests, concurrency, conditional=False, use_gzip=True):
+    """Mengirim `n_requests` request (dibagi ke `concurrency` koneksi keep-alive); mengembalikan ringkasan."""
+    latencies, statuses = [], Counter()
+    lock = threading.Lock()
+
+    def worker(count, offset):
+        connection = http.client.HTTPConnection(host, port)
+        etags, local_latencies, local_statuses = {}, [], Counter()
+        for i in range(count):
+            path = BENCH_PATHS[(offset + i) % len(BENCH_PATHS)]
+            headers = {'Accept-Encoding': 'gzip'} if use_gzip else {}
+            if conditional and path in etags:
+                headers['If-None-Match'] = etags[path]
+            start = time.perf_counter()
+            connection.request('GET', path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            local_latencies.append(time.perf_counter() - start)
+            local_statuses[response.status] += 1
+            if response.getheader('ETag'):
+                etags[path] = response.getheader('ETag')
+        connection.close()
+        with lock:
+            latencies.extend(local_latencies)
+            statuses.update(local_statuses)
+
+    per_worker = [n_requests // concurrency + (i < n_requests % concurrency) for i in range(concurrency)]
+    threads = [threading.Thread(target=worker, args=(count, i)) for i, count in enumerate(per_worker)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'seconds': elapsed,
+        'rps': len(latencies) / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        'statuses': dict(statuses),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API JSON lokal untuk data dashboard.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    serve_cmd = sub.add_parser('serve', help="Menjalankan server API")
+    serve_cmd.add_argument('--host', default=HOST)
+    serve_cmd.add_argument('--port', type=int, default=PORT)
+    serve_cmd.add_argument('--verbose', action='store_true', help="Log setiap request")
+    bench_cmd = sub.add_parser('bench', help="Klien benchmark terhadap server yang sedang berjalan")
+    bench_cmd.add_argument('--host', default=HOST)
+    bench_cmd.add_argument('--port', type=int, default=PORT)
+    bench_cmd.add_argument('--requests', type=int, default=5000)
+    bench_cmd.add_argument('--concurrency', type=int, default=8)
+    bench_cmd.add_argument('--conditional', action='store_true', help="Kirim If-None-Match (respons 304)")
+    bench_cmd.add_argument('--no-gzip', action='store_true')
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        serve(args.host, args.port, args.verbose)
+        return
+    result = bench(args.host, args.port, args.requests, args.concurrency, args.conditional, not args.no_gzip)
+    print(f"{result['requests']} request dalam {result['seconds']:.2f}s: {result['rps']:.0f} req/s, "
+          f"p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms, status {result['statuses']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+State aplikasi `Main-challange.py` yang dibangun secara malas (lazy).
+
+Satu objek `AppState` dipakai bersama oleh semua sesi di proses yang sama.
+Tabel mentah diambil dari `data_store` saat pertama kali dibutuhkan, dan tabel
+turunan (misal `meta_hero_stats`, statistik per role) dihitung sekali per
+versi data, bukan setiap kali Streamlit menjalankan ulang skrip. Perbandingan
+head-to-head tim ada di modul `comparison`.
+"""
+import threading
+
+import analytics
+import data_store
+
+
+class AppState:
+    # --- Tabel mentah ---
+    @property
+    def team_stats(self):
+        return data_store.load_team_stats()
+
+    @property
+    def navi_player_stats(self):
+        return data_store.load_player_stats('navi')
+
+    @property
+    def onic_player_stats(self):
+        return data_store.load_player_stats('onic')
+
+    @property
+    def navi_hero_stats(self):
+        return data_store.load_team_heroes('navi')
+
+    @property
+    def onic_hero_stats(self):
+        return data_store.load_team_heroes('onic')
+
+    @property
+    def hero_stats(self):
+        return data_store.load_hero_stats()
+
+    @property
+    def navi_match_history(self):
+        return data_store.load_match_history()
+
+    # --- Tabel turunan ---
+    @property
+    def meta_hero_stats(self):
+        return analytics.meta_hero_stats()
+
+    @property
+    def player_role_stats(self):
+        return analytics.player_role_stats()
+
+
+_state = None
+_state_lock = threading.Lock()
+
+
+def get_app_state():
+    """Mengembalikan `AppState` tunggal untuk proses ini."""
+    global _state
+    if _state is None:
+        with _state_lock:
+            if _state is None:
+                _state = AppState()
+    return _state
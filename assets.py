@@ -0,0 +1,159 @@
+"""
+Thumbnail foto pemain yang sudah diperkecil, di-cache di disk dan di memori.
+
+Foto asli (PNG 500 px) tidak lagi dibaca, di-decode, dan di-encode ulang oleh
+Streamlit di setiap rerun. Thumbnail dibuat sekali per (isi file, lebar,
+format) dengan Pillow, disimpan di `.cache/thumbnails/<hash>_<lebar>.<ext>`,
+lalu disajikan dari LRU di memori dengan batas total ukuran (MAX_BYTES) yang
+dipakai bersama oleh semua sesi. Hash isi file hanya dihitung ulang jika
+mtime/ukuran file berubah.
+
+Dashboard memakai PNG dengan lebar tampilan yang sama persis: untuk PNG/JPEG
+selebar itu `st.image` meneruskan byte apa adanya tanpa decode ulang, sedangkan
+WebP akan selalu dikonversi ulang oleh Streamlit. WebP tetap tersedia untuk
+keluaran di luar Streamlit (misal laporan HTML).
+
+Folder foto bisa diganti lewat MLBB_IMAGES_DIR (misal folder roster berisi
+ratusan pemain). Jalankan `python assets.py` untuk membuat semua thumbnail
+di muka.
+"""
+import argparse
+import hashlib
+import io
+import os
+import threading
+from pathlib import Path
+
+from PIL import Image
+
+import instrumentation
+from caching import BoundedLRU, atomic_write
+
+IMAGES_DIR = Path(os.environ.get('MLBB_IMAGES_DIR', Path(__file__).resolve().parent / 'images'))
+THUMBNAIL_DIR = Path(__file__).resolve().parent / '.cache' / 'thumbnails'
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+
+# Format -> (ekstensi, opsi simpan Pillow)
+FORMATS = {
+    'PNG': ('png', {'optimize': True}),
+    'WEBP': ('webp', {'quality': 85, 'method': 6}),
+}
+
+# Batas total ukuran thumbnail yang disimpan di memori
+MAX_BYTES = 16 * 1024 * 1024
+
+
+# --- HASH FILE SUMBER ---
+_digests = {}
+_digests_lock = threading.Lock()
+
+
+def _file_digest(path):
+    # Hash isi file, dihitung ulang hanya jika (mtime, ukuran) berubah
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _digests_lock:
+        cached = _digests.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+    with _digests_lock:
+        _digests[path] = (stamp, digest)
+    return digest
+
+
+# --- PEMBUATAN THUMBNAIL ---
+def render(path, width, fmt='PNG'):
+    """Byte thumbnail `path` dengan lebar `width` (tidak pernah diperbesar) dalam format `fmt`."""
+    with Image.open(path) as image:
+        image.load()
+        if image.width > width:
+            image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+        if fmt == 'WEBP' and image.mode == 'P':
+            image = image.convert('RGBA')
+        out = io.BytesIO()
+        image.save(out, format=fmt, **FORMATS[fmt][1])
+    return out.getvalue()
+
+
+class ThumbnailCache:
+    def __init__(self, directory=THUMBNAIL_DIR, max_bytes=MAX_BYTES):
+        self.directory = Path(directory)
+        self._thumbnails = BoundedLRU(max_bytes, len)
+
+    def get(self, path, width, fmt='PNG'):
+        """Byte thumbnail untuk file `path`; dibuat (dan disimpan ke disk) hanya jika belum ada."""
+        path = Path(path)
+        key = (_file_digest(path), width, fmt)
+        data = self._thumbnails.get(key)
+        if data is not None:
+            return data
+
+        cache_path = self.directory / f'{key[0]}_{width}.{FORMATS[fmt][0]}'
+        if cache_path.exists():
+            data = cache_path.read_bytes()
+        else:
+            with instrumentation.span('thumbnail', path.name):
+                data = render(path, width, fmt)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            atomic_write(cache_path, lambda p: p.write_bytes(data))
+        return self._thumbnails.put(key, data)
+
+    def stats(self):
+        return self._thumbnails.stats()
+
+
+_cache = ThumbnailCache()
+
+
+# --- FOTO PEMAIN ---
+_photo_index = {}
+_photo_index_lock = threading.Lock()
+
+
+def photo_path(player, directory=None):
+    """Path foto `player` (nama file = nama pemain, ekstensi apa pun di IMAGE_EXTENSIONS), atau None."""
+    directory = Path(directory or IMAGES_DIR)
+    # Index nama -> file dibangun ulang hanya jika isi folder berubah (mtime folder)
+    mtime = directory.stat().st_mtime_ns if directory.is_dir() else None
+    with _photo_index_lock:
+        cached = _photo_index.get(directory)
+        if cached is None or cached[0] != mtime:
+            files = {}
+            if mtime is not None:
+                for path in sorted(directory.iterdir()):
+                    if path.suffix.lower() in IMAGE_EXTENSIONS:
+                        files.setdefault(path.stem, path)
+            cached = _photo_index[directory] = (mtime, files)
+    return cached[1].get(player)
+
+
+def player_photo(player, width=250, fmt='PNG'):
+    """Byte thumbnail foto `player` untuk ditampilkan selebar `width` px."""
+    path = photo_path(player)
+    if path is None:
+        raise FileNotFoundError(f"Foto pemain {player} tidak ditemukan di {IMAGES_DIR}")
+    return _cache.get(path, width, fmt)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Membuat thumbnail semua foto pemain di muka.")
+    parser.add_argument('--dir', default=str(IMAGES_DIR), help="Folder foto pemain")
+    parser.add_argument('--widths', type=int, nargs='+', default=[250])
+    parser.add_argument('--formats', nargs='+', default=['PNG', 'WEBP'], choices=list(FORMATS))
+    args = parser.parse_args(argv)
+
+    paths = [path for path in sorted(Path(args.dir).iterdir()) if path.suffix.lower() in IMAGE_EXTENSIONS]
+    source_bytes = sum(path.stat().st_size for path in paths)
+    total = 0
+    for path in paths:
+        for width in args.widths:
+            for fmt in args.formats:
+                total += len(_cache.get(path, width, fmt))
+    print(f"{len(paths)} foto ({source_bytes / 1024:.0f} KB) -> "
+          f"{len(paths) * len(args.widths) * len(args.formats)} thumbnail ({total / 1024:.0f} KB) di {THUMBNAIL_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Benchmark headless untuk kedua dashboard pada data sintetis berbagai ukuran.
+
+Untuk setiap preset, data dibuat dengan `synth.py` lalu diukur di proses baru
+(MLBB_DATA_ROOT menunjuk ke data tersebut, cache kosong):
+- ingest: konversi CSV -> Arrow pertama kali (cold)
+- load: pembacaan dataset dari Arrow, lalu hit cache proses (warm)
+- derived: tabel turunan di `analytics` dan `comparison`
+- charts: pembuatan figure di `charts`
+- page: render setiap halaman lewat Streamlit AppTest (pertama & ulang)
+- memory: byte dataset yang di-memory-map (dibagi antar sesi/proses) vs di
+  heap proses (`data_store.memory_report`), dan ukuran state per sesi
+  (session_state ter-pickle) setelah setiap halaman dirender
+
+Hasil disimpan sebagai JSON; `--compare` membandingkan dengan hasil versi lain.
+
+Contoh:
+    python benchmark.py --preset small medium --output bench.json
+    python benchmark.py --preset large --output new.json --compare bench.json
+"""
+import argparse
+import json
+import os
+import pickle
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import synth
+
+# Halaman yang dirender per file dashboard
+PAGES = {
+    'Main.py': ["All Stats + Conclusion", "Detail Stats + Hero Pool", "Cari Pemain Serupa"],
+    'Main-challange.py': ["Ringkasan Tim", "Analisis Pemain [vs ONIC]", "Analisis Pemain [NAVI]",
+                          "Analisis Hero", "Rekomendasi Strategis", "All Data"],
+}
+
+# Hasil yang lebih lambat dari ini (rasio) ditandai sebagai regresi oleh --compare
+REGRESSION_RATIO = 1.2
+
+
+def timed(fn, repeat=1):
+    """Menjalankan fn `repeat` kali; mengembalikan ringkasan waktu (detik)."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return {'min': min(runs), 'median': statistics.median(runs), 'runs': len(runs)}
+
+
+# --- PENGUKURAN (dijalankan di proses baru dengan MLBB_DATA_ROOT) ---
+def measure(repeat):
+    import logging
+
+    import numpy as np
+    from streamlit.testing.v1 import AppTest
+
+    import analytics
+    import charts
+    import comparison
+    import confidence
+    import data_store
+    import draft
+    import ratings
+    import similarity
+    from app_state import get_app_state
+
+    logging.disable(logging.CRITICAL)
+    results = {}
+    memory = {'session_state_bytes': {}}
+    datasets = list(data_store.DATASETS)
+
+    for name in datasets:
+        results[f'ingest/{name}'] = timed(lambda: data_store.dataset_version(name))
+    for name in datasets:
+        results[f'load/{name}'] = timed(lambda: data_store.load(name))
+        results[f'load_warm/{name}'] = timed(lambda: data_store.load(name), repeat)
+    results['load/team_stats_all_seasons'] = timed(comparison.league_team_stats)
+
+    league_results = synth.league_results(synth.names('Team ', 500), 200_000, data_store.list_seasons(),
+                                          np.random.default_rng(0))
+    derived = {
+        'jungler_stats': data_store.load_jungler_stats,
+        'jungler_league_table': analytics.jungler_league_table,
+        'jungler_summary_heatmap': analytics.jungler_summary_heatmap,
+        'match_games': analytics.match_games,
+        'player_role_stats': analytics.player_role_stats,
+        'head_to_head': comparison.head_to_head,
+        'team_matchup': lambda: comparison.team_matchup('ONIC ID', 'NAVI'),
+        'meta_hero_stats': lambda: get_app_state().meta_hero_stats,
+        'draft_model': draft.draft_model,
+        'draft_recommend': lambda: draft.draft_model().recommend('NAVI', 'ONIC ID', ['Granger', 'Suyou']),
+        'player_index': similarity.player_index,
+        'similar_players': lambda: similarity.player_index().similar(0, k=10, min_games=5),
+        'confidence_league': confidence.league_intervals,
+        'rating_engine': ratings.rating_engine,
+        # Replay liga penuh (500 tim, 200 ribu match Bo3) dari state kosong
+        'rating_replay_league': lambda: ratings.RatingEngine().replay(league_results),
+    }
+    for name, fn in derived.items():
+        results[f'derived/{name}'] = timed(fn)
+        results[f'derived_warm/{name}'] = timed(fn, repeat)
+
+    team_stats, _ = comparison.team_matchup('ONIC ID', 'NAVI')
+    colors = comparison.team_colors(['ONIC ID', 'NAVI'])
+    meta_hero_stats = get_app_state().meta_hero_stats
+    navi_merged = data_store.load_team_heroes('navi').join(meta_hero_stats['Contest Count'])
+    figures = {
+        'player_comparison_chart': lambda: charts.player_comparison_chart(
+            'ONIC ID', 'Kairi', 'NAVI', 'Woshipaul', 'KDA Ratio', 'KDA'),
+        'winrate_funnel': lambda: charts.winrate_funnel(team_stats, colors),
+        'objective_tornado': lambda: charts.objective_tornado(team_stats, 'ONIC ID', 'NAVI', colors),
+        'objective_bar': lambda: charts.objective_bar(team_stats),
+        'tower_bar': lambda: charts.tower_bar(team_stats),
+        'top_contested_bar': lambda: charts.top_contested_bar(meta_hero_stats),
+        'top_winrate_bar': lambda: charts.top_winrate_bar(meta_hero_stats),
+        'pick_priority_bubble': lambda: charts.pick_priority_bubble(navi_merged, 'NAVI'),
+        'jungler_heatmap': lambda: charts.jungler_heatmap(*analytics.jungler_summary_heatmap()),
+    }
+    for name, fn in figures.items():
+        results[f'charts/{name}'] = timed(fn, repeat)
+
+    # Halaman dirender dari folder repo agar path relatif (images/...) tetap valid
+    os.chdir(Path(__file__).resolve().parent)
+    for script, pages in PAGES.items():
+        for page in pages:
+            def render():
+                at = AppTest.from_file(script, default_timeout=600)
+                at.run()
+                radio = at.sidebar.radio[0]
+                if radio.value != page:
+                    radio.set_value(page).run()
+                if at.exception:
+                    raise RuntimeError(f"{script} / {page}: {at.exception[0].value}")
+                memory['session_state_bytes'][f'{script}/{page}'] = len(
+                    pickle.dumps(dict(at.session_state.filtered_state)))
+
+            results[f'page/{script}/{page}'] = timed(render)
+            results[f'page_repeat/{script}/{page}'] = timed(render, repeat)
+    memory['datasets'] = data_store.memory_report().to_dict('records')
+    return results, memory
+
+
+# --- ORKESTRASI ---
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_preset(name, sizes, repeat, data_dir=None):
+    with tempfile.TemporaryDirectory(prefix=f'mlbb-{name}-') as tmp:
+        root = Path(data_dir or tmp)
+        if data_dir is None:
+            start = time.perf_counter()
+            rows = synth.generate(root, **sizes)
+            print(f"[{name}] data sintetis dibuat dalam {time.perf_counter() - start:.1f}s")
+        else:
+            rows = None
+
+        output = Path(tmp) / 'results.json'
+        env = dict(os.environ, MLBB_DATA_ROOT=str(root))
+        # Publikasi background dari watcher membuat waktu tidak deterministik
+        env.setdefault('MLBB_WATCH', '0')
+        subprocess.run([sys.executable, __file__, '--measure', str(output), '--repeat', str(repeat)],
+                       env=env, check=True)
+        measured = json.loads(output.read_text(encoding='utf-8'))
+    return {'sizes': sizes if data_dir is None else None, 'rows': rows, **measured}
+
+
+def compare(old, new):
+    """Mencetak perubahan waktu (median) per preset & benchmark; mengembalikan jumlah regresi."""
+    regressions = 0
+    for preset, run in new['presets'].items():
+        old_run = old.get('presets', {}).get(preset)
+        if old_run is None:
+            continue
+        for name, result in run['results'].items():
+            old_result = old_run['results'].get(name)
+            if old_result is None or old_result['median'] == 0:
+                continue
+            ratio = result['median'] / old_result['median']
+            flag = 'REGRESI' if ratio > REGRESSION_RATIO else ''
+            regressions += bool(flag)
+            print(f"{preset:<8} {name:<60} {old_result['median']:9.4f}s -> {result['median']:9.4f}s "
+                  f"x{ratio:5.2f} {flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark pemuat data dan halaman dashboard.")
+    parser.add_argument('--preset', nargs='+', choices=synth.PRESETS, default=['small'])
+    parser.add_argument('--data-dir', help="Pakai data yang sudah ada (satu preset) alih-alih membuat data baru")
+    parser.add_argument('--repeat', type=int, default=3, help="Pengulangan untuk pengukuran warm")
+    parser.add_argument('--output', default='benchmark.json', help="File hasil JSON (default: %(default)s)")
+    parser.add_argument('--compare', help="File JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument('--measure', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure:
+        results, memory = measure(args.repeat)
+        Path(args.measure).write_text(json.dumps({'results': results, 'memory': memory}), encoding='utf-8')
+        return
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'presets': {},
+    }
+    for preset in args.preset:
+        report['presets'][preset] = run_preset(preset, synth.PRESETS[preset], args.repeat, args.data_dir)
+        slowest = sorted(report['presets'][preset]['results'].items(), key=lambda kv: -kv[1]['median'])[:5]
+        for name, result in slowest:
+            print(f"[{preset}] {name:<60} {result['median']:9.4f}s")
+        memory = report['presets'][preset]['memory']
+        shared = sum(row['Shared MB'] for row in memory['datasets'])
+        private = sum(row['Private MB'] for row in memory['datasets'])
+        print(f"[{preset}] dataset: {shared:.1f} MB di-memory-map (bersama), {private:.1f} MB heap proses; "
+              f"state per sesi maks {max(memory['session_state_bytes'].values()) / 1024:.1f} KB")
+
+    Path(args.output).write_text(json.dumps(report, indent=1), encoding='utf-8')
+    print(f"Hasil -> {args.output}")
+
+    if args.compare:
+        old = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+        if compare(old, report):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
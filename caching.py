@@ -0,0 +1,93 @@
+"""
+Blok dasar cache yang dipakai bersama: LRU dengan batas ukuran (byte) untuk
+cache memori dan penulisan file atomik untuk cache disk.
+
+Modul ini sengaja tidak meng-import pandas/plotly agar murah dipakai saat
+cold start.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+
+# --- LRU DENGAN BATAS UKURAN ---
+class BoundedLRU:
+    """
+    LRU thread-safe dengan batas total ukuran `max_bytes`; `sizeof(value)`
+    menghitung ukuran satu entri. Nilai dibuat di luar lock (lihat
+    `get_or_build`), jadi entri lain tidak ikut menunggu.
+    """
+
+    def __init__(self, max_bytes, sizeof):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Nilai untuk `key` (dihitung sebagai hit), atau None jika belum ada."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key, value, discard=None):
+        """
+        Simpan hasil miss. `discard(key)` opsional menandai entri lain yang sudah
+        tidak berlaku dan dibuang sekalian di bawah lock yang sama.
+        """
+        with self._lock:
+            self.misses += 1
+            if discard is not None:
+                for stale in [k for k in self._entries if k != key and discard(k)]:
+                    self.size -= self.sizeof(self._entries.pop(stale))
+            if key not in self._entries:
+                self._entries[key] = value
+                self.size += self.sizeof(value)
+                self._evict()
+        return value
+
+    def get_or_build(self, key, build):
+        """Nilai untuk `key`; `build()` hanya dipanggil saat miss."""
+        value = self.get(key)
+        if value is not None:
+            return value
+        return self.put(key, build())
+
+    def _evict(self):
+        # Entri yang paling lama tidak dipakai dibuang lebih dulu; entri terbaru selalu disimpan
+        while self.size > self.max_bytes and len(self._entries) > 1:
+            _, value = self._entries.popitem(last=False)
+            self.size -= self.sizeof(value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self.size, 'hits': self.hits, 'misses': self.misses}
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# --- PENULISAN FILE ATOMIK ---
+def atomic_write(path, write):
+    """
+    Panggil `write(tmp_path)` lalu ganti nama ke `path`, agar proses/thread lain
+    tidak pernah membaca file setengah jadi.
+    """
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,212 @@
+"""
+Pembuat grafik Plotly yang dipakai dashboard dan generator laporan.
+
+Setiap fungsi hanya menerima data dan mengembalikan `Figure` tanpa memanggil
+Streamlit, sehingga grafik yang sama bisa ditampilkan dengan `st.plotly_chart`
+atau diekspor ke HTML/PNG oleh `report.py`. Plotly di-import di dalam setiap
+fungsi: jika semua figure halaman sudah ada di `figure_cache`, plotly.express
+tidak pernah dimuat.
+"""
+import pandas as pd
+
+import comparison
+
+
+# --- PERBANDINGAN PEMAIN ---
+def player_comparison_chart(team_a, player_a, team_b, player_b, metric, title,
+                            season=None, text_auto='.2s', yaxis_title=None):
+    """Bar chart satu metrik untuk dua pemain dari dua tim."""
+    import plotly.express as px
+
+    label_a = f"{player_a} ({comparison.short_name(team_a)})"
+    label_b = f"{player_b} ({comparison.short_name(team_b)})"
+    colors = comparison.team_colors([team_a, team_b])
+
+    # Membuat dataframe kecil untuk plotting
+    chart_data = pd.DataFrame({
+        'Pemain': [label_a, label_b],
+        metric: [comparison.player_value(team_a, player_a, metric, season),
+                 comparison.player_value(team_b, player_b, metric, season)]
+    })
+
+    figure = px.bar(chart_data, x='Pemain', y=metric, title=title,
+                    text_auto=text_auto, color='Pemain',
+                    color_discrete_map={label_a: colors[team_a], label_b: colors[team_b]})
+    figure.update_traces(textfont_size=14, textangle=0, textposition="outside", cliponaxis=False)
+    figure.update_layout(showlegend=False, xaxis_title="", yaxis_title=yaxis_title or metric)
+    return figure
+
+
+# --- RINGKASAN TIM ---
+def winrate_funnel(team_stats, colors):
+    """Funnel Match WR vs Game WR untuk tim-tim di `team_stats`."""
+    import plotly.express as px
+
+    df_winrate = team_stats[['Team Name', 'Match Win Rate%', 'Game Win Rate%']].copy()
+    df_winrate = df_winrate.melt(id_vars='Team Name', var_name='Type', value_name='Rate')
+
+    return px.funnel(df_winrate, x='Rate', y='Type', color='Team Name',
+                     title="Match WR vs Game WR",
+                     color_discrete_map=colors)
+
+
+def objective_tornado(team_stats, team_a, team_b, colors):
+    """Tornado chart control rate Lord/Turtle, team_a di kanan dan team_b di kiri."""
+    import plotly.graph_objects as go
+
+    y_labels_rate = ['Lord Control Rate (%)', 'Turtle Control Rate (%)']
+    rate_cols = ['lord Control Rate%', 'Cryoturtle Control Rate%']
+
+    figure = go.Figure()
+    figure.add_trace(go.Bar(
+        y=y_labels_rate,
+        x=[team_stats.at[team_a, col] for col in rate_cols],
+        name=team_a,
+        orientation='h',
+        marker=dict(color=colors[team_a])
+    ))
+    figure.add_trace(go.Bar(
+        y=y_labels_rate,
+        x=[-team_stats.at[team_b, col] for col in rate_cols],
+        name=team_b,
+        orientation='h',
+        marker=dict(color=colors[team_b])
+    ))
+
+    figure.update_layout(
+        title='Kontrol Objektif (%)',
+        barmode='relative',
+        xaxis_title="Control Rate (%)",
+        yaxis_title="",
+        bargap=0.4,
+        xaxis=dict(
+            tickvals=[-75, -50, -25, 0, 25, 50, 75],
+            ticktext=['75', '50', '25', '0', '25', '50', '75']
+        ),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return figure
+
+
+def objective_bar(team_stats):
+    """Grouped bar rata-rata Turtle/Lord per game."""
+    import plotly.express as px
+
+    objective_df = team_stats[
+        ['Team Name', 'Cryoturtle Kill Count per Game', 'Lord Kill Count per Game']].copy()
+    objective_df = objective_df.melt(id_vars='Team Name', var_name='Objective', value_name='Count per Game')
+
+    objective_df['Objective'] = objective_df['Objective'].replace({
+        'Cryoturtle Kill Count per Game': 'Turtle Slain',
+        'Lord Kill Count per Game': 'Lord Slain'
+    })
+
+    figure = px.bar(objective_df, x="Team Name", y="Count per Game", color="Objective",
+                    barmode='group', text_auto='.2f', title="Avg Turtle/Lord per Game")
+    figure.update_layout(xaxis_title="", yaxis_title="Avg/game", legend_title="Objektif")
+    return figure
+
+
+def tower_bar(team_stats):
+    """Grouped bar turret dihancurkan vs kehilangan turret per game."""
+    import plotly.express as px
+
+    tower_df = team_stats[
+        ['Team Name', 'Tower Destroy Count per Game', 'Tower Destroyed Count per Game']].copy()
+    tower_df = tower_df.melt(id_vars='Team Name', var_name='Metric', value_name='Count per Game')
+
+    tower_df['Metric'] = tower_df['Metric'].replace({
+        'Tower Destroy Count per Game': 'Destroy',
+        'Tower Destroyed Count per Game': 'Destroyed'
+    })
+
+    figure = px.bar(tower_df, x="Team Name", y="Count per Game", color="Metric",
+                    barmode='group', text_auto='.2f',
+                    title="Objektif Turret/game",
+                    color_discrete_map={
+                        'Destroy': 'green',
+                        'Destroyed': 'red'
+                    })
+    figure.update_layout(xaxis_title="", yaxis_title="Avg/game", legend_title="Turret")
+    return figure
+
+
+# --- ANALISIS HERO ---
+def top_contested_bar(meta_hero_stats, n=10):
+    """Top n hero paling diperebutkan berdasarkan jumlah absolut Pick + Ban."""
+    import plotly.express as px
+
+    top_contested = meta_hero_stats.nlargest(n, 'Contest Count')
+    figure = px.bar(top_contested, x='Contest Count', y='Hero', orientation='h',
+                    title=f'Top {n} Hero Paling Diperebutkan (Total Pick+Ban)',
+                    text_auto=True, color='Contest Count', color_continuous_scale='Reds')
+    figure.update_layout(yaxis={'categoryorder': 'total ascending'}, xaxis_title="Total Pick + Ban")
+    return figure
+
+
+def top_winrate_bar(meta_hero_stats, min_picks=20, n=10):
+    """Top n win rate tertinggi, hanya hero dengan pick > min_picks agar WR relevan."""
+    import plotly.express as px
+
+    top_winrate = meta_hero_stats[meta_hero_stats['Pick'] > min_picks].nlargest(n, 'Win Rate%')
+    figure = px.bar(top_winrate, x='Win Rate%', y='Hero', orientation='h',
+                    title=f'Top {n} Hero Win Rate Tertinggi (Min. {min_picks} Picks)',
+                    text_auto='.2f', color='Win Rate%', color_continuous_scale='Greens')
+    figure.update_layout(yaxis={'categoryorder': 'total ascending'})
+    return figure
+
+
+def pick_priority_bubble(team_heroes, team_label, n=10):
+    """
+    Bubble chart pick tim vs popularitas meta. `team_heroes` adalah statistik hero
+    tim yang sudah di-join dengan kolom 'Contest Count'; ukuran gelembung = WR tim.
+    """
+    import plotly.express as px
+
+    top_picks = team_heroes.nlargest(n, 'Pick Count').copy()
+
+    # Hero dengan WR 0% tetap diberi gelembung kecil agar terlihat
+    top_picks['Bubble Size'] = top_picks['Game Win Rate%']
+    top_picks.loc[top_picks['Bubble Size'] == 0, 'Bubble Size'] = 1
+
+    return px.scatter(top_picks, x='Pick Count', y='Contest Count',
+                      size='Bubble Size',
+                      color='Hero',
+                      title=f'Pick {team_label} vs. Popularitas Meta',
+                      hover_name='Hero',
+                      hover_data={
+                          'Bubble Size': False,
+                          'Game Win Rate%': True
+                      },
+                      size_max=40,
+                      labels={'Pick Count': f'Jumlah Pick oleh {team_label}',
+                              'Contest Count': 'Popularitas di MPL (Total Pick+Ban)'})
+
+
+# --- JUNGLER ---
+def jungler_heatmap(summary_df, values, normalized):
+    """Heatmap statistik jungler: warna dari matriks normalisasi, teks dari nilai asli."""
+    import plotly.express as px
+
+    figure = px.imshow(
+        normalized,
+        text_auto=False,
+        aspect="auto",
+        color_continuous_scale='RdYlGn',
+        labels=dict(color="Relative Ranking"),
+        x=summary_df.columns.drop('Player'),
+        y=summary_df['Player']
+    )
+
+    figure.update_traces(
+        text=values,
+        texttemplate="%{text:.2f}"  # Format teks dengan 2 angka desimal
+    )
+
+    figure.update_layout(
+        title_text='Perbandingan Statistik Antar Pemain',
+        title_x=0.5,
+        xaxis_title="Stats",
+        yaxis_title="Jungler"
+    )
+    return figure
@@ -0,0 +1,136 @@
+"""
+Mesin perbandingan head-to-head untuk semua tim dan musim.
+
+Menggantikan perbandingan ONIC vs NAVI yang di-hardcode di halaman: statistik
+tim semua musim digabung dalam satu tabel, lalu selisih setiap metrik untuk
+semua pasangan tim dihitung sekaligus per musim (broadcasting NumPy dalam satu
+groupby). Hasilnya di-cache per versi data sehingga melihat pasangan mana pun
+hanya berupa lookup index.
+"""
+import numpy as np
+import pandas as pd
+
+import data_store
+
+# Metrik tim yang dibandingkan di halaman Ringkasan Tim
+TEAM_METRICS = [
+    'Match Win Rate%', 'Game Win Rate%',
+    'Kills per Game', 'Deaths per Game', 'KDA', 'Team Kill Participation%',
+    'Cryoturtle Control Rate%', 'lord Control Rate%',
+    'Cryoturtle Kill Count per Game', 'Lord Kill Count per Game',
+    'Tower Destroy Count per Game', 'Tower Destroyed Count per Game',
+]
+
+# Warna tetap untuk tim yang sudah punya identitas di dashboard, tim lain memakai palet
+TEAM_COLORS = {'ONIC ID': '#ffcb00', 'NAVI': '#add8e6'}
+_PALETTE = ['#636efa', '#ef553b', '#00cc96', '#ab63fa', '#ffa15a',
+            '#19d3f3', '#ff6692', '#b6e880', '#ff97ff', '#fecb52']
+
+TEAM_SHORT_NAMES = {'ONIC ID': 'ONIC'}
+
+# Lineup utama per musim (role -> pemain), dipakai halaman perbandingan pemain
+ROSTERS = {
+    'S15': {
+        'ONIC ID': {'Jungler': 'Kairi', 'Gold': 'Savero', 'Mid': 'S A N Z', 'Roam': 'Kiboy', 'Exp': 'Lutpiii'},
+        'NAVI': {'Jungler': 'Woshipaul', 'Gold': 'Xyve', 'Mid': 'xMagic', 'Roam': 'Karss', 'Exp': 'bq syaii'},
+    },
+}
+
+DEFAULT_MATCHUP = (data_store.CURRENT_SEASON, 'ONIC ID', 'NAVI')
+
+
+def team_colors(teams):
+    """Peta warna untuk daftar tim (stabil untuk tim yang sama)."""
+    colors = {}
+    for i, team in enumerate(t for t in teams if t not in TEAM_COLORS):
+        colors[team] = _PALETTE[i % len(_PALETTE)]
+    return {team: TEAM_COLORS.get(team, colors.get(team)) for team in teams}
+
+
+def short_name(team):
+    return TEAM_SHORT_NAMES.get(team, team)
+
+
+def roster(team, season=None):
+    """Lineup role -> pemain untuk sebuah tim di satu musim."""
+    return ROSTERS[season or data_store.CURRENT_SEASON][team]
+
+
+def _seasons_version(seasons):
+    return '|'.join(data_store.dataset_version('team_stats', season) for season in seasons)
+
+
+# --- STATISTIK TIM LINTAS MUSIM ---
+def league_team_stats(seasons=None):
+    """
+    team_statistics semua musim dalam satu tabel dengan kolom 'Season',
+    diindex (Season, Team Name).
+    """
+    seasons = tuple(seasons or data_store.list_seasons())
+
+    def build():
+        frames = [data_store.load_team_stats(season).assign(Season=season) for season in seasons]
+        league_df = pd.concat(frames, ignore_index=True)
+        return league_df.set_index(['Season', 'Team Name'], drop=False).rename_axis([None, None])
+
+    return data_store.get_or_build(('derived', 'league_team_stats', seasons), _seasons_version(seasons), build)
+
+
+def season_teams(season=None):
+    """Daftar tim di satu musim, sesuai urutan file sumber."""
+    return data_store.load_team_stats(season)['Team Name'].tolist()
+
+
+def _head_to_head(league_df, metrics):
+    frames = []
+    for season, group in league_df.groupby('Season', sort=False):
+        teams = group['Team Name'].to_numpy()
+        values = group[metrics].to_numpy(dtype='float64')
+        n = len(teams)
+        # deltas[i, j, m] = nilai tim i - nilai tim j untuk metrik m
+        deltas = values[:, None, :] - values[None, :, :]
+        index = pd.MultiIndex.from_arrays(
+            [np.full(n * n, season), np.repeat(teams, n), np.tile(teams, n)],
+            names=['Season', 'Team', 'Opponent'])
+        frames.append(pd.DataFrame(deltas.reshape(n * n, len(metrics)), index=index, columns=metrics))
+    return pd.concat(frames)
+
+
+def head_to_head(seasons=None, metrics=None):
+    """
+    Selisih metrik untuk semua pasangan tim di semua musim.
+    Index (Season, Team, Opponent), nilai = Team - Opponent.
+    """
+    seasons = tuple(seasons or data_store.list_seasons())
+    metrics = tuple(metrics or TEAM_METRICS)
+    return data_store.get_or_build(('derived', 'head_to_head', seasons, metrics), _seasons_version(seasons),
+                                   lambda: _head_to_head(league_team_stats(seasons), list(metrics)))
+
+
+def team_matchup(team_a, team_b, season=None):
+    """
+    Data dua tim untuk satu musim: (stats, deltas), keduanya diindex Team Name
+    dengan urutan team_a lalu team_b.
+    - stats: baris team_statistics kedua tim
+    - deltas: selisih TEAM_METRICS terhadap lawannya (team_a - team_b, team_b - team_a)
+    """
+    season = season or data_store.CURRENT_SEASON
+    stats = league_team_stats().loc[[(season, team_a), (season, team_b)]].droplevel(0)
+    deltas = head_to_head().loc[[(season, team_a, team_b), (season, team_b, team_a)]]
+    return stats, deltas.droplevel([0, 2])
+
+
+# --- PERBANDINGAN PEMAIN ---
+# Metrik turunan per game yang tidak ada langsung di file statistik pemain
+PLAYER_PER_GAME = {
+    'Lord Secured per Game': 'Lord Secured',
+    'Turtle Secured per Game': 'Cryoturtle Secured',
+}
+
+
+def player_value(team, player, metric, season=None):
+    """Nilai satu metrik untuk seorang pemain (lookup index, termasuk metrik per game)."""
+    player_stats = data_store.load_player_stats(data_store.team_code(team), season)
+    if metric in PLAYER_PER_GAME:
+        return player_stats.at[player, PLAYER_PER_GAME[metric]] / player_stats.at[player, 'Games Played']
+    return player_stats.at[player, metric]
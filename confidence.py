@@ -0,0 +1,223 @@
+"""
+Interval kepercayaan 95% untuk win rate, KDA, dan metrik per menit.
+
+Banyak angka di dashboard berasal dari sampel kecil (belasan game, hero
+dengan 1-3 pick), jadi setiap estimasi titik diberi interval:
+- win rate: interval Wilson (tetap masuk akal untuk 0% / 100% dan n kecil)
+- KDA = (K + A) / max(D, 1): bootstrap parametrik. Data hanya berisi total
+  per pemain/hero (tanpa log per game), jadi total kill/death/assist
+  diperlakukan sebagai hitungan Poisson; laju setiap replikasi diambil dari
+  posterior Gamma(total + 0.5) (prior Jeffreys) sehingga total 0 tidak
+  menghasilkan interval nol. Semua baris diproses sekaligus sebagai matriks
+  (baris x N_BOOTSTRAP) per potongan, dengan seed tetap dan vektor normal
+  bersama untuk semua baris.
+- metrik per menit: data tidak berisi nilai per game, jadi interval ini
+  bukan bootstrap dan tidak diturunkan dari sebaran data. Nilai per game
+  diasumsikan Gamma dengan koefisien variasi PER_GAME_CV (angka asumsi),
+  sehingga rata-rata G game adalah Gamma dengan bentuk G / CV^2; kuantilnya
+  dihitung langsung (Wilson-Hilferty). `describe` memberinya label
+  "perkiraan model", bukan "95% CI", agar tidak disamakan dengan interval lain.
+
+Hasil per dataset di-cache per versi data lewat `data_store.get_or_build`;
+`league_intervals` menghitung semua pemain dan hero liga dalam satu batch,
+dan halaman mengambil potongan timnya lewat `team_intervals`.
+"""
+import numpy as np
+import pandas as pd
+
+import data_store
+
+LEVEL = 0.95
+Z = 1.959963984540054
+
+N_BOOTSTRAP = 1000
+SEED = 15
+
+# Bentuk posterior < batas ini disampel langsung; di atasnya pendekatan Wilson-Hilferty sudah akurat
+EXACT_BELOW = 3
+
+# Batas jumlah sel (baris x replikasi) yang diproses sekaligus
+CHUNK_CELLS = 4_000_000
+
+# Koefisien variasi nilai per game (asumsi, karena data tidak berisi log per game)
+PER_GAME_CV = {
+    'Gold Per Minute': 0.2,
+    'Gold per Minute': 0.2,
+    'Exp Per Minute': 0.2,
+    'Damage Per Minute': 0.35,
+    'Damage Taken Per Minute': 0.35,
+}
+
+# Kolom win rate% -> (kolom menang, kolom jumlah game)
+RATES = {
+    'Games Win Ratio%': ('Number of game wins', 'Games Played'),
+    'Matches Win Ratio%': ('Number of match wins', 'Matches Played'),
+    'Game Win Rate%': ('Game Win Count', None),
+    'Win Rate%': ('Win', 'Pick'),
+}
+# Kolom jumlah game untuk tabel hero (dipakai jika kolom game di RATES = None)
+GAMES_COLUMNS = ['Games Played', 'Pick Count', 'Game Count', 'Pick']
+KDA_COLUMNS = ['KDA Ratio', 'KDA']
+
+
+def low_col(metric):
+    return f'{metric} CI Low'
+
+
+def high_col(metric):
+    return f'{metric} CI High'
+
+
+def format_interval(low, high, fmt='.2f', suffix='', label='95% CI'):
+    return f"{label} {low:{fmt}}–{high:{fmt}}{suffix}"
+
+
+def describe(row, metric, fmt='.2f', suffix=''):
+    """Teks interval `metric` dari satu baris hasil `with_intervals` / `team_intervals`."""
+    label = '95% CI'
+    if metric in PER_GAME_CV:
+        # Bukan dari data: sebaran per game diasumsikan (lihat docstring modul)
+        label = f"perkiraan model 95% (CV per game diasumsikan {PER_GAME_CV[metric]:.0%})"
+    return format_interval(row[low_col(metric)], row[high_col(metric)], fmt, suffix, label)
+
+
+# --- INTERVAL ---
+def wilson(successes, trials, z=Z):
+    """Interval Wilson (low, high) dalam 0..1; trials = 0 menghasilkan (0, 1)."""
+    successes = np.asarray(successes, dtype='float64')
+    trials = np.asarray(trials, dtype='float64')
+    n = np.maximum(trials, 1)
+    p = np.clip(successes / n, 0, 1)
+    denominator = 1 + z ** 2 / n
+    center = (p + z ** 2 / (2 * n)) / denominator
+    half = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+    empty = trials <= 0
+    return np.where(empty, 0.0, np.clip(center - half, 0, 1)), np.where(empty, 1.0, np.clip(center + half, 0, 1))
+
+
+def _gamma_draws(shape, normal, rng):
+    # Sampel Gamma(shape) (baris x replikasi) float32 dari vektor normal standar bersama
+    # lewat Wilson-Hilferty; bentuk kecil (pendekatan kurang akurat) disampel langsung
+    shape = np.asarray(shape, dtype='float32')[:, None]
+    c = 1 / (9 * shape)
+    draws = np.sqrt(c) * normal[None, :]
+    draws += 1 - c
+    np.clip(draws, 0, None, out=draws)
+    draws **= 3
+    draws *= shape
+    small = np.flatnonzero(shape[:, 0] < EXACT_BELOW)
+    if len(small):
+        draws[small] = rng.standard_gamma(shape[small], (len(small), len(normal)), dtype='float32')
+    return draws
+
+
+def kda_bootstrap(kills, deaths, assists, n_boot=N_BOOTSTRAP, level=LEVEL, seed=SEED):
+    """Interval persentil (low, high) KDA = (K + A) / max(D, 1) dari total kill/death/assist per baris."""
+    kills, deaths, assists = (np.asarray(values, dtype='float64') for values in (kills, deaths, assists))
+    # Interval hanya bergantung pada (K + A, D); total hero/pemain banyak yang kembar,
+    # jadi setiap pasangan unik cukup dihitung sekali
+    pairs, inverse = np.unique(np.stack([kills + assists, deaths], axis=1), axis=0, return_inverse=True)
+    low, high = _kda_bootstrap_unique(pairs[:, 0], pairs[:, 1], n_boot, level, seed)
+    inverse = inverse.reshape(-1)
+    return low[inverse], high[inverse]
+
+
+def _kda_bootstrap_unique(kills_assists, deaths, n_boot, level, seed):
+    rng = np.random.default_rng(seed)
+    # Replikasi normal yang sama dipakai semua baris (common random numbers): interval setiap
+    # baris tetap sah karena hanya distribusi marginalnya yang dipakai, dan biaya RNG jadi O(n_boot)
+    numerator_normal = rng.standard_normal(n_boot, dtype='float32')
+    deaths_normal = rng.standard_normal(n_boot, dtype='float32')
+    low, high = np.empty(len(deaths)), np.empty(len(deaths))
+    tail = (1 - level) / 2
+    step = max(1, CHUNK_CELLS // n_boot)
+    for start in range(0, len(deaths), step):
+        rows = slice(start, start + step)
+        # Posterior laju kill + assist (jumlah dua Poisson independen) = Gamma(K + A + 1)
+        kda = _gamma_draws(kills_assists[rows] + 1, numerator_normal, rng)
+        kda /= np.maximum(_gamma_draws(deaths[rows] + 0.5, deaths_normal, rng), 1)
+        low[rows], high[rows] = np.quantile(kda, [tail, 1 - tail], axis=1)
+    return low, high
+
+
+def mean_interval(means, games, cv, z=Z):
+    """Interval rata-rata `games` game dengan nilai per game Gamma(CV = `cv`); NaN jika games = 0."""
+    means = np.asarray(means, dtype='float64')
+    games = np.asarray(games, dtype='float64')
+    # Wilson-Hilferty: kuantil Gamma(bentuk k) / rata-rata = (1 - c +- z sqrt(c))^3, c = 1 / (9k)
+    c = np.divide(cv ** 2 / 9, games, out=np.full_like(games, np.nan), where=games > 0)
+    return means * np.clip(1 - c - z * np.sqrt(c), 0, None) ** 3, means * (1 - c + z * np.sqrt(c)) ** 3
+
+
+def intervals(df, seed=SEED):
+    """
+    Kolom `<metrik> CI Low` / `<metrik> CI High` untuk setiap metrik yang
+    dikenali di `df` (win rate%, KDA, metrik per menit), index sama dengan `df`.
+    """
+    games_col = next((col for col in GAMES_COLUMNS if col in df.columns), None)
+    result = {}
+    for metric, (wins_col, trials_col) in RATES.items():
+        trials_col = trials_col or games_col
+        if metric in df.columns and wins_col in df.columns and trials_col in df.columns:
+            low, high = wilson(df[wins_col], df[trials_col])
+            result[low_col(metric)], result[high_col(metric)] = low * 100, high * 100
+
+    kda_col = next((col for col in KDA_COLUMNS if col in df.columns), None)
+    if kda_col and {'Total Kills', 'Total Deaths', 'Total Assists'} <= set(df.columns):
+        result[low_col(kda_col)], result[high_col(kda_col)] = kda_bootstrap(
+            df['Total Kills'], df['Total Deaths'], df['Total Assists'], seed=seed)
+
+    if games_col:
+        for metric, cv in PER_GAME_CV.items():
+            if metric in df.columns:
+                result[low_col(metric)], result[high_col(metric)] = mean_interval(df[metric], df[games_col], cv)
+    return pd.DataFrame(result, index=df.index)
+
+
+def with_intervals(name, season=None):
+    """Dataset `name` ditambah kolom interval kepercayaan, dihitung sekali per versi data."""
+    season = season or data_store.CURRENT_SEASON
+    return data_store.get_or_build(
+        ('derived', 'confidence', name, season), data_store.dataset_version(name, season),
+        lambda: pd.concat([data_store.load(name, season), intervals(data_store.load(name, season))], axis=1))
+
+
+def _league_tables(season, suffix):
+    # Tim di `season` yang punya dataset `<kode tim>_<suffix>` -> nama datasetnya
+    datasets = {}
+    for team in data_store.load_team_stats(season)['Team Name']:
+        name = f'{data_store.team_code(team)}_{suffix}'
+        if data_store.has_dataset(name, season):
+            datasets[team] = name
+    return datasets
+
+
+def _league_build(season, datasets):
+    tables = [data_store.load(name, season).assign(Team=team) for team, name in datasets.items()]
+    if not tables:
+        return pd.DataFrame()
+    df = pd.concat(tables)
+    return pd.concat([df, intervals(df)], axis=1)
+
+
+def league_intervals(season=None):
+    """
+    (pemain, hero): semua tabel pemain dan tabel hero tim di `season` digabung
+    dan diberi interval dalam satu batch, dihitung sekali per versi data.
+    """
+    season = season or data_store.CURRENT_SEASON
+    result = []
+    for suffix in ('player_stats', 'hero_stats'):
+        datasets = _league_tables(season, suffix)
+        version = '|'.join(data_store.dataset_version(name, season) for name in datasets.values())
+        result.append(data_store.get_or_build(('derived', 'confidence_league', suffix, season), version,
+                                              lambda datasets=datasets: _league_build(season, datasets)))
+    return tuple(result)
+
+
+def team_intervals(team, suffix='player_stats', season=None):
+    """Baris tim `team` dari `league_intervals` (index = pemain atau hero)."""
+    players, heroes = league_intervals(season)
+    df = players if suffix == 'player_stats' else heroes
+    return df[df['Team'] == team]
+
@@ -0,0 +1,658 @@
+"""
+Lapisan akses data bersama untuk `Main.py` dan `Main-challange.py`.
+
+Setiap file CSV di `data/` dan `data_jungler/` dikonversi sekali menjadi file
+Arrow IPC (Feather v2) bertipe di `.cache/columnar/` sesuai skema kolom di
+bawah. Pemuat data membaca salinan kolumnar tersebut, dan konversi ulang hanya
+dilakukan jika file sumber atau skemanya berubah (dicek lewat mtime + ukuran
+file, lalu hash SHA-256 jika mtime berbeda).
+
+DataFrame hasil pemuat disimpan sekali per proses dan dipakai bersama oleh
+semua sesi, jadi pemanggil tidak boleh mengubahnya secara langsung. Index
+setiap DataFrame berisi kolom kunci dataset (Player / Team Name / Hero / ...),
+sehingga baris bisa diambil langsung dengan `df.loc[nama]` tanpa scan kolom.
+
+Data musim berjalan (S15) ada langsung di `data/`; musim lain dipartisi per
+folder `data/seasons/<musim>/` dengan nama file yang sama.
+
+Dataset yang sudah dipublikasikan lewat `publish` (dipanggil `watcher` saat
+file berubah) dibaca langsung dari memori tanpa cek file: versi baru dimuat
+di luar lock lalu ditukar dengan satu assignment, sehingga sesi yang sedang
+berjalan selalu melihat versi lama atau baru secara utuh dan tidak menunggu.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+import instrumentation
+import validation
+from caching import atomic_write
+from validation import AtMost, KdaRatio, PerGame, SumOf, Unique
+
+BASE_DIR = Path(__file__).resolve().parent
+# Root folder data/ dan data_jungler/; bisa diarahkan ke data lain (misal data sintetis
+# dari synth.py) lewat variabel lingkungan MLBB_DATA_ROOT
+DATA_ROOT = Path(os.environ.get('MLBB_DATA_ROOT', BASE_DIR)).resolve()
+CACHE_DIR = DATA_ROOT / '.cache' / 'columnar'
+# Baris yang gagal validasi saat konversi (lihat validation), satu CSV per file sumber
+QUARANTINE_DIR = DATA_ROOT / '.cache' / 'quarantine'
+
+INT = 'int32'
+# Nilai desimal 2 angka dari sumber tetap float64: float32 menggeser pembulatan tampilan (78.95 -> '78.9')
+FLOAT = 'float64'
+STR = 'str'
+CATEGORY = 'category'
+
+
+# --- SKEMA KOLOM ---
+def _player_stats_schema(id_col):
+    # Layout 52 kolom yang sama dipakai statistik jungler dan statistik pemain per tim
+    return {
+        'Player': STR, id_col: STR,
+        'Matches Played': INT, 'Number of match wins': INT, 'Matches Win Ratio%': FLOAT,
+        'Games Played': INT, 'Number of game wins': INT, 'Games Win Ratio%': FLOAT,
+        'Total Kills': INT, 'Average Kills per game': FLOAT, 'Highest kill in a single game': INT,
+        'Total Deaths': INT, 'Average Deaths': FLOAT, 'Highest death in a single game': INT,
+        'Total Assists': INT, 'Average Assists': FLOAT, 'Highest assists in a single game': INT,
+        'KDA Ratio': FLOAT, 'Kill Participation%': FLOAT,
+        'Total Gold': INT, 'Average Gold': FLOAT, 'Gold Per Minute': FLOAT, 'Gold Share%': FLOAT,
+        'Exp Per Minute': FLOAT,
+        'Total Damage': INT, 'Average Damage': FLOAT, 'Damage Per Minute': FLOAT, 'Damage Share%': FLOAT,
+        'Damage/Gold%': FLOAT,
+        'Total Building Damage': INT, 'Average Building Damage': FLOAT, 'Building Damage Share%': FLOAT,
+        'Damage Taken': INT, 'Average Damage Taken': FLOAT, 'Damage Taken Per Minute': FLOAT,
+        'Damage Taken Share%': FLOAT, 'DMG taken/Gold%': FLOAT,
+        'Total control time/s': FLOAT, 'Control time per game/s': FLOAT,
+        'Total heal': INT, 'Heal per game': FLOAT,
+        'Heroes Used': INT, 'Lengendary': INT, 'Savage': INT, 'Maniac': INT,
+        'Triple Kill': INT, 'Double Kill': INT, 'First Blood': INT,
+        'Towers Secured': INT, 'Cryoturtle Secured': INT, 'Lord Secured': INT,
+        'Average Game Time/s': FLOAT,
+    }
+
+
+PLAYER_STATS_SCHEMA = _player_stats_schema('Player No.')
+JUNGLER_STATS_SCHEMA = _player_stats_schema('ID')
+
+TEAM_STATS_SCHEMA = {
+    'No.': INT, 'Team Name': STR,
+    'Match Count': INT, 'Match Win Count': INT, 'Match Win Rate%': FLOAT,
+    'Game Count': INT, 'Game Win Count': INT, 'Game Win Rate%': FLOAT, 'TIme per Game/s': FLOAT,
+    'Total Kills': INT, 'Kills per Game': FLOAT, 'Highest kills in a single game': INT,
+    'Total Deaths': INT, 'Deaths per Game': FLOAT, 'Highest deaths in a single game': INT,
+    'Total Assists': INT, 'Average Assists': FLOAT, 'Highest assists in a single game': INT,
+    'KDA': FLOAT, 'Team Kill Participation%': FLOAT, 'Team Gold per Minute': FLOAT,
+    'Team Damage': INT, 'Team Damage per Minute': FLOAT, 'Team Building Damage': INT,
+    'Team Damage Taken': INT, 'Team Damage Taken per Minute': FLOAT,
+    'Heros Used': INT, 'Lengendary': INT, 'Savage': INT, 'Maniac': INT,
+    'Triple Kill': INT, 'Double Kill': INT, 'First Blood': INT, 'FB Rate%': FLOAT,
+    'Tower Destroy Count': INT, 'Tower Destroyed Count': INT,
+    'Tower Destroy Count per Game': FLOAT, 'Tower Destroyed Count per Game': FLOAT,
+    # Header asli memakai nama 'Enemy Cryoturtle Kill Count' dua kali (turtle & lord lawan)
+    'Cryoturtle Kill Count': INT, 'Enemy Cryoturtle Kill Count': INT,
+    'Cryoturtle Kill Count per Game': FLOAT, 'Cryoturtle Control Rate%': FLOAT,
+    'Lord Kill Count': INT, 'Enemy Cryoturtle Kill Count.1': INT,
+    'Lord Kill Count per Game': FLOAT, 'lord Control Rate%': FLOAT,
+}
+
+TEAM_HERO_SCHEMA = {
+    'No.': INT, 'Team': CATEGORY, 'Team Code': CATEGORY, 'Hero': STR,
+    'Pick Count': INT, 'Pick Rate%': FLOAT, 'BP Count': INT, 'BP Rate%': FLOAT,
+    'Ban Count': INT, 'Ban Rate%': FLOAT, 'Enemy Ban Count': INT, 'Enemy Ban Rate%': FLOAT,
+    'Game Win Count': INT, 'Game Win Rate%': FLOAT,
+    'Total Kills': INT, 'Total Deaths': INT, 'Total Assists': INT, 'KDA': FLOAT,
+}
+
+HERO_META_SCHEMA = {'Hero': STR, 'Pick': INT, 'Ban': INT, 'Win': INT, 'Win Rate%': FLOAT}
+
+MATCH_HISTORY_SCHEMA = {
+    'Match': INT, 'Opponent': CATEGORY, 'Result': CATEGORY,
+    'Score_NAVI': INT, 'Score_Opponent': INT, 'Game_Played': INT,
+    'Player_Mid': STR, 'Player_Roam': STR, 'Player_Gold': STR, 'Player_Exp': STR, 'Player_Jungler': STR,
+}
+
+JUNGLER_HERO_POOL_SCHEMA = {
+    'Player': STR, 'Player ID': STR, 'Hero': STR,
+    'Game Count': INT, 'Game Win Count': INT, 'Game Win Rate%': FLOAT,
+    'Total Kills': INT, 'Total Deaths': INT, 'Total Assists': INT,
+    'Kills per Game': FLOAT, 'Deaths per Game': FLOAT, 'Assists per Game': FLOAT, 'KDA': FLOAT,
+    'Gold per Minute': FLOAT, 'Damage per Game': FLOAT, 'Damage Taken per Game': FLOAT,
+    'Building Damage per Game': FLOAT,
+    'Legendary': INT, 'Savage': INT, 'Maniac': INT, 'Triple Kill': INT, 'Double Kill': INT,
+}
+
+
+# --- CEK KUALITAS DATA (lihat validation) ---
+def _player_stats_checks(schema):
+    per_game = [('Average Kills per game', 'Total Kills'), ('Average Deaths', 'Total Deaths'),
+                ('Average Assists', 'Total Assists'), ('Average Gold', 'Total Gold'),
+                ('Average Damage', 'Total Damage'), ('Average Building Damage', 'Total Building Damage'),
+                ('Average Damage Taken', 'Damage Taken'), ('Control time per game/s', 'Total control time/s'),
+                ('Heal per game', 'Total heal')]
+    return validation.basic_checks(schema) + (
+        Unique(('Player',)),
+        AtMost('Number of match wins', 'Matches Played'),
+        AtMost('Number of game wins', 'Games Played'),
+        PerGame('Matches Win Ratio%', 'Number of match wins', 'Matches Played', scale=100),
+        PerGame('Games Win Ratio%', 'Number of game wins', 'Games Played', scale=100),
+        *(PerGame(average, total, 'Games Played') for average, total in per_game),
+        KdaRatio('KDA Ratio'),
+    )
+
+
+PLAYER_STATS_CHECKS = _player_stats_checks(PLAYER_STATS_SCHEMA)
+JUNGLER_STATS_CHECKS = _player_stats_checks(JUNGLER_STATS_SCHEMA)
+
+# 'Tower Destroy Count per Game' dan 'KDA' tim tidak dicek: rumus di sumber tidak
+# sama dengan total / jumlah game (ONIC ID: 158 tower / 60 game tercatat 5.73)
+TEAM_STATS_CHECKS = validation.basic_checks(TEAM_STATS_SCHEMA) + (
+    Unique(('Team Name',)),
+    AtMost('Match Win Count', 'Match Count'),
+    AtMost('Game Win Count', 'Game Count'),
+    PerGame('Match Win Rate%', 'Match Win Count', 'Match Count', scale=100),
+    PerGame('Game Win Rate%', 'Game Win Count', 'Game Count', scale=100),
+    PerGame('Kills per Game', 'Total Kills', 'Game Count'),
+    PerGame('Deaths per Game', 'Total Deaths', 'Game Count'),
+    PerGame('Average Assists', 'Total Assists', 'Game Count'),
+    PerGame('Tower Destroyed Count per Game', 'Tower Destroyed Count', 'Game Count'),
+    PerGame('Cryoturtle Kill Count per Game', 'Cryoturtle Kill Count', 'Game Count'),
+    PerGame('Lord Kill Count per Game', 'Lord Kill Count', 'Game Count'),
+)
+
+TEAM_HERO_CHECKS = validation.basic_checks(TEAM_HERO_SCHEMA) + (
+    Unique(('Hero',)),
+    AtMost('Game Win Count', 'Pick Count'),
+    PerGame('Game Win Rate%', 'Game Win Count', 'Pick Count', scale=100),
+    KdaRatio('KDA'),
+)
+
+# Win rate meta hero dibulatkan ke bilangan bulat di sumber
+HERO_META_CHECKS = validation.basic_checks(HERO_META_SCHEMA) + (
+    Unique(('Hero',)),
+    AtMost('Win', 'Pick'),
+    PerGame('Win Rate%', 'Win', 'Pick', scale=100, decimals=0),
+)
+
+MATCH_HISTORY_CHECKS = validation.basic_checks(MATCH_HISTORY_SCHEMA) + (
+    Unique(('Match',)),
+    SumOf('Game_Played', ('Score_NAVI', 'Score_Opponent')),
+)
+
+JUNGLER_HERO_POOL_CHECKS = validation.basic_checks(JUNGLER_HERO_POOL_SCHEMA) + (
+    Unique(('Player ID', 'Hero')),
+    AtMost('Game Win Count', 'Game Count'),
+    PerGame('Game Win Rate%', 'Game Win Count', 'Game Count', scale=100),
+    PerGame('Kills per Game', 'Total Kills', 'Game Count'),
+    PerGame('Deaths per Game', 'Total Deaths', 'Game Count'),
+    PerGame('Assists per Game', 'Total Assists', 'Game Count'),
+    KdaRatio('KDA'),
+)
+
+
+@dataclass(frozen=True)
+class Dataset:
+    path: str
+    sep: str
+    schema: dict
+    key: str
+    encoding: str = 'utf-8'
+    checks: tuple = ()
+    # Nilai `key` yang barisnya dibaca langsung oleh halaman (musim berjalan); lihat `validation.read_csv`
+    required: tuple = ()
+
+
+DATASETS = {
+    'team_stats': Dataset('data/team_statistics.csv', ';', TEAM_STATS_SCHEMA, 'Team Name', encoding='utf-8-sig',
+                          checks=TEAM_STATS_CHECKS, required=('ONIC ID', 'NAVI')),
+    'navi_player_stats': Dataset('data/player_navi_statistics.csv', ';', PLAYER_STATS_SCHEMA, 'Player',
+                                 checks=PLAYER_STATS_CHECKS,
+                                 required=('Aether', 'Woshipaul', 'Karss', 'bq syaii', 'Febbb', 'Hanafi', 'Xyve',
+                                           'xMagic')),
+    'onic_player_stats': Dataset('data/player_onic_statistics.csv', ';', PLAYER_STATS_SCHEMA, 'Player',
+                                 checks=PLAYER_STATS_CHECKS,
+                                 required=('Kairi', 'Savero', 'S A N Z', 'Kiboy', 'Lutpiii')),
+    'navi_hero_stats': Dataset('data/navi_hero.csv', ';', TEAM_HERO_SCHEMA, 'Hero', checks=TEAM_HERO_CHECKS,
+                               required=('Kalea',)),
+    'onic_hero_stats': Dataset('data/onic_hero.csv', ';', TEAM_HERO_SCHEMA, 'Hero', checks=TEAM_HERO_CHECKS,
+                               required=('Badang',)),
+    'hero_stats': Dataset('data/hero_pick_ban_winrate.csv', ';', HERO_META_SCHEMA, 'Hero', checks=HERO_META_CHECKS,
+                          required=('Badang', 'Kalea')),
+    'navi_match_history': Dataset('data/navi_match_history_s15.csv', ',', MATCH_HISTORY_SCHEMA, 'Match',
+                                  checks=MATCH_HISTORY_CHECKS),
+    'jungler_stats': Dataset('data_jungler/statistics.csv', ',', JUNGLER_STATS_SCHEMA, 'Player',
+                             checks=JUNGLER_STATS_CHECKS),
+    'jungler_hero_pool': Dataset('data_jungler/hero_pool.csv', ',', JUNGLER_HERO_POOL_SCHEMA, 'Player ID',
+                                 checks=JUNGLER_HERO_POOL_CHECKS),
+}
+
+CURRENT_SEASON = 'S15'
+SEASONS_DIR = 'data/seasons'
+
+# Nama tim di team_statistics.csv -> kode file pemain/hero (player_<kode>_statistics.csv, <kode>_hero.csv)
+TEAM_CODES = {'ONIC ID': 'onic', 'NAVI': 'navi'}
+
+
+def team_code(team_name):
+    return TEAM_CODES.get(team_name) or re.sub(r'\W+', '_', team_name.strip().lower())
+
+
+def _season_order(season):
+    number = re.search(r'\d+', season)
+    return (int(number.group()) if number else -1, season)
+
+
+def list_seasons():
+    """Semua musim yang tersedia, urut dari yang paling lama."""
+    seasons = {CURRENT_SEASON}
+    seasons_dir = DATA_ROOT / SEASONS_DIR
+    if seasons_dir.is_dir():
+        seasons.update(p.name for p in seasons_dir.iterdir() if p.is_dir())
+    return sorted(seasons, key=_season_order)
+
+
+def dataset_spec(name, season=None):
+    """
+    Spesifikasi dataset `name` untuk `season`. Selain nama di DATASETS, nama
+    '<kode>_player_stats' dan '<kode>_hero_stats' dibentuk dari pola nama file tim.
+    """
+    if name in DATASETS:
+        spec = DATASETS[name]
+    elif name.endswith('_player_stats'):
+        spec = Dataset(f"data/player_{name[:-len('_player_stats')]}_statistics.csv", ';',
+                       PLAYER_STATS_SCHEMA, 'Player', checks=PLAYER_STATS_CHECKS)
+    elif name.endswith('_hero_stats'):
+        spec = Dataset(f"data/{name[:-len('_hero_stats')]}_hero.csv", ';', TEAM_HERO_SCHEMA, 'Hero',
+                       checks=TEAM_HERO_CHECKS)
+    else:
+        raise KeyError(name)
+    if season is not None and season != CURRENT_SEASON:
+        # Halaman hanya membaca baris tertentu secara langsung di musim berjalan
+        spec = replace(spec, path=f'{SEASONS_DIR}/{season}/{Path(spec.path).name}', required=())
+    return spec
+
+
+def has_dataset(name, season=None):
+    """True jika file sumber dataset `name` ada untuk `season`."""
+    return (DATA_ROOT / dataset_spec(name, season).path).exists()
+
+
+# --- KONVERSI CSV -> ARROW ---
+_ingest_locks = {}
+_ingest_locks_guard = threading.Lock()
+
+
+def _ingest_lock(source):
+    # Lock per file sumber: konversi ulang satu dataset tidak menahan dataset lain.
+    # Reentrant karena `publish` memegangnya selama ingest + muat + pasang versi baru
+    with _ingest_locks_guard:
+        return _ingest_locks.setdefault(source, threading.RLock())
+
+
+def _resolve(source):
+    source = Path(source)
+    return source if source.is_absolute() else DATA_ROOT / source
+
+
+def _file_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_paths(source):
+    # Nama file cache mengikuti path relatif sumber, misal data__team_statistics
+    try:
+        relative = source.relative_to(DATA_ROOT)
+    except ValueError:
+        relative = Path(hashlib.sha1(str(source.parent).encode()).hexdigest()[:12]) / source.name
+    stem = '__'.join(relative.with_suffix('').parts)
+    return CACHE_DIR / f'{stem}.arrow', CACHE_DIR / f'{stem}.json'
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _read_options_key(sep, schema, encoding, sort_key, checks, required):
+    # Perubahan skema/opsi baca/cek validasi juga harus memicu konversi ulang
+    # 'batches' menandai tata letak file (satu record batch), agar cache lama dikonversi ulang
+    options = json.dumps({'sep': sep, 'schema': schema, 'encoding': encoding, 'sort_key': sort_key,
+                          'checks': [repr(check) for check in checks], 'required': list(required), 'batches': 1},
+                         sort_keys=True)
+    return hashlib.sha1(options.encode()).hexdigest()
+
+
+# File sumber yang ditolak validasi -> (mtime_ns, ukuran, opsi, error), agar versi
+# yang sama tidak di-hash dan divalidasi ulang di setiap pemanggilan
+_rejected = {}
+
+
+def ingest(source, sep=',', schema=None, encoding='utf-8', sort_key=None, checks=(), required=()):
+    """
+    Mengonversi CSV ke Arrow IPC bila belum ada atau sumbernya berubah.
+    File divalidasi dulu (`validation.read_csv`): baris yang gagal `checks`
+    dikarantina ke QUARANTINE_DIR dan laporannya disimpan di metadata cache;
+    file yang ditolak melempar `validation.ValidationError` dan cache lama tidak diubah.
+    `required`: nilai kolom `sort_key` yang barisnya wajib ada dan lolos validasi.
+    Jika kolom `sort_key` tidak unik, baris disimpan terurut (stabil) menurut
+    kolom itu agar `index_by` tidak perlu menyalin frame untuk mengurutkannya.
+    Mengembalikan path file kolumnar dan hash SHA-256 file sumber.
+    """
+    source = _resolve(source)
+    stat = source.stat()  # FileNotFoundError diteruskan ke pemanggil
+    target, meta_path = _cache_paths(source)
+    options_key = _read_options_key(sep, schema, encoding, sort_key, checks, required)
+
+    with _ingest_lock(source):
+        rejected = _rejected.get(source)
+        if rejected is not None and rejected[:3] == (stat.st_mtime_ns, stat.st_size, options_key):
+            raise rejected[3]
+        meta = _read_meta(meta_path)
+        digest = None
+        if meta is not None and target.exists() and meta.get('options') == options_key:
+            if meta['mtime_ns'] == stat.st_mtime_ns and meta['size'] == stat.st_size:
+                return target, meta['sha256']
+            # mtime berubah tapi isi bisa saja sama (misal file hanya di-touch / di-copy ulang)
+            digest = _file_hash(source)
+            if digest == meta['sha256']:
+                meta.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                atomic_write(meta_path, lambda p: p.write_text(json.dumps(meta), encoding='utf-8'))
+                return target, digest
+
+        if digest is None:
+            digest = _file_hash(source)
+        with instrumentation.span('parse', source.name):
+            try:
+                df, report, quarantined = validation.read_csv(source, sep, schema, encoding, checks, sort_key, required)
+            except validation.ValidationError as e:
+                _rejected[source] = (stat.st_mtime_ns, stat.st_size, options_key, e)
+                raise
+            _rejected.pop(source, None)
+            if sort_key is not None and not df[sort_key].is_unique:
+                df = df.sort_values(sort_key, kind='stable')
+            table = pa.Table.from_pandas(df, preserve_index=False)
+
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Tanpa kompresi dan dalam satu record batch supaya kolom bisa dibaca langsung
+            # lewat memory-map (beberapa batch harus disambung = disalin saat konversi ke pandas)
+            atomic_write(target, lambda p: feather.write_feather(table, p, compression='uncompressed',
+                                                                 chunksize=max(len(table), 1)))
+            _write_quarantine(target, quarantined, report)
+        meta = {'source': str(source), 'options': options_key, 'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size, 'sha256': digest, 'validation': report}
+        atomic_write(meta_path, lambda p: p.write_text(json.dumps(meta), encoding='utf-8'))
+    return target, digest
+
+
+def _write_quarantine(target, quarantined, report):
+    path = QUARANTINE_DIR / f'{target.stem}.csv'
+    if quarantined.empty:
+        path.unlink(missing_ok=True)
+        return
+    QUARANTINE_DIR.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, lambda p: quarantined.to_csv(p, index=False))
+    report['quarantine_file'] = str(path)
+
+
+def _ingest_spec(spec):
+    return ingest(spec.path, spec.sep, spec.schema, spec.encoding, spec.key, spec.checks, spec.required)
+
+
+def validation_report(name, season=None):
+    """
+    Laporan validasi versi file sumber `name` saat ini (lihat `validation.read_csv`).
+    Melempar `validation.ValidationError` jika file ditolak.
+    """
+    spec = dataset_spec(name, season)
+    _ingest_spec(spec)
+    meta = _read_meta(_cache_paths(_resolve(spec.path))[1])
+    return meta.get('validation') if meta is not None else None
+
+
+def read_mapped(path):
+    """
+    DataFrame dari file Arrow IPC yang di-memory-map. Kolom numerik tanpa
+    nilai kosong menjadi view read-only langsung ke halaman file (tanpa
+    salinan), sehingga dipakai bersama oleh semua proses yang membaca file
+    yang sama lewat page cache OS; kolom teks tetap dikonversi ke objek Python.
+    """
+    return _read_mapped(path)[1]
+
+
+def _read_mapped(path):
+    # Buffer seluruh file; tabel Arrow di atasnya hanya berupa potongan buffer ini
+    buffer = pa.memory_map(str(path)).read_buffer()
+    table = feather.read_table(pa.BufferReader(buffer))
+    # split_blocks: satu blok per kolom, agar pandas tidak menggabungkan (menyalin) kolom bertipe sama
+    return buffer, table.to_pandas(split_blocks=True)
+
+
+def _load_frame(name, season, path, key):
+    buffer, df = _read_mapped(path)
+    df = index_by(df, key)
+    _mapped[(name, season)] = (buffer, df)
+    return df
+
+
+# --- CACHE PROSES ---
+_frames = {}
+_frames_lock = threading.RLock()
+
+# (nama, musim) -> (buffer file ter-memory-map, DataFrame) terakhir yang dimuat, untuk `memory_report`
+_mapped = {}
+
+
+def get_or_build(key, version, build):
+    """
+    Mengembalikan objek ter-cache untuk `key` selama `version` sama,
+    atau memanggil `build()` sekali lalu menyimpannya.
+    """
+    entry = _frames.get(key)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    with _frames_lock:
+        entry = _frames.get(key)
+        if entry is None or entry[0] != version:
+            label = '/'.join(part for part in key[1:] if isinstance(part, str))
+            with instrumentation.span('dataset' if key[0] == 'dataset' else 'derived', label):
+                entry = (version, build())
+            _frames[key] = entry
+    return entry[1]
+
+
+# --- VERSI TERPUBLIKASI (HOT RELOAD) ---
+# (nama, musim) -> (hash, DataFrame). Pasangan disimpan dalam satu tuple agar
+# pembaca tidak pernah melihat hash baru dengan frame lama (atau sebaliknya).
+_published = {}
+
+# Diaktifkan `watcher`: dataset dipublikasikan saat pertama kali dimuat, lalu
+# hanya dimuat ulang oleh watcher ketika filenya berubah
+_publish_on_load = False
+
+
+def publish_on_load(enabled=True):
+    global _publish_on_load
+    _publish_on_load = enabled
+
+
+def loaded_datasets():
+    """(nama, musim) semua dataset yang sudah dimuat atau dipublikasikan di proses ini."""
+    loaded = {(key[1], key[2]) for key in list(_frames) if key[0] == 'dataset'}
+    return loaded | set(_published)
+
+
+def publish(name, season=None):
+    """
+    Mengonversi ulang dataset `name` jika berubah, memuatnya, lalu menukar versi
+    yang dipakai semua sesi secara atomik. Mengembalikan hash versi aktif.
+    """
+    season = season or CURRENT_SEASON
+    spec = dataset_spec(name, season)
+    # Sesi (lewat `load`) dan watcher bisa mempublikasikan dataset yang sama bersamaan:
+    # ingest, muat dan pasang dilakukan di bawah lock file sumber, sehingga penulis yang
+    # lebih lambat tidak pernah memasang frame lama atau hash yang tidak cocok dengan frame-nya
+    with _ingest_lock(_resolve(spec.path)):
+        path, digest = _ingest_spec(spec)
+        current = _published.get((name, season))
+        if current is not None and current[0] == digest:
+            return digest
+        frame = _load_frame(name, season, path, spec.key)
+        _published[(name, season)] = (digest, frame)
+        # Frame versi lama di cache proses tidak dipakai lagi
+        _frames.pop(('dataset', name, season), None)
+    return digest
+
+
+def published_version(name, season=None):
+    """Hash versi yang sedang dipublikasikan, atau None jika dataset dibaca dari file."""
+    published = _published.get((name, season or CURRENT_SEASON))
+    return published[0] if published is not None else None
+
+
+def unpublish(name, season=None):
+    """Kembali membaca dataset dari file (misal setelah file sumber dihapus)."""
+    _published.pop((name, season or CURRENT_SEASON), None)
+
+
+def dataset_version(name, season=None):
+    """Hash isi file sumber dataset (memicu konversi jika file berubah)."""
+    published = _published.get((name, season or CURRENT_SEASON))
+    if published is not None:
+        return published[0]
+    spec = dataset_spec(name, season)
+    _, digest = _ingest_spec(spec)
+    return digest
+
+
+def data_version(*names):
+    """Versi gabungan beberapa dataset, dipakai sebagai kunci cache tabel turunan."""
+    digest = hashlib.sha1()
+    for name in names:
+        digest.update(dataset_version(name).encode())
+    return digest.hexdigest()[:16]
+
+
+def index_by(df, key):
+    """
+    Memasang kolom `key` sebagai index (tanpa nama, kolomnya tetap ada).
+    Kunci yang tidak unik diurutkan agar `loc` memakai pencarian biner, bukan scan.
+    """
+    if not df[key].is_unique and not df[key].is_monotonic_increasing:
+        df = df.sort_values(key, kind='stable')
+    # Salinan dangkal: kolom tetap menunjuk ke data yang sama (set_index akan menyalin semua kolom)
+    df = df.copy(deep=False)
+    index = pd.Index(df[key])
+    index.name = None
+    df.index = index
+    return df
+
+
+def lookup_rows(df, key):
+    """Semua baris dengan label index `key`, atau DataFrame kosong jika tidak ada."""
+    if key not in df.index:
+        return df.iloc[0:0]
+    return df.loc[[key]]
+
+
+def load(name, season=None):
+    """Memuat satu dataset sesuai skemanya, dibagi bersama oleh semua sesi."""
+    published = _published.get((name, season or CURRENT_SEASON))
+    if published is not None:
+        return published[1]
+    if _publish_on_load:
+        publish(name, season)
+        return _published[(name, season or CURRENT_SEASON)][1]
+    spec = dataset_spec(name, season)
+    path, digest = _ingest_spec(spec)
+    season = season or CURRENT_SEASON
+    return get_or_build(('dataset', name, season), digest, lambda: _load_frame(name, season, path, spec.key))
+
+
+# --- LAPORAN MEMORI ---
+def _column_bytes(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.nbytes
+    return series.memory_usage(index=False, deep=True)
+
+
+def memory_report():
+    """
+    Pemakaian memori setiap dataset yang sedang dimuat: byte kolom yang berupa
+    view ke file ter-memory-map (dibagi bersama antar sesi dan proses) dan
+    byte di heap proses (kolom teks/kategori, index, dan kolom yang terpaksa
+    disalin, misal bilangan bulat yang berisi nilai kosong).
+    """
+    rows = []
+    for (name, season), (buffer, df) in list(_mapped.items()):
+        mapped = np.frombuffer(buffer, dtype=np.uint8)
+        shared = private = 0
+        for col in df.columns:
+            series = df[col]
+            if pd.api.types.is_numeric_dtype(series.dtype) and np.may_share_memory(series.to_numpy(), mapped):
+                shared += _column_bytes(series)
+            else:
+                private += _column_bytes(series)
+        # Tanpa deep: objek teks index adalah objek yang sama dengan kolom kuncinya
+        private += df.index.memory_usage()
+        rows.append({'Dataset': name, 'Season': season, 'Rows': len(df),
+                     'Shared MB': shared / 1e6, 'Private MB': private / 1e6})
+    return pd.DataFrame(rows, columns=['Dataset', 'Season', 'Rows', 'Shared MB', 'Private MB'])
+
+
+# --- PEMUAT PER DATASET ---
+def load_team_stats(season=None):
+    return load('team_stats', season)
+
+
+def load_player_stats(team, season=None):
+    """Statistik pemain per tim, `team` = kode tim (misal 'navi', 'onic')."""
+    return load(f'{team}_player_stats', season)
+
+
+def load_team_heroes(team, season=None):
+    """Statistik hero per tim, `team` = kode tim (misal 'navi', 'onic')."""
+    return load(f'{team}_hero_stats', season)
+
+
+def load_hero_stats(season=None):
+    return load('hero_stats', season)
+
+
+def load_match_history():
+    return load('navi_match_history')
+
+
+def load_jungler_hero_pool():
+    return load('jungler_hero_pool')
+
+
+def load_jungler_stats():
+    """Statistik jungler yang pernah bermain (Games Played > 0) + kolom metrik per game."""
+    def build():
+        stats_df = load('jungler_stats')
+        stats_df = stats_df[stats_df['Games Played'] > 0].copy()
+
+        # --- Feature Engineering ---
+        stats_df['Turtles per Game'] = stats_df['Cryoturtle Secured'] / stats_df['Games Played']
+        stats_df['Lords per Game'] = stats_df['Lord Secured'] / stats_df['Games Played']
+        stats_df['Towers per Game'] = stats_df['Towers Secured'] / stats_df['Games Played']
+        stats_df['First Blood Rate'] = stats_df['First Blood'] / stats_df['Games Played']
+        # Tanpa pengganti inf: Games Played > 0 di sini, dan nilai negatif/non-angka sudah dikarantina saat ingest
+        return stats_df
+
+    return get_or_build(('derived', 'jungler_stats'), dataset_version('jungler_stats'), build)
@@ -0,0 +1,147 @@
+"""
+Asisten draft: peringkat hero yang masih tersedia untuk pick/ban berikutnya.
+
+Skor setiap hero adalah jumlah berbobot beberapa komponen bernilai 0..1:
+- meta: win rate hero di seluruh liga (hero_pick_ban_winrate.csv), dihaluskan
+  ke rata-rata liga agar hero yang jarang dimainkan tidak ekstrem
+- comfort: seberapa sering tim memakai hero (Pick Count relatif terhadap hero
+  terbanyak tim tersebut)
+- team_wr: win rate tim dengan hero tersebut, dihaluskan ke win rate meta
+- ban_risk: seberapa sering lawan mem-ban hero itu melawan tim (Enemy Ban
+  Rate%), artinya hero tersebut perlu diamankan selagi tersedia
+- deny: comfort lawan dengan hero tersebut (pick sekaligus menolak hero lawan)
+
+Komponen disimpan sebagai matriks NumPy (tim x hero) yang dibangun sekali per
+versi data untuk semua tim yang punya tabel hero; satu langkah draft hanya
+berupa penjumlahan vektor, masking hero yang sudah di-pick/ban, dan
+argpartition. Rekomendasi ban = rekomendasi pick dari sudut pandang lawan.
+"""
+import numpy as np
+import pandas as pd
+
+import data_store
+
+COMPONENTS = ['meta', 'comfort', 'team_wr', 'ban_risk', 'deny']
+
+COMPONENT_LABELS = {
+    'meta': 'Win rate meta',
+    'comfort': 'Comfort tim (pick)',
+    'team_wr': 'Win rate tim',
+    'ban_risk': 'Sering di-ban lawan',
+    'deny': 'Comfort lawan (deny)',
+}
+
+DEFAULT_WEIGHTS = {'meta': 0.35, 'comfort': 0.25, 'team_wr': 0.2, 'ban_risk': 0.1, 'deny': 0.1}
+
+# Kekuatan penghalusan (jumlah game "semu") untuk win rate meta dan win rate tim
+META_PRIOR_GAMES = 10
+TEAM_PRIOR_GAMES = 3
+
+
+def _smoothed_rate(wins, games, prior, prior_games):
+    return (wins + prior * prior_games) / (games + prior_games)
+
+
+class DraftModel:
+    """Matriks komponen skor draft untuk satu musim (dibangun lewat `draft_model`)."""
+
+    def __init__(self, heroes, teams, meta, components):
+        self.heroes = heroes
+        self.teams = teams
+        self.meta = meta
+        self.components = components
+        self._hero_pos = pd.Index(heroes)
+        self._team_pos = {team: i for i, team in enumerate(teams)}
+
+    def team_index(self, team):
+        if team not in self._team_pos:
+            raise KeyError(f"Tidak ada tabel hero untuk tim {team}")
+        return self._team_pos[team]
+
+    def scores(self, team, opponent, weights=None):
+        """Skor semua hero untuk `team` melawan `opponent`; juga mengembalikan kontribusi per komponen."""
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        t, o = self.team_index(team), self.team_index(opponent)
+        parts = {
+            'meta': self.meta,
+            'comfort': self.components['comfort'][t],
+            'team_wr': self.components['team_wr'][t],
+            'ban_risk': self.components['ban_risk'][t],
+            'deny': self.components['comfort'][o],
+        }
+        contributions = np.stack([weights[name] * parts[name] for name in COMPONENTS])
+        return contributions.sum(axis=0), contributions
+
+    def recommend(self, team, opponent, unavailable=(), n=10, weights=None):
+        """
+        `n` hero terbaik untuk di-pick `team` melawan `opponent`, tanpa hero di
+        `unavailable` (sudah di-pick atau di-ban). Index = Hero, kolom Skor +
+        kontribusi setiap komponen.
+        """
+        total, contributions = self.scores(team, opponent, weights)
+        taken = self._hero_pos.get_indexer(list(unavailable))
+        total = total.copy()
+        total[taken[taken >= 0]] = -np.inf
+
+        available = np.count_nonzero(np.isfinite(total))
+        n = min(n, available)
+        top = np.argpartition(-total, n - 1)[:n] if n else np.array([], dtype='int64')
+        top = top[np.argsort(-total[top], kind='stable')]
+        result = pd.DataFrame(contributions[:, top].T, index=self.heroes[top], columns=COMPONENTS)
+        result.insert(0, 'Skor', total[top])
+        result.index.name = 'Hero'
+        return result
+
+    def recommend_bans(self, team, opponent, unavailable=(), n=10, weights=None):
+        """Hero yang paling berbahaya jika dipick `opponent` = kandidat ban untuk `team`."""
+        return self.recommend(opponent, team, unavailable, n, weights)
+
+
+def _team_hero_datasets(season):
+    """Tim di `season` yang punya tabel hero -> nama datasetnya."""
+    datasets = {}
+    for team in data_store.load_team_stats(season)['Team Name']:
+        name = f'{data_store.team_code(team)}_hero_stats'
+        if data_store.has_dataset(name, season):
+            datasets[team] = name
+    return datasets
+
+
+def _build(season, datasets):
+    meta_df = data_store.load_hero_stats()
+    teams = list(datasets)
+    tables = [data_store.load(name, season) for name in datasets.values()]
+
+    heroes = pd.Index(meta_df['Hero']).append(
+        pd.Index([hero for table in tables for hero in table['Hero']])).unique()
+    n_teams, n_heroes = len(teams), len(heroes)
+
+    # Win rate meta dihaluskan ke rata-rata liga; hero tanpa data meta = rata-rata liga
+    picks = meta_df['Pick'].reindex(heroes, fill_value=0).to_numpy(dtype='float64')
+    wins = meta_df['Win'].reindex(heroes, fill_value=0).to_numpy(dtype='float64')
+    league_rate = wins.sum() / picks.sum() if picks.sum() else 0.5
+    meta = _smoothed_rate(wins, picks, league_rate, META_PRIOR_GAMES)
+
+    comfort = np.zeros((n_teams, n_heroes))
+    team_wr = np.tile(meta, (n_teams, 1))
+    ban_risk = np.zeros((n_teams, n_heroes))
+    for i, table in enumerate(tables):
+        cols = heroes.get_indexer(table['Hero'])
+        pick_count = table['Pick Count'].to_numpy(dtype='float64')
+        if len(pick_count) and pick_count.max() > 0:
+            comfort[i, cols] = pick_count / pick_count.max()
+        team_wr[i, cols] = _smoothed_rate(table['Game Win Count'].to_numpy(dtype='float64'), pick_count,
+                                          meta[cols], TEAM_PRIOR_GAMES)
+        ban_risk[i, cols] = table['Enemy Ban Rate%'].to_numpy(dtype='float64') / 100
+
+    return DraftModel(heroes.to_numpy(), teams, meta,
+                      {'comfort': comfort, 'team_wr': team_wr, 'ban_risk': np.clip(ban_risk, 0, 1)})
+
+
+def draft_model(season=None):
+    """`DraftModel` untuk `season`, dibangun sekali per versi data hero (meta + semua tabel hero tim)."""
+    season = season or data_store.CURRENT_SEASON
+    datasets = _team_hero_datasets(season)
+    version = '|'.join([data_store.dataset_version('hero_stats'), data_store.dataset_version('team_stats', season)] +
+                       [data_store.dataset_version(name, season) for name in datasets.values()])
+    return data_store.get_or_build(('derived', 'draft_model', season), version, lambda: _build(season, datasets))
@@ -0,0 +1,174 @@
+"""
+Ekspor tabel ke CSV, Parquet, dan Excel untuk tombol download dashboard.
+
+File ditulis per potongan baris (CHUNK_ROWS) langsung ke buffer bytes, jadi
+tidak ada string CSV utuh yang dibangun lalu di-encode ulang. Hasilnya tetap
+disimpan utuh di memori: `st.download_button` selalu menyerahkan bytes utuh
+ke media manager Streamlit (tanpa streaming), jadi file sementara di disk
+tidak menghemat memori. Pemakaian memori dibatasi oleh MAX_BYTES.
+
+Hasil ekspor di-cache per (tabel, versi data, format), bukan per isi
+DataFrame, jadi tidak ada hashing frame di setiap rerun; satu objek bytes
+dipakai bersama oleh semua sesi dan rerun. Cache memakai LRU dengan batas
+total ukuran, dan versi lama sebuah tabel langsung dibuang begitu versi baru
+diekspor.
+
+Excel memakai `xlsxwriter` (lihat requirements.txt) atau `openpyxl`; jika
+keduanya tidak terpasang, format Excel tidak ditawarkan.
+"""
+import importlib.util
+import io
+
+import pandas as pd
+import streamlit as st
+
+import instrumentation
+from caching import BoundedLRU
+
+CHUNK_ROWS = 50_000
+
+# Batas total ukuran semua file ekspor yang disimpan di memori
+MAX_BYTES = 64 * 1024 * 1024
+
+EXCEL_MAX_ROWS = 1_048_575
+
+# Format -> (ekstensi, MIME type)
+FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'Excel': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+
+
+def _excel_engine():
+    for engine in ('xlsxwriter', 'openpyxl'):
+        if importlib.util.find_spec(engine) is not None:
+            return engine
+    return None
+
+
+def available_formats():
+    return [fmt for fmt in FORMATS if fmt != 'Excel' or _excel_engine() is not None]
+
+
+# --- PENULIS PER FORMAT ---
+def _chunks(df):
+    for start in range(0, len(df), CHUNK_ROWS):
+        yield df.iloc[start:start + CHUNK_ROWS]
+
+
+def _write_csv(df, out, float_format=None):
+    text = io.TextIOWrapper(out, encoding='utf-8', newline='')
+    df.iloc[:0].to_csv(text, index=False)
+    for chunk in _chunks(df):
+        chunk.to_csv(text, header=False, index=False, float_format=float_format)
+    text.flush()
+    # Lepas wrapper tanpa menutup file di bawahnya
+    text.detach()
+
+
+def _write_parquet(df, out, float_format=None):
+    # Di-import saat dipakai: pyarrow.parquet tidak perlu dimuat hanya untuk menampilkan panel
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(out, schema) as writer:
+        for chunk in _chunks(df):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def _write_excel(df, out, float_format=None):
+    if len(df) > EXCEL_MAX_ROWS:
+        raise ValueError(f"Excel maksimal {EXCEL_MAX_ROWS:,} baris; gunakan CSV atau Parquet")
+    with pd.ExcelWriter(out, engine=_excel_engine()) as writer:
+        df.iloc[:0].to_excel(writer, index=False)
+        for i, chunk in enumerate(_chunks(df)):
+            chunk.to_excel(writer, index=False, header=False, startrow=1 + i * CHUNK_ROWS)
+
+
+WRITERS = {'CSV': _write_csv, 'Parquet': _write_parquet, 'Excel': _write_excel}
+
+
+def write(df, fmt, out, float_format=None):
+    """Menulis `df` (tanpa index) ke file biner `out` dalam format `fmt`."""
+    WRITERS[fmt](df, out, float_format)
+
+
+# --- CACHE FILE EKSPOR ---
+class Artifact:
+    """Satu file hasil ekspor; objek bytes yang sama dipakai semua sesi dan rerun."""
+
+    def __init__(self, data, fmt):
+        self.data = data
+        self.size = len(data)
+        self.extension, self.mime = FORMATS[fmt]
+
+    def read(self):
+        return self.data
+
+
+class ExportCache:
+    def __init__(self, max_bytes=MAX_BYTES):
+        self._artifacts = BoundedLRU(max_bytes, lambda artifact: artifact.size)
+
+    def get_or_build(self, key, version, fmt, build, float_format=None):
+        """`Artifact` untuk tabel `key` pada `version`; `build()` (mengembalikan DataFrame) hanya dipanggil saat miss."""
+        cache_key = (key, version, fmt)
+        artifact = self._artifacts.get(cache_key)
+        if artifact is not None:
+            return artifact
+
+        # Ekspor di luar lock agar download tabel lain tidak ikut menunggu
+        label = '/'.join(map(str, key))
+        with instrumentation.span('export', f'{label}.{fmt}'):
+            df = build()
+            out = io.BytesIO()
+            write(df, fmt, out, float_format)
+            artifact = Artifact(out.getvalue(), fmt)
+
+        # Versi lama tabel yang sama tidak akan diminta lagi
+        return self._artifacts.put(cache_key, artifact, discard=lambda k: k[0] == key and k[2] == fmt)
+
+    def clear(self):
+        self._artifacts.clear()
+
+    def stats(self):
+        return self._artifacts.stats()
+
+
+_cache = ExportCache()
+
+
+# --- PANEL DOWNLOAD STREAMLIT ---
+@st.fragment
+def download_panel(key, version, build, file_stem, float_format=None):
+    """
+    Pilihan format + tombol download untuk satu tabel. File baru dibuat saat
+    tombol "Siapkan" ditekan (atau diambil dari cache untuk versi ini), dan
+    panel berjalan sebagai fragment sehingga interaksinya tidak menjalankan
+    ulang seluruh halaman.
+    """
+    col1, col2 = st.columns([1, 3], vertical_alignment='bottom')
+    fmt = col1.selectbox("Format", available_formats(), key=f'export_{file_stem}_format',
+                         label_visibility='collapsed')
+    ready_key = f'export_{file_stem}_ready'
+    if st.session_state.get(ready_key) != (version, fmt):
+        if not col2.button(f"📦 Siapkan {fmt}", key=f'export_{file_stem}_prepare'):
+            return
+        st.session_state[ready_key] = (version, fmt)
+
+    try:
+        artifact = _cache.get_or_build(key, version, fmt, build, float_format)
+    except ValueError as e:
+        col2.error(str(e))
+        return
+    col2.download_button(
+        label=f"📥 Download {fmt}",
+        data=artifact.read(),
+        file_name=f'{file_stem}.{artifact.extension}',
+        mime=artifact.mime,
+        key=f'export_{file_stem}_download',
+        # Klik download tidak perlu menjalankan ulang fragment (dan menyerahkan file lagi)
+        on_click='ignore',
+    )
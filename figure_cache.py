@@ -0,0 +1,164 @@
+"""
+Cache figure Plotly yang sudah diserialisasi, dipakai bersama oleh semua sesi.
+
+Input setiap grafik tetap selama versi datanya sama, jadi figure cukup dibuat
+sekali: kuncinya (halaman, id grafik, versi data, parameter) dan nilainya dict
+spec figure yang sudah di-parse. Cache memakai LRU dengan batas total ukuran
+(byte, dihitung dari panjang JSON spec), sehingga kombinasi tim/musim/pemain
+yang banyak tidak membuat memori terus bertambah. Pada hit, halaman langsung
+menerima dict spec tanpa melt/nlargest, konstruksi plotly.express, maupun
+json.loads.
+
+Spec juga disimpan di disk (`.cache/figures/`, bisa diganti lewat
+MLBB_FIGURE_DIR), sehingga proses yang baru dinyalakan (cold start) membaca
+spec yang sudah jadi tanpa meng-import plotly.express sama sekali. Kunci file
+menyertakan hash kode aplikasi dan versi plotly, jadi perubahan kode grafik
+tidak pernah menyajikan figure lama.
+"""
+import copy
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import instrumentation
+from caching import BoundedLRU, atomic_write
+
+BASE_DIR = Path(__file__).resolve().parent
+FIGURE_DIR = Path(os.environ.get('MLBB_FIGURE_DIR', BASE_DIR / '.cache' / 'figures'))
+
+# Batas total ukuran spec JSON yang disimpan
+MAX_BYTES = 32 * 1024 * 1024
+MAX_DISK_BYTES = 256 * 1024 * 1024
+
+
+# --- CACHE DISK ---
+_code_version = None
+
+
+def code_version():
+    """Hash semua modul Python aplikasi + versi plotly, dihitung sekali per proses."""
+    global _code_version
+    if _code_version is None:
+        from importlib.metadata import version
+
+        digest = hashlib.sha1(version('plotly').encode())
+        for path in sorted(BASE_DIR.glob('*.py')):
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+class DiskStore:
+    def __init__(self, directory=FIGURE_DIR, max_bytes=MAX_DISK_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        # Total ukuran folder dihitung sekali (scan pertama), lalu dijaga di memori;
+        # folder hanya di-scan ulang saat total melewati batas
+        self._total = None
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        name = json.dumps([code_version(), key], default=str)
+        return self.directory / f'{hashlib.sha1(name.encode()).hexdigest()}.json'
+
+    def get(self, key):
+        try:
+            return self._path(key).read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, spec):
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                if self._total is None:
+                    self._total = sum(size for _, size in self._files())
+                old_size = path.stat().st_size if path.exists() else 0
+                atomic_write(path, lambda p: p.write_text(spec, encoding='utf-8'))
+                self._total += path.stat().st_size - old_size
+                if self._total > self.max_bytes:
+                    self._prune()
+        except OSError:
+            # Disk penuh / read-only: cache memori tetap berjalan
+            pass
+
+    def _files(self):
+        """(path, ukuran) semua file spec, urut dari yang paling lama ditulis."""
+        files = []
+        for path in self.directory.glob('*.json'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Baru dihapus proses lain
+                continue
+            files.append((stat.st_mtime, path, stat.st_size))
+        return [(path, size) for _, path, size in sorted(files)]
+
+    def _prune(self):
+        # File yang paling lama tidak ditulis dibuang lebih dulu; scan ulang juga menyerap
+        # file yang ditulis proses lain sejak scan terakhir
+        files = self._files()
+        self._total = sum(size for _, size in files)
+        for path, size in files[:-1]:
+            if self._total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._total -= size
+
+
+# --- CACHE MEMORI ---
+class FigureCache:
+    def __init__(self, max_bytes=MAX_BYTES, disk=None):
+        self.disk = disk
+        # Nilai: (dict spec, panjang JSON-nya); JSON hanya disimpan di tier disk
+        self._specs = BoundedLRU(max_bytes, lambda entry: entry[1])
+
+    def get_or_build(self, key, build):
+        """Dict spec untuk `key`; `build()` (mengembalikan Figure) hanya dipanggil saat miss."""
+        entry = self._specs.get(key)
+        if entry is not None:
+            return entry[0]
+
+        # Figure dibuat di luar lock agar grafik lain tidak ikut menunggu
+        label = '/'.join(map(str, key[:2]))
+        spec = self.disk.get(key) if self.disk is not None else None
+        if spec is None:
+            import plotly.io as pio
+
+            with instrumentation.span('chart', label):
+                figure = build()
+            with instrumentation.span('serialize', label):
+                spec = pio.to_json(figure, validate=False)
+            if self.disk is not None:
+                self.disk.put(key, spec)
+        return self._specs.put(key, (json.loads(spec), len(spec)))[0]
+
+    def clear(self):
+        self._specs.clear()
+
+    def stats(self):
+        return self._specs.stats()
+
+
+_cache = FigureCache(disk=DiskStore())
+
+
+def get_figure(page, chart_id, version, build, **params):
+    """
+    Figure (sebagai dict spec, bisa langsung diberikan ke `st.plotly_chart`)
+    untuk satu grafik. `version` adalah versi data input (lihat
+    `data_store.dataset_version`), `params` semua pilihan yang mengubah grafik.
+    Yang dikembalikan salinan penuh, jadi pemanggil boleh mengubahnya tanpa
+    merusak spec yang dipakai bersama semua sesi.
+    """
+    key = (page, chart_id, version, tuple(sorted(params.items())))
+    return copy.deepcopy(_cache.get_or_build(key, build))
+
+
+def stats():
+    """Jumlah entri, total byte, hit dan miss cache figure."""
+    return _cache.stats()
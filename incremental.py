@@ -0,0 +1,610 @@
+"""
+Pemeliharaan agregat secara inkremental saat match baru ditambahkan.
+
+Alih-alih membuat ulang `team_statistics.csv` dan `player_*_statistics.csv`
+dari seluruh riwayat, modul ini menyimpan running total per tim dan per pemain
+di file state kecil (Arrow + JSON di `.cache/incremental/<musim>/`). Satu
+match baru = satu baris berbentuk `navi_match_history_s15.csv` + baris
+statistik per pemain per game; hanya total tim/pemain yang terlibat yang
+diperbarui (O(baris baru)), lalu kolom turunan (per game, win rate, control
+rate, share) dihitung ulang untuk baris tersebut saja.
+
+Menulis hasilnya tidak O(baris baru): CSV tim dan CSV pemain yang terlibat
+dibaca, diperbarui, dan ditulis ulang utuh agar dashboard memuatnya seperti
+biasa, dan `data_store` lalu meng-hash dan mengonversi ulang file tersebut.
+Karena itu `append_matches` memproses sekumpulan match sekaligus dan menulis
+setiap CSV sekali per batch, bukan sekali per match. Baris header asli
+(termasuk nama kolom ganda) dan akhir file sumber ditulis kembali apa adanya,
+dan semua file ditulis lewat `caching.atomic_write` agar watcher tidak pernah
+membaca file setengah jadi.
+
+State awal dibentuk dari CSV yang ada dengan membalik kolom rata-rata/share
+menjadi total. Metrik yang di sumbernya merupakan rata-rata per game (KDA tim,
+Kill Participation tim, Damage/Gold%) disimpan sebagai jumlah nilai per game.
+Jika CSV diubah di luar modul ini, state dibentuk ulang otomatis.
+
+Contoh:
+    python incremental.py append match_17.json match_18.json
+    python incremental.py seed --season S15
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+import data_store
+from caching import atomic_write
+
+STATE_DIR = data_store.DATA_ROOT / '.cache' / 'incremental'
+
+# Kolom statistik per pemain per game (input; Win bernilai bool); kolom yang tidak ada dianggap 0
+LINE_STATS = [
+    'Kills', 'Deaths', 'Assists', 'Gold', 'Exp', 'Damage', 'Building Damage', 'Damage Taken',
+    'Control time/s', 'Heal', 'Legendary', 'Savage', 'Maniac', 'Triple Kill', 'Double Kill', 'First Blood',
+    'Towers Secured', 'Cryoturtle Secured', 'Lord Secured',
+]
+LINE_COLUMNS = ['Game', 'Player', 'Player No.', 'Hero', 'Win', 'Game Time/s'] + LINE_STATS
+
+COUNTERS = ['Legendary', 'Savage', 'Maniac', 'Triple Kill', 'Double Kill', 'First Blood']
+
+# Running total yang disimpan di state
+TEAM_TOTALS = [
+    'Matches', 'Match Wins', 'Games', 'Game Wins', 'Time/s', 'Kills', 'Deaths', 'Assists',
+    'Gold', 'Damage', 'Building Damage', 'Damage Taken', *COUNTERS,
+    'Towers', 'Towers Lost', 'Turtles', 'Enemy Turtles', 'Lords', 'Enemy Lords',
+    'KDA Sum', 'KP Sum', 'Damage/min Sum', 'Damage Taken/min Sum', 'Towers/game Sum', 'Heroes',
+]
+PLAYER_TOTALS = [
+    'Matches', 'Match Wins', 'Games', 'Game Wins', 'Time/s', 'Kills', 'Deaths', 'Assists',
+    'Gold', 'Exp', 'Damage', 'Building Damage', 'Damage Taken', 'Control time/s', 'Heal', *COUNTERS,
+    'Towers Secured', 'Cryoturtle Secured', 'Lord Secured',
+    'Team Kills', 'Team Gold', 'Team Damage', 'Team Building Damage', 'Team Damage Taken',
+    'Gold/min Sum', 'Damage/min Sum', 'Damage Taken/min Sum', 'Damage/Gold Sum', 'DMG taken/Gold Sum', 'Heroes',
+]
+# Total yang diperbarui dengan max, bukan dijumlah
+MAX_TOTALS = ['Max Kills', 'Max Deaths', 'Max Assists']
+
+
+def _ratio(num, den, scale=1.0):
+    num, den = np.asarray(num, dtype='float64'), np.asarray(den, dtype='float64')
+    return np.round(np.divide(num * scale, den, out=np.zeros_like(num), where=den != 0), 2)
+
+
+# --- TOTAL -> KOLOM CSV ---
+def team_rows(totals):
+    """Kolom team_statistics.csv dari running total tim."""
+    t = totals
+    minutes = t['Time/s'] / 60
+    return pd.DataFrame({
+        'Match Count': t['Matches'], 'Match Win Count': t['Match Wins'],
+        'Match Win Rate%': _ratio(t['Match Wins'], t['Matches'], 100),
+        'Game Count': t['Games'], 'Game Win Count': t['Game Wins'],
+        'Game Win Rate%': _ratio(t['Game Wins'], t['Games'], 100),
+        'TIme per Game/s': _ratio(t['Time/s'], t['Games']),
+        'Total Kills': t['Kills'], 'Kills per Game': _ratio(t['Kills'], t['Games']),
+        'Highest kills in a single game': t['Max Kills'],
+        'Total Deaths': t['Deaths'], 'Deaths per Game': _ratio(t['Deaths'], t['Games']),
+        'Highest deaths in a single game': t['Max Deaths'],
+        'Total Assists': t['Assists'], 'Average Assists': _ratio(t['Assists'], t['Games']),
+        'Highest assists in a single game': t['Max Assists'],
+        'KDA': _ratio(t['KDA Sum'], t['Games']),
+        'Team Kill Participation%': _ratio(t['KP Sum'], t['Games']),
+        'Team Gold per Minute': _ratio(t['Gold'], minutes),
+        'Team Damage': t['Damage'], 'Team Damage per Minute': _ratio(t['Damage/min Sum'], t['Games']),
+        'Team Building Damage': t['Building Damage'],
+        'Team Damage Taken': t['Damage Taken'],
+        'Team Damage Taken per Minute': _ratio(t['Damage Taken/min Sum'], t['Games']),
+        'Heros Used': t['Heroes'], 'Lengendary': t['Legendary'],
+        'Savage': t['Savage'], 'Maniac': t['Maniac'], 'Triple Kill': t['Triple Kill'],
+        'Double Kill': t['Double Kill'], 'First Blood': t['First Blood'],
+        'FB Rate%': _ratio(t['First Blood'], t['Games'], 100).round(),
+        'Tower Destroy Count': t['Towers'], 'Tower Destroyed Count': t['Towers Lost'],
+        'Tower Destroy Count per Game': _ratio(t['Towers/game Sum'], t['Games']),
+        'Tower Destroyed Count per Game': _ratio(t['Towers Lost'], t['Games']),
+        'Cryoturtle Kill Count': t['Turtles'], 'Enemy Cryoturtle Kill Count': t['Enemy Turtles'],
+        'Cryoturtle Kill Count per Game': _ratio(t['Turtles'], t['Games']),
+        'Cryoturtle Control Rate%': _ratio(t['Turtles'], t['Turtles'] + t['Enemy Turtles'], 100),
+        'Lord Kill Count': t['Lords'], 'Enemy Cryoturtle Kill Count.1': t['Enemy Lords'],
+        'Lord Kill Count per Game': _ratio(t['Lords'], t['Games']),
+        'lord Control Rate%': _ratio(t['Lords'], t['Lords'] + t['Enemy Lords'], 100),
+    }, index=totals.index)
+
+
+def player_rows(totals):
+    """Kolom player_<kode>_statistics.csv dari running total pemain."""
+    t = totals
+    minutes = t['Time/s'] / 60
+    return pd.DataFrame({
+        'Matches Played': t['Matches'], 'Number of match wins': t['Match Wins'],
+        'Matches Win Ratio%': _ratio(t['Match Wins'], t['Matches'], 100),
+        'Games Played': t['Games'], 'Number of game wins': t['Game Wins'],
+        'Games Win Ratio%': _ratio(t['Game Wins'], t['Games'], 100),
+        'Total Kills': t['Kills'], 'Average Kills per game': _ratio(t['Kills'], t['Games']),
+        'Highest kill in a single game': t['Max Kills'],
+        'Total Deaths': t['Deaths'], 'Average Deaths': _ratio(t['Deaths'], t['Games']),
+        'Highest death in a single game': t['Max Deaths'],
+        'Total Assists': t['Assists'], 'Average Assists': _ratio(t['Assists'], t['Games']),
+        'Highest assists in a single game': t['Max Assists'],
+        'KDA Ratio': _ratio(t['Kills'] + t['Assists'], np.maximum(t['Deaths'], 1)),
+        'Kill Participation%': _ratio(t['Kills'] + t['Assists'], t['Team Kills'], 100),
+        'Total Gold': t['Gold'], 'Average Gold': _ratio(t['Gold'], t['Games']),
+        'Gold Per Minute': _ratio(t['Gold/min Sum'], t['Games']), 'Gold Share%': _ratio(t['Gold'], t['Team Gold'], 100),
+        'Exp Per Minute': _ratio(t['Exp'], minutes),
+        'Total Damage': t['Damage'], 'Average Damage': _ratio(t['Damage'], t['Games']),
+        'Damage Per Minute': _ratio(t['Damage/min Sum'], t['Games']),
+        'Damage Share%': _ratio(t['Damage'], t['Team Damage'], 100),
+        'Damage/Gold%': _ratio(t['Damage/Gold Sum'], t['Games']),
+        'Total Building Damage': t['Building Damage'],
+        'Average Building Damage': _ratio(t['Building Damage'], t['Games']),
+        'Building Damage Share%': _ratio(t['Building Damage'], t['Team Building Damage'], 100),
+        'Damage Taken': t['Damage Taken'], 'Average Damage Taken': _ratio(t['Damage Taken'], t['Games']),
+        'Damage Taken Per Minute': _ratio(t['Damage Taken/min Sum'], t['Games']),
+        'Damage Taken Share%': _ratio(t['Damage Taken'], t['Team Damage Taken'], 100),
+        'DMG taken/Gold%': _ratio(t['DMG taken/Gold Sum'], t['Games']),
+        'Total control time/s': t['Control time/s'].round(2),
+        'Control time per game/s': _ratio(t['Control time/s'], t['Games']),
+        'Total heal': t['Heal'], 'Heal per game': _ratio(t['Heal'], t['Games']),
+        'Heroes Used': t['Heroes'], 'Lengendary': t['Legendary'],
+        'Savage': t['Savage'], 'Maniac': t['Maniac'], 'Triple Kill': t['Triple Kill'],
+        'Double Kill': t['Double Kill'], 'First Blood': t['First Blood'],
+        'Towers Secured': t['Towers Secured'], 'Cryoturtle Secured': t['Cryoturtle Secured'],
+        'Lord Secured': t['Lord Secured'],
+        'Average Game Time/s': _ratio(t['Time/s'], t['Games']),
+    }, index=totals.index)
+
+
+# --- KOLOM CSV -> TOTAL (seed state) ---
+def _share_base(total, share):
+    return _ratio(total, share, 100)
+
+
+def seed_team_totals(team_stats):
+    s = team_stats
+    time_s = s['TIme per Game/s'] * s['Game Count']
+    return pd.DataFrame({
+        'Matches': s['Match Count'], 'Match Wins': s['Match Win Count'],
+        'Games': s['Game Count'], 'Game Wins': s['Game Win Count'], 'Time/s': time_s,
+        'Kills': s['Total Kills'], 'Deaths': s['Total Deaths'], 'Assists': s['Total Assists'],
+        'Gold': s['Team Gold per Minute'] * time_s / 60, 'Damage': s['Team Damage'],
+        'Building Damage': s['Team Building Damage'], 'Damage Taken': s['Team Damage Taken'],
+        'Legendary': s['Lengendary'], 'Savage': s['Savage'], 'Maniac': s['Maniac'],
+        'Triple Kill': s['Triple Kill'], 'Double Kill': s['Double Kill'], 'First Blood': s['First Blood'],
+        'Towers': s['Tower Destroy Count'], 'Towers Lost': s['Tower Destroyed Count'],
+        'Turtles': s['Cryoturtle Kill Count'], 'Enemy Turtles': s['Enemy Cryoturtle Kill Count'],
+        'Lords': s['Lord Kill Count'], 'Enemy Lords': s['Enemy Cryoturtle Kill Count.1'],
+        'KDA Sum': s['KDA'] * s['Game Count'], 'KP Sum': s['Team Kill Participation%'] * s['Game Count'],
+        'Damage/min Sum': s['Team Damage per Minute'] * s['Game Count'],
+        'Damage Taken/min Sum': s['Team Damage Taken per Minute'] * s['Game Count'],
+        'Towers/game Sum': s['Tower Destroy Count per Game'] * s['Game Count'],
+        'Heroes': s['Heros Used'],
+        'Max Kills': s['Highest kills in a single game'], 'Max Deaths': s['Highest deaths in a single game'],
+        'Max Assists': s['Highest assists in a single game'],
+    }).astype('float64')
+
+
+def seed_player_totals(player_stats, team):
+    s = player_stats
+    time_s = s['Average Game Time/s'] * s['Games Played']
+    totals = pd.DataFrame({
+        'Team': team, 'Player No.': s['Player No.'],
+        'Matches': s['Matches Played'], 'Match Wins': s['Number of match wins'],
+        'Games': s['Games Played'], 'Game Wins': s['Number of game wins'], 'Time/s': time_s,
+        'Kills': s['Total Kills'], 'Deaths': s['Total Deaths'], 'Assists': s['Total Assists'],
+        'Gold': s['Total Gold'], 'Exp': s['Exp Per Minute'] * time_s / 60, 'Damage': s['Total Damage'],
+        'Building Damage': s['Total Building Damage'], 'Damage Taken': s['Damage Taken'],
+        'Control time/s': s['Total control time/s'], 'Heal': s['Total heal'],
+        'Legendary': s['Lengendary'], 'Savage': s['Savage'], 'Maniac': s['Maniac'],
+        'Triple Kill': s['Triple Kill'], 'Double Kill': s['Double Kill'], 'First Blood': s['First Blood'],
+        'Towers Secured': s['Towers Secured'], 'Cryoturtle Secured': s['Cryoturtle Secured'],
+        'Lord Secured': s['Lord Secured'],
+        'Team Kills': _share_base(s['Total Kills'] + s['Total Assists'], s['Kill Participation%']),
+        'Team Gold': _share_base(s['Total Gold'], s['Gold Share%']),
+        'Team Damage': _share_base(s['Total Damage'], s['Damage Share%']),
+        'Team Building Damage': _share_base(s['Total Building Damage'], s['Building Damage Share%']),
+        'Team Damage Taken': _share_base(s['Damage Taken'], s['Damage Taken Share%']),
+        'Gold/min Sum': s['Gold Per Minute'] * s['Games Played'],
+        'Damage/min Sum': s['Damage Per Minute'] * s['Games Played'],
+        'Damage Taken/min Sum': s['Damage Taken Per Minute'] * s['Games Played'],
+        'Damage/Gold Sum': s['Damage/Gold%'] * s['Games Played'],
+        'DMG taken/Gold Sum': s['DMG taken/Gold%'] * s['Games Played'],
+        'Heroes': s['Heroes Used'],
+        'Max Kills': s['Highest kill in a single game'], 'Max Deaths': s['Highest death in a single game'],
+        'Max Assists': s['Highest assists in a single game'],
+    })
+    numeric = totals.columns.drop(['Team', 'Player No.'])
+    totals[numeric] = totals[numeric].astype('float64')
+    return totals.set_index(['Team', s['Player']]).rename_axis(['Team', 'Player'])
+
+
+# --- STATE ---
+class State:
+    """Running total tim & pemain untuk satu musim, plus metadata (hero terpakai, match yang sudah diproses)."""
+
+    def __init__(self, season, teams, players, meta):
+        self.season = season
+        self.teams = teams
+        self.players = players
+        self.meta = meta
+
+    @property
+    def path(self):
+        return STATE_DIR / self.season
+
+    def source_versions(self):
+        # Cukup mtime + ukuran file (tanpa hash) agar memuat state tetap O(1) terhadap isi CSV
+        names = ['team_stats'] + [f'{code}_player_stats' for code in self.player_files()]
+        versions = {}
+        for name in names:
+            stat = (data_store.DATA_ROOT / data_store.dataset_spec(name, self.season).path).stat()
+            versions[name] = [stat.st_mtime_ns, stat.st_size]
+        return versions
+
+    def player_files(self):
+        return sorted(self.players.index.unique('Team'))
+
+    def save(self):
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.meta['sources'] = self.source_versions()
+        for name, df in (('teams', self.teams), ('players', self.players)):
+            table = pa.Table.from_pandas(df.reset_index(), preserve_index=False)
+            atomic_write(self.path / f'{name}.arrow', lambda p: feather.write_feather(table, p))
+        atomic_write(self.path / 'state.json',
+                     lambda p: p.write_text(json.dumps(self.meta), encoding='utf-8'))
+
+
+def seed(season=None):
+    """Membentuk state dari CSV musim `season` (tanpa riwayat per game)."""
+    season = season or data_store.CURRENT_SEASON
+    team_stats = data_store.load_team_stats(season)
+    teams = seed_team_totals(team_stats).rename_axis('Team Name')
+
+    players, heroes = [], {}
+    for team in team_stats['Team Name']:
+        code = data_store.team_code(team)
+        if data_store.has_dataset(f'{code}_player_stats', season):
+            players.append(seed_player_totals(data_store.load_player_stats(code, season), code))
+        if data_store.has_dataset(f'{code}_hero_stats', season):
+            # Daftar hero tim lengkap tersedia, jadi 'Heros Used' bisa dihitung ulang dengan tepat
+            team_heroes = data_store.load_team_heroes(code, season)
+            heroes[team] = sorted(team_heroes.loc[team_heroes['Pick Count'] > 0, 'Hero'])
+    players = pd.concat(players) if players else seed_player_totals(
+        pd.DataFrame(columns=list(data_store.PLAYER_STATS_SCHEMA)), '')
+
+    state = State(season, teams, players, {'season': season, 'matches': {}, 'heroes': heroes})
+    state.save()
+    return state
+
+
+def load_state(season=None):
+    """State tersimpan, atau dibentuk ulang jika belum ada / CSV sumber berubah di luar modul ini."""
+    season = season or data_store.CURRENT_SEASON
+    path = STATE_DIR / season
+    try:
+        meta = json.loads((path / 'state.json').read_text(encoding='utf-8'))
+        teams = feather.read_table(path / 'teams.arrow').to_pandas().set_index('Team Name')
+        players = feather.read_table(path / 'players.arrow').to_pandas().set_index(['Team', 'Player'])
+    except (FileNotFoundError, json.JSONDecodeError):
+        return seed(season)
+    state = State(season, teams, players, meta)
+    if state.source_versions() != meta.get('sources'):
+        return seed(season)
+    return state
+
+
+# --- MATCH BARU ---
+def _lines_frame(lines):
+    lines = pd.DataFrame(lines)
+    missing = {'Game', 'Player', 'Win'} - set(lines.columns)
+    if missing:
+        raise ValueError(f"kolom wajib tidak ada di baris pemain: {', '.join(sorted(missing))}")
+    for col in LINE_COLUMNS:
+        if col not in lines.columns:
+            lines[col] = 0 if col in LINE_STATS or col == 'Game Time/s' else ''
+    lines[LINE_STATS] = lines[LINE_STATS].astype('float64')
+    lines['Win'] = lines['Win'].astype(bool)
+
+    per_game = lines.groupby('Game')
+    for stat in ['Kills', 'Gold', 'Damage', 'Building Damage', 'Damage Taken']:
+        lines[f'Team {stat}'] = per_game[stat].transform('sum')
+    lines['Game Time/s'] = per_game['Game Time/s'].transform('max')
+    minutes = lines['Game Time/s'] / 60
+    for stat in ['Gold', 'Damage', 'Damage Taken', 'Team Damage', 'Team Damage Taken']:
+        lines[f'{stat}/min'] = _ratio(lines[stat], minutes)
+    lines['KA'] = lines['Kills'] + lines['Assists']
+    lines['KP'] = _ratio(lines['KA'], lines['Team Kills'], 100)
+    lines['Damage/Gold'] = _ratio(lines['Damage'], lines['Gold'], 100)
+    lines['DMG taken/Gold'] = _ratio(lines['Damage Taken'], lines['Gold'], 100)
+    return lines
+
+
+def _team_delta(lines, enemy_lines, match_won, games, games_won):
+    """Perubahan total satu tim dari baris pemainnya (dan baris pemain lawan, jika ada)."""
+    per_game = lines.groupby('Game')
+    game_sums = per_game[LINE_STATS].sum()
+    kda = (game_sums['Kills'] + game_sums['Assists']) / np.maximum(game_sums['Deaths'], 1)
+    delta = {
+        'Matches': 1, 'Match Wins': int(match_won), 'Games': games, 'Game Wins': games_won,
+        'Time/s': per_game['Game Time/s'].max().sum(),
+        **{stat: game_sums[stat].sum() for stat in ['Kills', 'Deaths', 'Assists', 'Gold', 'Damage',
+                                                     'Building Damage', 'Damage Taken', *COUNTERS]},
+        'Towers': game_sums['Towers Secured'].sum(), 'Turtles': game_sums['Cryoturtle Secured'].sum(),
+        'Lords': game_sums['Lord Secured'].sum(),
+        'KDA Sum': kda.sum(), 'KP Sum': per_game['KP'].mean().sum(),
+        'Damage/min Sum': per_game['Team Damage/min'].first().sum(),
+        'Damage Taken/min Sum': per_game['Team Damage Taken/min'].first().sum(),
+        'Towers/game Sum': game_sums['Towers Secured'].sum(),
+        'Max Kills': game_sums['Kills'].max(), 'Max Deaths': game_sums['Deaths'].max(),
+        'Max Assists': game_sums['Assists'].max(),
+    }
+    if enemy_lines is not None:
+        enemy_sums = enemy_lines[['Towers Secured', 'Cryoturtle Secured', 'Lord Secured']].sum()
+        delta.update({'Towers Lost': enemy_sums['Towers Secured'], 'Enemy Turtles': enemy_sums['Cryoturtle Secured'],
+                      'Enemy Lords': enemy_sums['Lord Secured']})
+    return delta
+
+
+def _player_delta(lines, match_won):
+    per_player = lines.groupby('Player', sort=False)
+    delta = per_player[LINE_STATS].sum()
+    delta['Matches'] = 1
+    delta['Match Wins'] = int(match_won)
+    delta['Games'] = per_player['Game'].nunique()
+    delta['Game Wins'] = per_player['Win'].sum()
+    delta['Time/s'] = per_player['Game Time/s'].sum()
+    for stat in ['Kills', 'Gold', 'Damage', 'Building Damage', 'Damage Taken']:
+        delta[f'Team {stat}'] = per_player[f'Team {stat}'].sum()
+    for stat in ['Gold', 'Damage', 'Damage Taken']:
+        delta[f'{stat}/min Sum'] = per_player[f'{stat}/min'].sum()
+    delta['Damage/Gold Sum'] = per_player['Damage/Gold'].sum()
+    delta['DMG taken/Gold Sum'] = per_player['DMG taken/Gold'].sum()
+    delta['Max Kills'] = per_player['Kills'].max()
+    delta['Max Deaths'] = per_player['Deaths'].max()
+    delta['Max Assists'] = per_player['Assists'].max()
+    delta['Player No.'] = per_player['Player No.'].first()
+    return delta
+
+
+def _add_heroes(state, entity, heroes):
+    """Jumlah hero baru (belum pernah tercatat) untuk `entity`."""
+    known = set(state.meta['heroes'].get(entity, []))
+    new = {hero for hero in heroes if hero} - known
+    if new:
+        state.meta['heroes'][entity] = sorted(known | new)
+    return len(new)
+
+
+def _apply_team(state, team, delta, heroes):
+    if team not in state.teams.index:
+        state.teams.loc[team] = 0.0
+    delta['Heroes'] = _add_heroes(state, team, heroes)
+    sums = [col for col in delta if col not in MAX_TOTALS]
+    state.teams.loc[team, sums] += [delta[col] for col in sums]
+    state.teams.loc[team, MAX_TOTALS] = np.maximum(state.teams.loc[team, MAX_TOTALS], [delta[c] for c in MAX_TOTALS])
+
+
+def _apply_players(state, code, delta, lines):
+    index = pd.MultiIndex.from_product([[code], delta.index], names=['Team', 'Player'])
+    new = index.difference(state.players.index)
+    if len(new):
+        blank = pd.DataFrame(0.0, index=new, columns=state.players.columns)
+        blank['Player No.'] = delta.loc[new.get_level_values('Player'), 'Player No.'].to_numpy()
+        state.players = pd.concat([state.players, blank])
+    delta['Heroes'] = [_add_heroes(state, f'{code}/{player}', lines.loc[lines['Player'] == player, 'Hero'])
+                       for player in delta.index]
+    sums = [col for col in PLAYER_TOTALS if col in delta.columns]
+    rows = state.players.index.get_indexer(index)
+    for cols, combine in ((sums, np.add), (MAX_TOTALS, np.maximum)):
+        positions = state.players.columns.get_indexer(cols)
+        state.players.iloc[rows, positions] = combine(state.players.iloc[rows, positions].to_numpy(),
+                                                      delta[cols].to_numpy(dtype='float64'))
+    return index
+
+
+def _apply_match(state, match, players, opponent_players, team):
+    # Memperbarui running total di `state` (tanpa menulis file);
+    # mengembalikan (tim yang diperbarui, kode tim -> index pemain yang diperbarui)
+    processed = state.meta['matches'].setdefault(team, [])
+    if match['Match'] in processed:
+        raise ValueError(f"Match {match['Match']} untuk {team} sudah pernah ditambahkan")
+
+    lines = _lines_frame(players)
+    enemy_lines = _lines_frame(opponent_players) if opponent_players is not None else None
+    games, score, enemy_score = int(match['Game_Played']), int(match['Score_NAVI']), int(match['Score_Opponent'])
+
+    touched_players = {}
+    sides = [(team, lines, enemy_lines, score, enemy_score)]
+    if enemy_lines is not None and match['Opponent'] in state.teams.index:
+        sides.append((match['Opponent'], enemy_lines, lines, enemy_score, score))
+    for side, side_lines, side_enemy, won, lost in sides:
+        _apply_team(state, side, _team_delta(side_lines, side_enemy, won > lost, games, won),
+                    side_lines['Hero'].unique())
+        code = data_store.team_code(side)
+        touched_players[code] = _apply_players(state, code, _player_delta(side_lines, won > lost), side_lines)
+
+    processed.append(match['Match'])
+    return [side[0] for side in sides], touched_players
+
+
+def append_matches(records, season=None):
+    """
+    Menambahkan sekumpulan match, masing-masing dict {match, players,
+    opponent_players?, team?} (lihat `append_match`). Running total diperbarui
+    per match, lalu setiap CSV yang terlibat ditulis sekali untuk seluruh batch.
+    Jika satu match gagal, tidak ada file yang diubah.
+
+    Mengembalikan ringkasan (jumlah match, tim & pemain yang diperbarui, durasi).
+    """
+    start = time.perf_counter()
+    state = load_state(season)
+    touched_teams, touched_players, history = [], {}, []
+    for record in records:
+        team = record.get('team', 'NAVI')
+        teams, players = _apply_match(state, record['match'], record['players'],
+                                      record.get('opponent_players'), team)
+        touched_teams.extend(t for t in teams if t not in touched_teams)
+        for code, index in players.items():
+            touched_players[code] = touched_players[code].append(index).unique() \
+                if code in touched_players else index
+        if team == 'NAVI' and state.season == data_store.CURRENT_SEASON:
+            history.append(record['match'])
+
+    if touched_teams:
+        write_team_stats(state, touched_teams)
+    for code, index in touched_players.items():
+        write_player_stats(state, code, index)
+    if history:
+        append_match_history(history)
+
+    state.save()
+    return {'matches': len(records), 'teams': touched_teams,
+            'players': sum(len(i) for i in touched_players.values()),
+            'seconds': time.perf_counter() - start}
+
+
+def append_match(match, players, opponent_players=None, team='NAVI', season=None):
+    """
+    Menambahkan satu match untuk `team`.
+
+    - match: dict berbentuk satu baris navi_match_history_s15.csv (Match, Opponent,
+      Result, Score_NAVI, Score_Opponent, Game_Played, Player_*)
+    - players: baris per pemain per game (lihat LINE_COLUMNS; wajib Game, Player, Win)
+    - opponent_players: baris pemain lawan (opsional) untuk objektif lawan
+      (turret hilang, turtle/lord lawan); jika lawan ada di team_statistics,
+      statistiknya ikut diperbarui.
+
+    Mengembalikan ringkasan (tim & pemain yang diperbarui, durasi).
+    """
+    record = {'match': match, 'players': players, 'opponent_players': opponent_players, 'team': team}
+    return append_matches([record], season)
+
+
+# --- TULIS CSV ---
+def _source_path(name, season):
+    return data_store.DATA_ROOT / data_store.dataset_spec(name, season).path
+
+
+def _source_layout(path, encoding):
+    # Baris header asli (apa adanya: pandas menamai ulang header ganda menjadi '<nama>.1')
+    # dan apakah file diakhiri newline; (None, True) jika file belum ada / kosong
+    try:
+        with open(path, 'rb') as f:
+            header = f.readline()
+            if not header:
+                return None, True
+            f.seek(-1, 2)
+            return header.decode(encoding).rstrip('\r\n'), f.read(1) == b'\n'
+    except FileNotFoundError:
+        return None, True
+
+
+def _write_source(path, spec, body, header, trailing_newline):
+    # Menulis ulang file sumber dengan header dan akhir file yang sama seperti aslinya
+    if header is not None:
+        body = header + '\n' + body
+    if not trailing_newline:
+        body = body.removesuffix('\n')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, lambda p: p.write_text(body, encoding=spec.encoding, newline=''))
+
+
+def _write_csv(df, name, season):
+    spec = data_store.dataset_spec(name, season)
+    path = _source_path(name, season)
+    header, trailing_newline = _source_layout(path, spec.encoding)
+    body = df.to_csv(sep=spec.sep, index=False, header=header is None, lineterminator='\n',
+                     float_format='%.15g')
+    _write_source(path, spec, body, header, trailing_newline)
+
+
+def _read_csv(name, season):
+    spec = data_store.dataset_spec(name, season)
+    return pd.read_csv(_source_path(name, season), sep=spec.sep, dtype=spec.schema, encoding=spec.encoding)
+
+
+def _update_rows(df, key, rows):
+    """Menimpa baris `rows` (index = nilai kolom `key`) di df, menambah baris baru jika belum ada."""
+    # Nilai dikonversi ke tipe kolom CSV agar file tetap terbaca dengan skema yang sama
+    rows = pd.DataFrame({
+        col: np.rint(rows[col].to_numpy(dtype='float64')).astype(df[col].dtype)
+        if pd.api.types.is_integer_dtype(df[col]) else rows[col].to_numpy()
+        for col in rows.columns
+    }, index=rows.index)
+    position = pd.Index(df[key]).get_indexer(rows.index)
+    existing = position >= 0
+    for col in rows.columns:
+        column = df[col].to_numpy(copy=True)
+        column[position[existing]] = rows[col].to_numpy()[existing]
+        df[col] = column
+    if not existing.all():
+        new_rows = rows.loc[~existing].assign(**{key: rows.index[~existing]})
+        df = pd.concat([df, new_rows], ignore_index=True)
+    return df
+
+
+def write_team_stats(state, teams):
+    df = _read_csv('team_stats', state.season)
+    df = _update_rows(df, 'Team Name', team_rows(state.teams.loc[teams]))
+    df['No.'] = np.arange(1, len(df) + 1)
+    _write_csv(df, 'team_stats', state.season)
+
+
+def write_player_stats(state, code, index):
+    name = f'{code}_player_stats'
+    totals = state.players.loc[index]
+    rows = player_rows(totals.drop(columns=['Team', 'Player No.'], errors='ignore'))
+    rows.insert(0, 'Player No.', totals['Player No.'])
+    rows.index = index.get_level_values('Player')
+    if data_store.has_dataset(name, state.season):
+        df = _read_csv(name, state.season)
+    else:
+        df = pd.DataFrame(columns=list(data_store.PLAYER_STATS_SCHEMA))
+    _write_csv(_update_rows(df, 'Player', rows), name, state.season)
+
+
+def append_match_history(matches):
+    # File ditulis ulang utuh lewat atomic_write (bukan append di tempat) agar watcher
+    # tidak pernah membaca baris setengah jadi
+    spec = data_store.dataset_spec('navi_match_history')
+    path = _source_path('navi_match_history', None)
+    try:
+        with open(path, encoding=spec.encoding, newline='') as f:
+            text = f.read()
+    except FileNotFoundError:
+        text = ''
+    rows = pd.DataFrame(matches, columns=list(data_store.MATCH_HISTORY_SCHEMA)).to_csv(
+        sep=spec.sep, header=not text, index=False, lineterminator='\n')
+    # File sumber tidak selalu diakhiri newline; akhir file aslinya dipertahankan
+    trailing_newline = not text or text.endswith('\n')
+    _write_source(path, spec, (text if trailing_newline else text + '\n') + rows, None, trailing_newline)
+
+
+# --- CLI ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pembaruan statistik tim & pemain secara inkremental.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    append = sub.add_parser('append', help="Tambahkan match dari file JSON")
+    append.add_argument('files', nargs='+', help="JSON: {match, players, opponent_players?, team?}")
+    append.add_argument('--season')
+    seed_cmd = sub.add_parser('seed', help="Bentuk ulang state dari CSV")
+    seed_cmd.add_argument('--season')
+    args = parser.parse_args(argv)
+
+    if args.command == 'seed':
+        start = time.perf_counter()
+        state = seed(args.season)
+        print(f"State {state.season}: {len(state.teams)} tim, {len(state.players)} pemain "
+              f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+        return
+    records = [json.loads(Path(file).read_text(encoding='utf-8')) for file in args.files]
+    result = append_matches(records, args.season)
+    print(f"{result['matches']} match: {', '.join(result['teams'])}, {result['players']} pemain "
+          f"({result['seconds'] * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
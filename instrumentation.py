@@ -0,0 +1,186 @@
+"""
+Instrumentasi opsional untuk mengukur waktu dan memori setiap rerun dashboard.
+
+Aktif jika variabel lingkungan MLBB_PROFILE=1 atau URL berisi `?profile=1`.
+Saat aktif, setiap rerun mencatat span bersarang (parsing CSV, build tabel,
+halaman, pembuatan figure, serialisasi ke browser) beserta waktu dan alokasi
+memori dari tracemalloc, menampilkannya di panel sidebar, dan menambahkannya
+ke log JSONL (default `.cache/profile.jsonl`, bisa diganti lewat
+MLBB_PROFILE_LOG).
+
+`span()` bisa dipanggil dari modul mana pun (data_store, figure_cache, ...)
+tanpa bergantung pada Streamlit; jika tidak ada rerun yang sedang diukur di
+thread ini, span tidak melakukan apa-apa. Catatan: tracemalloc bersifat
+global per proses, jadi angka memori bisa ikut terpengaruh sesi lain yang
+berjalan bersamaan. tracemalloc hanya aktif selama ada rerun yang sedang
+diukur, jadi overhead-nya hilang lagi setelah profiling selesai.
+"""
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+LOG_PATH = Path(os.environ.get('MLBB_PROFILE_LOG', Path(__file__).resolve().parent / '.cache' / 'profile.jsonl'))
+
+# Streamlit menjalankan setiap sesi di thread sendiri, jadi rerun aktif disimpan per thread
+_local = threading.local()
+_log_lock = threading.Lock()
+
+# Jumlah rerun terukur yang sedang berjalan; tracemalloc dinyalakan oleh rerun pertama
+# dan dimatikan lagi oleh rerun terakhir yang selesai (kecuali sudah aktif dari luar)
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_owned = False
+
+
+class _Run:
+    def __init__(self):
+        self.spans = []
+        self.stack = []
+
+
+def env_enabled():
+    return os.environ.get('MLBB_PROFILE', '').lower() in ('1', 'true', 'yes')
+
+
+def span(category, name):
+    """Context manager pengukur satu langkah; no-op jika tidak ada rerun aktif."""
+    run = getattr(_local, 'run', None)
+    if run is None:
+        return nullcontext()
+    return _span(run, category, name)
+
+
+@contextmanager
+def _span(run, category, name):
+    record = {'category': category, 'name': str(name), 'depth': len(run.stack)}
+    run.spans.append(record)
+
+    # Peak tracemalloc di-reset per span; peak yang sudah terlihat diteruskan ke span induk
+    current, peak = tracemalloc.get_traced_memory()
+    if run.stack:
+        run.stack[-1]['_peak'] = max(run.stack[-1]['_peak'], peak)
+    tracemalloc.reset_peak()
+    record['_start_mem'], record['_peak'] = current, current
+    run.stack.append(record)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record['seconds'] = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        run.stack.pop()
+        peak = max(record.pop('_peak'), peak)
+        start_mem = record.pop('_start_mem')
+        record['alloc_kb'] = round((current - start_mem) / 1024, 1)
+        record['peak_kb'] = round((peak - start_mem) / 1024, 1)
+        if run.stack:
+            run.stack[-1]['_peak'] = max(run.stack[-1]['_peak'], peak)
+
+
+def _acquire_tracing():
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_owned = True
+        _tracing_users += 1
+
+
+def _release_tracing():
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _tracing_owned:
+            # Tanpa ini setiap alokasi di proses tetap dilacak setelah profiling selesai
+            tracemalloc.stop()
+            _tracing_owned = False
+
+
+def breakdown(spans):
+    """Total detik per kategori tanpa menghitung dua kali span bersarang dengan kategori sama."""
+    totals = {}
+    open_categories = []
+    for record in spans:
+        del open_categories[record['depth']:]
+        if record['category'] not in open_categories:
+            totals[record['category']] = totals.get(record['category'], 0) + record['seconds']
+        open_categories.append(record['category'])
+    return totals
+
+
+@contextmanager
+def rerun(app, enabled=None):
+    """
+    Mengukur satu rerun skrip `app`. Mengembalikan record rerun (dict, terisi
+    setelah blok selesai), atau None jika instrumentasi tidak aktif. Nama
+    halaman diambil dari span kategori 'page' pertama.
+    """
+    result = {}
+    if not (env_enabled() if enabled is None else enabled):
+        yield None
+        return
+
+    _acquire_tracing()
+    run = _Run()
+    _local.run = run
+    try:
+        with _span(run, 'rerun', app):
+            yield result
+    finally:
+        _local.run = None
+        _release_tracing()
+        total = run.spans[0]
+        result.update({
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'app': app,
+            'page': next((s['name'] for s in run.spans if s['category'] == 'page'), None),
+            'seconds': total['seconds'],
+            'peak_kb': total['peak_kb'],
+            'by_category': breakdown(run.spans[1:]),
+            'spans': run.spans[1:],
+        })
+        write_log(result)
+
+
+def write_log(record):
+    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(record) + '\n'
+    with _log_lock, open(LOG_PATH, 'a', encoding='utf-8') as f:
+        f.write(line)
+
+
+# --- STREAMLIT ---
+def streamlit_enabled():
+    """Aktif lewat env var atau query param `?profile=1`."""
+    import streamlit as st
+
+    return env_enabled() or st.query_params.get('profile', '').lower() in ('1', 'true', 'yes')
+
+
+def plotly_chart(figure, **kwargs):
+    """`st.plotly_chart` dengan span 'serialize' (validasi + JSON ke browser)."""
+    import streamlit as st
+
+    with span('serialize', 'st.plotly_chart'):
+        return st.plotly_chart(figure, use_container_width=True, **kwargs)
+
+
+def render_panel(record):
+    """Panel sidebar berisi rincian rerun terakhir."""
+    import pandas as pd
+    import streamlit as st
+
+    with st.sidebar.expander("⏱️ Profiling rerun", expanded=True):
+        st.write(f"**Total {record['seconds'] * 1000:.0f} ms**, peak memori {record['peak_kb'] / 1024:.1f} MB")
+        st.write(" · ".join(f"**{category}** {seconds * 1000:.0f} ms"
+                            for category, seconds in sorted(record['by_category'].items(), key=lambda kv: -kv[1])))
+        spans_df = pd.DataFrame(record['spans'], columns=['depth', 'category', 'name', 'seconds', 'alloc_kb', 'peak_kb'])
+        spans_df['name'] = ['  ' * depth + name for depth, name in zip(spans_df['depth'], spans_df['name'])]
+        spans_df['ms'] = spans_df.pop('seconds') * 1000
+        st.dataframe(spans_df.drop(columns='depth'), hide_index=True,
+                     column_config={'ms': st.column_config.NumberColumn(format="%.1f")})
+        st.caption(f"Log: {LOG_PATH}")
@@ -0,0 +1,268 @@
+"""
+Rating Elo tim dan lineup dari riwayat match, diproses berurutan per match.
+
+Setiap match (seri BoX) memperbarui rating per game: selisih = K x (game
+menang - jumlah game x peluang menang). Tim baru memakai K lebih besar selama
+PROVISIONAL_GAMES game pertama (rating awal belum pasti), dan di setiap
+pergantian musim semua rating ditarik ke rata-rata (SEASON_CARRY_OVER).
+
+Lineup (lima pemain per game, urut Mid/Roam/Gold/Exp/Jungler) diberi rating
+sendiri melawan rating tim lawan, dengan hasil game = skor seri (pemenang
+tiap game tidak tercatat di sumber).
+
+State disimpan dalam array NumPy (id tim/lineup -> rating, jumlah game,
+kemenangan, total rating lawan) yang tumbuh berlipat dua, jadi satu match
+baru = O(1). Jika riwayat match hanya bertambah di akhir (misal lewat
+`incremental.append_match`), engine yang sudah ada disalin lalu hanya match
+baru yang diproses. Setiap match yang sudah diproses dicatat beserta isinya
+(tim, skor, lineup), jadi koreksi skor pada match lama ikut terdeteksi dan
+riwayat diputar ulang dari awal.
+"""
+import numpy as np
+import pandas as pd
+
+import analytics
+import data_store
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 24.0
+K_PROVISIONAL = 48.0
+PROVISIONAL_GAMES = 10
+SEASON_CARRY_OVER = 0.75
+
+# Tim pemilik file riwayat match
+HISTORY_TEAM = 'NAVI'
+
+RESULT_COLUMNS = ['Season', 'Team', 'Opponent', 'Score_Team', 'Score_Opponent']
+
+
+def expected(rating, opponent_rating):
+    """Peluang menang satu game."""
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / 400))
+
+
+def series_win_probability(p, best_of=3):
+    """Peluang memenangkan seri BoX dari peluang menang per game `p`."""
+    need = best_of // 2 + 1
+    # Menang di game ke-(need + j): need - 1 menang dan j kalah sebelumnya, lalu menang
+    return sum(_comb(need - 1 + j, j) * p ** need * (1 - p) ** j for j in range(need))
+
+
+def _comb(n, k):
+    result = 1
+    for i in range(k):
+        result = result * (n - i) // (i + 1)
+    return result
+
+
+def match_row(key, season, team, opponent, score_team, score_opponent, lineups=()):
+    """Isi satu match yang memengaruhi rating; dipakai untuk mendeteksi match lama yang berubah."""
+    return (key, season, team, opponent, int(score_team), int(score_opponent), tuple(lineups))
+
+
+class RatingState:
+    """Rating + statistik per entitas (tim atau lineup) dalam array yang tumbuh berlipat dua."""
+
+    def __init__(self, capacity=64):
+        self.names = []
+        self.ids = {}
+        self.rating = np.full(capacity, INITIAL_RATING)
+        self.games = np.zeros(capacity, dtype='int64')
+        self.wins = np.zeros(capacity, dtype='float64')
+        self.opponent_total = np.zeros(capacity)
+
+    def __len__(self):
+        return len(self.names)
+
+    def id(self, name):
+        entity = self.ids.get(name)
+        if entity is None:
+            entity = self.ids[name] = len(self.names)
+            self.names.append(name)
+            if entity == len(self.rating):
+                self._grow()
+        return entity
+
+    def _grow(self):
+        capacity = len(self.rating)
+        self.rating = np.concatenate([self.rating, np.full(capacity, INITIAL_RATING)])
+        self.games = np.concatenate([self.games, np.zeros(capacity, dtype='int64')])
+        self.wins = np.concatenate([self.wins, np.zeros(capacity)])
+        self.opponent_total = np.concatenate([self.opponent_total, np.zeros(capacity)])
+
+    def regress(self, factor):
+        n = len(self)
+        if n:
+            mean = self.rating[:n].mean()
+            self.rating[:n] = mean + (self.rating[:n] - mean) * factor
+
+    def copy(self):
+        state = RatingState.__new__(RatingState)
+        state.names = list(self.names)
+        state.ids = dict(self.ids)
+        state.rating = self.rating.copy()
+        state.games = self.games.copy()
+        state.wins = self.wins.copy()
+        state.opponent_total = self.opponent_total.copy()
+        return state
+
+    def frame(self, label):
+        n = len(self)
+        games = self.games[:n]
+        df = pd.DataFrame({
+            label: self.names,
+            'Rating': self.rating[:n],
+            'Games': games,
+            'Game Wins': self.wins[:n],
+            'Game WR%': np.divide(self.wins[:n] * 100, games, out=np.full(n, np.nan), where=games > 0),
+            # Rata-rata rating lawan saat bertanding (kekuatan jadwal)
+            'Avg Opponent Rating': np.divide(self.opponent_total[:n], games, out=np.full(n, np.nan),
+                                             where=games > 0),
+        })
+        return df.sort_values('Rating', ascending=False, ignore_index=True)
+
+
+class RatingEngine:
+    def __init__(self):
+        self.teams = RatingState()
+        self.lineups = RatingState()
+        self.season = None
+        self.matches = 0
+        # (key, musim, tim, lawan, skor, skor lawan, lineup) setiap match yang sudah diproses
+        self.match_rows = []
+
+    def copy(self):
+        engine = RatingEngine.__new__(RatingEngine)
+        engine.teams = self.teams.copy()
+        engine.lineups = self.lineups.copy()
+        engine.season = self.season
+        engine.matches = self.matches
+        engine.match_rows = list(self.match_rows)
+        return engine
+
+    def _k(self, games):
+        return K_PROVISIONAL if games < PROVISIONAL_GAMES else K_FACTOR
+
+    def update(self, team, opponent, score_team, score_opponent, season=None, lineups=(), key=None):
+        """Memproses satu match; `lineups` = nama lineup `team` untuk setiap game yang dimainkan."""
+        if season is not None and season != self.season:
+            if self.season is not None:
+                self.teams.regress(SEASON_CARRY_OVER)
+                self.lineups.regress(SEASON_CARRY_OVER)
+            self.season = season
+        self.matches += 1
+        self.match_rows.append(match_row(key, season, team, opponent, score_team, score_opponent, lineups))
+        n = score_team + score_opponent
+        if n <= 0:
+            return
+
+        teams = self.teams
+        a, b = teams.id(team), teams.id(opponent)
+        rating_a, rating_b = float(teams.rating[a]), float(teams.rating[b])
+        surplus = score_team - n * expected(rating_a, rating_b)
+        teams.rating[a] = rating_a + self._k(teams.games[a]) * surplus
+        teams.rating[b] = rating_b - self._k(teams.games[b]) * surplus
+        teams.games[a] += n
+        teams.games[b] += n
+        teams.wins[a] += score_team
+        teams.wins[b] += score_opponent
+        teams.opponent_total[a] += rating_b * n
+        teams.opponent_total[b] += rating_a * n
+
+        # Rating lineup per game melawan rating tim lawan sebelum match
+        score = score_team / n
+        for lineup in lineups:
+            entity = self.lineups.id(lineup)
+            rating = float(self.lineups.rating[entity])
+            self.lineups.rating[entity] = rating + self._k(self.lineups.games[entity]) * (
+                score - expected(rating, rating_b))
+            self.lineups.games[entity] += 1
+            self.lineups.wins[entity] += score
+            self.lineups.opponent_total[entity] += rating_b
+
+    def replay(self, results):
+        """Memproses DataFrame hasil match (RESULT_COLUMNS, opsional 'Lineups' dan 'Key') secara berurutan."""
+        lineups = results['Lineups'] if 'Lineups' in results.columns else [()] * len(results)
+        keys = results['Key'] if 'Key' in results.columns else [None] * len(results)
+        rows = zip(results['Team'], results['Opponent'], results['Score_Team'].tolist(),
+                   results['Score_Opponent'].tolist(), results['Season'], lineups, keys)
+        for team, opponent, score_team, score_opponent, season, lineup, key in rows:
+            self.update(team, opponent, score_team, score_opponent, season, lineup, key)
+        return self
+
+    def team_table(self):
+        return self.teams.frame('Team')
+
+    def lineup_table(self):
+        return self.lineups.frame('Lineup')
+
+    def rating(self, team):
+        entity = self.teams.ids.get(team)
+        return INITIAL_RATING if entity is None else float(self.teams.rating[entity])
+
+    def games(self, team):
+        entity = self.teams.ids.get(team)
+        return 0 if entity is None else int(self.teams.games[entity])
+
+
+# --- RIWAYAT MATCH ---
+def _history_seasons(season):
+    # Musim (urut kronologis, sampai `season`) yang punya file riwayat match
+    seasons = data_store.list_seasons()
+    seasons = seasons[:seasons.index(season) + 1] if season in seasons else seasons
+    return [s for s in seasons if data_store.has_dataset('navi_match_history', s)]
+
+
+def _lineups(history_df):
+    # "Karss,Karss,Karss" per role -> nama lineup setiap game
+    per_role = [history_df[col].fillna('').str.split(',') for col in analytics.LINEUP_ROLES]
+    lineups = []
+    for games_played, *roles in zip(history_df['Game_Played'].tolist(), *per_role):
+        lineups.append(tuple(' · '.join(players[g].strip() if g < len(players) else '?' for players in roles)
+                             for g in range(games_played)))
+    return lineups
+
+
+def match_results(seasons):
+    """Riwayat match semua `seasons` dalam format RESULT_COLUMNS + Lineups + Key, urut kronologis."""
+    frames = []
+    for season in seasons:
+        history_df = data_store.load('navi_match_history', season).sort_values('Match', kind='stable')
+        frames.append(pd.DataFrame({
+            'Season': season,
+            'Team': HISTORY_TEAM,
+            'Opponent': history_df['Opponent'].astype(str).to_numpy(),
+            'Score_Team': history_df['Score_NAVI'].to_numpy(),
+            'Score_Opponent': history_df['Score_Opponent'].to_numpy(),
+            'Lineups': _lineups(history_df),
+            'Key': [f'{season}/{match}' for match in history_df['Match']],
+        }))
+    if not frames:
+        return pd.DataFrame(columns=RESULT_COLUMNS + ['Lineups', 'Key'])
+    return pd.concat(frames, ignore_index=True)
+
+
+_latest = {}
+
+
+def _build(season, seasons):
+    results = match_results(seasons)
+    rows = [match_row(*row) for row in zip(results['Key'], results['Season'], results['Team'], results['Opponent'],
+                                           results['Score_Team'], results['Score_Opponent'], results['Lineups'])]
+    previous = _latest.get(season)
+    # Match lama tidak berubah dan riwayat hanya bertambah di akhir: lanjutkan dari engine
+    # sebelumnya (O(match baru)); skor lama yang dikoreksi memicu replay penuh
+    if previous is not None and previous.match_rows == rows[:previous.matches]:
+        engine = previous.copy().replay(results.iloc[previous.matches:])
+    else:
+        engine = RatingEngine().replay(results)
+    _latest[season] = engine
+    return engine
+
+
+def rating_engine(season=None):
+    """`RatingEngine` setelah semua match sampai akhir `season`, dibangun sekali per versi riwayat match."""
+    season = season or data_store.CURRENT_SEASON
+    seasons = _history_seasons(season)
+    version = '|'.join(data_store.dataset_version('navi_match_history', s) for s in seasons)
+    return data_store.get_or_build(('derived', 'rating_engine', season), version, lambda: _build(season, seasons))
@@ -0,0 +1,222 @@
+"""
+Generator laporan scouting offline untuk semua tim di satu musim.
+
+Memakai pembuat grafik yang sama dengan dashboard (`charts`), tanpa Streamlit.
+Setiap tim dirender di proses terpisah (ProcessPoolExecutor); setiap grafik
+dibuat sekali lalu diekspor ke HTML statis dan, jika `kaleido` terpasang,
+ke file gambar (PNG/SVG/PDF). Grafik tingkat liga (meta hero, heatmap jungler)
+dibuat sekali di proses utama.
+
+Contoh:
+    python report.py --season S15 --out reports --jobs 4
+    python report.py --teams NAVI "ONIC ID" --images png
+"""
+import argparse
+import html
+import importlib.util
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from plotly.offline import get_plotlyjs
+
+import analytics
+import charts
+import comparison
+import data_store
+
+PLOTLY_JS = 'plotly.min.js'
+IMAGE_FORMATS = ['png', 'svg', 'pdf']
+
+# Metrik perbandingan pemain per role, sama dengan halaman "Analisis Pemain [vs ONIC]"
+ROLE_METRICS = {
+    'Jungler': [('Lord Secured per Game', 'Avg Lord/game', dict(text_auto='.2f', yaxis_title="Lord/Game")),
+                ('Turtle Secured per Game', 'Avg Turtle/game', dict(text_auto='.2f', yaxis_title="Turtle/Game")),
+                ('KDA Ratio', 'KDA', {}),
+                ('Gold Per Minute', 'GPM', {})],
+    'Gold': [('Gold Per Minute', 'GPM', {}),
+             ('Damage Per Minute', 'DPM', {}),
+             ('Building Damage Share%', 'Push Turret (Share) %', {})],
+    'Mid': [('KDA Ratio', 'KDA', {}),
+            ('Kill Participation%', 'Kill Participation %', {}),
+            ('Damage Share%', 'Damage Share %', {})],
+    'Roam': [('Average Assists', 'Avg Assists per Game', {}),
+             ('Damage Taken Per Minute', 'Damage Taken / Min', {}),
+             ('Control time per game/s', 'Avg Control Time / Game (s)', {})],
+    'Exp': [('KDA Ratio', 'KDA', {}),
+            ('Average Deaths', 'Avg Deaths / game', {}),
+            ('Damage Taken Share%', 'Damage Taken Share %', {})],
+}
+
+
+def slug(name):
+    return re.sub(r'\W+', '-', name.strip().lower()).strip('-')
+
+
+# --- HALAMAN HTML STATIS ---
+class ReportPage:
+    """
+    Satu halaman laporan. Setiap grafik dikonversi sekali ke potongan HTML dan,
+    jika `image_format` diisi, juga ditulis sebagai gambar di folder 'images'.
+    """
+
+    def __init__(self, root, path, title, image_format=None):
+        self.root = Path(root)
+        self.path = self.root / path
+        self.title = title
+        self.image_format = image_format
+        self.parts = []
+        self.figure_count = 0
+
+    def section(self, heading):
+        self.parts.append(f'<h2>{html.escape(heading)}</h2>')
+
+    def add(self, figure):
+        self.figure_count += 1
+        self.parts.append(figure.to_html(full_html=False, include_plotlyjs=False))
+        if self.image_format:
+            image_dir = self.path.parent / 'images'
+            image_dir.mkdir(parents=True, exist_ok=True)
+            figure.write_image(image_dir / f'{self.path.stem}-{self.figure_count:02d}.{self.image_format}')
+
+    def write(self):
+        # plotly.js ditulis sekali di root laporan, setiap halaman cukup merujuknya
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        script = Path(os.path.relpath(self.root / PLOTLY_JS, self.path.parent)).as_posix()
+        self.path.write_text(
+            '<!DOCTYPE html>\n<html><head><meta charset="utf-8">'
+            f'<title>{html.escape(self.title)}</title><script src="{script}"></script></head>\n'
+            f'<body><h1>{html.escape(self.title)}</h1>\n' + '\n'.join(self.parts) + '\n</body></html>\n',
+            encoding='utf-8')
+        return self.path
+
+
+# --- ISI LAPORAN ---
+def add_team_summary(page, team, opponent, season):
+    """Grafik halaman Ringkasan Tim untuk satu matchup."""
+    team_stats, _ = comparison.team_matchup(team, opponent, season)
+    colors = comparison.team_colors([team, opponent])
+    page.section(f"Ringkasan Tim: {team} vs {opponent}")
+    page.add(charts.winrate_funnel(team_stats, colors))
+    page.add(charts.objective_tornado(team_stats, team, opponent, colors))
+    page.add(charts.objective_bar(team_stats))
+    page.add(charts.tower_bar(team_stats))
+
+
+def add_player_matchups(page, team, opponent, season):
+    """Perbandingan pemain per role, hanya untuk tim yang punya roster di ROSTERS."""
+    roster_a, roster_b = comparison.roster(team, season), comparison.roster(opponent, season)
+    for role, metrics in ROLE_METRICS.items():
+        if role not in roster_a or role not in roster_b:
+            continue
+        page.section(f"{role}: {roster_a[role]} vs {roster_b[role]} ({comparison.short_name(opponent)})")
+        for metric, title, kwargs in metrics:
+            page.add(charts.player_comparison_chart(team, roster_a[role], opponent, roster_b[role],
+                                                    metric, title, season, **kwargs))
+
+
+def add_hero_priority(page, team, season):
+    team_heroes = data_store.load_team_heroes(data_store.team_code(team), season)
+    merged = team_heroes.join(analytics.meta_hero_stats(season)['Contest Count'])
+    page.section("Prioritas Pick")
+    page.add(charts.pick_priority_bubble(merged, comparison.short_name(team)))
+
+
+def render_team(season, team, out_dir, image_format=None):
+    """
+    Merender laporan satu tim (dijalankan di proses worker).
+    Mengembalikan (team, jumlah grafik, detik).
+    """
+    start = time.perf_counter()
+    page = ReportPage(out_dir, Path(season) / slug(team) / 'index.html', f"{team} - MPL {season}", image_format)
+    has_roster = team in comparison.ROSTERS.get(season, {})
+
+    for opponent in comparison.season_teams(season):
+        if opponent == team:
+            continue
+        add_team_summary(page, team, opponent, season)
+        if has_roster and opponent in comparison.ROSTERS[season]:
+            add_player_matchups(page, team, opponent, season)
+
+    if data_store.has_dataset(f'{data_store.team_code(team)}_hero_stats', season):
+        add_hero_priority(page, team, season)
+
+    page.write()
+    return team, page.figure_count, time.perf_counter() - start
+
+
+def render_league(out_dir, season, image_format=None):
+    """Grafik tingkat liga yang sama untuk semua tim, dibuat sekali."""
+    page = ReportPage(out_dir, Path(season) / 'liga.html', f"Meta & Jungler - MPL {season}", image_format)
+    if data_store.has_dataset('hero_stats', season):
+        meta_hero_stats = analytics.meta_hero_stats(season)
+        page.section("Meta Snapshot")
+        page.add(charts.top_contested_bar(meta_hero_stats))
+        page.add(charts.top_winrate_bar(meta_hero_stats, min_picks=20))
+    page.section("Heatmap Jungler")
+    page.add(charts.jungler_heatmap(*analytics.jungler_summary_heatmap()))
+    return page.write()
+
+
+def write_index(out_dir, season, teams):
+    links = ''.join(f'<li><a href="{season}/{slug(team)}/index.html">{html.escape(team)}</a></li>'
+                    for team in teams)
+    path = Path(out_dir) / 'index.html'
+    path.write_text(
+        '<!DOCTYPE html>\n<html><head><meta charset="utf-8">'
+        f'<title>Laporan Scouting MPL {season}</title></head>\n'
+        f'<body><h1>Laporan Scouting MPL {season}</h1>\n'
+        f'<p><a href="{season}/liga.html">Meta &amp; Jungler</a></p><ul>{links}</ul></body></html>\n',
+        encoding='utf-8')
+    return path
+
+
+# --- CLI ---
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render laporan scouting statis untuk semua tim.")
+    parser.add_argument('--season', default=data_store.CURRENT_SEASON, choices=data_store.list_seasons(),
+                        help="Musim yang dirender (default: %(default)s)")
+    parser.add_argument('--teams', nargs='+', metavar='TEAM',
+                        help="Nama tim (default: semua tim di musim tersebut)")
+    parser.add_argument('--out', default='reports', help="Folder output (default: %(default)s)")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                        help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument('--images', choices=IMAGE_FORMATS,
+                        help="Ekspor juga setiap grafik sebagai gambar (butuh paket kaleido)")
+    args = parser.parse_args(argv)
+
+    if args.images and importlib.util.find_spec('kaleido') is None:
+        parser.error("--images membutuhkan paket 'kaleido' (pip install kaleido)")
+    season_teams = comparison.season_teams(args.season)
+    unknown = [team for team in args.teams or [] if team not in season_teams]
+    if unknown:
+        parser.error(f"tim tidak ada di {args.season}: {', '.join(unknown)}")
+    args.teams = args.teams or season_teams
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / PLOTLY_JS).write_text(get_plotlyjs(), encoding='utf-8')
+
+    wall_start = time.perf_counter()
+    # Konversi CSV -> Arrow dilakukan sekali di sini agar worker langsung membaca cache
+    render_league(out_dir, args.season, args.images)
+    print(f"{'Liga':<20} {time.perf_counter() - wall_start:8.2f}s")
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(render_team, args.season, team, out_dir, args.images) for team in args.teams]
+        for future in as_completed(futures):
+            team, figure_count, seconds = future.result()
+            print(f"{team:<20} {seconds:8.2f}s  ({figure_count} grafik)")
+
+    index = write_index(out_dir, args.season, args.teams)
+    print(f"{'Total (wall time)':<20} {time.perf_counter() - wall_start:8.2f}s  -> {index}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Pencarian pemain serupa (nearest neighbour) untuk scouting pengganti.
+
+Semua baris berformat statistik pemain (52 kolom) digabung menjadi satu pool
+player-season: file pemain setiap tim di setiap musim, ditambah statistik
+jungler liga (data_jungler, agregat karier). Metrik per game / per menit /
+share distandarkan (z-score, dipotong di +-Z_CLIP), lalu setiap baris
+dinormalisasi ke panjang 1 sehingga kemiripan = cosine = satu perkalian
+matriks-vektor float32. Index dibangun sekali per versi data; satu query atas
+puluhan ribu baris hanya butuh beberapa milidetik.
+
+Role diambil dari data yang ada (statistik jungler, ROSTERS, riwayat match
+NAVI). Pemain tanpa data role diberi role dengan centroid terdekat dari
+pemain yang role-nya diketahui (kolom 'Role Source' = 'inferensi').
+"""
+import numpy as np
+import pandas as pd
+
+import analytics
+import comparison
+import data_store
+
+# Metrik gaya bermain (bukan hasil seperti win rate, bukan total yang bergantung jumlah game)
+FEATURES = [
+    'Average Kills per game', 'Average Deaths', 'Average Assists', 'KDA Ratio', 'Kill Participation%',
+    'Average Gold', 'Gold Per Minute', 'Gold Share%', 'Exp Per Minute',
+    'Average Damage', 'Damage Per Minute', 'Damage Share%', 'Damage/Gold%',
+    'Average Building Damage', 'Building Damage Share%',
+    'Average Damage Taken', 'Damage Taken Per Minute', 'Damage Taken Share%', 'DMG taken/Gold%',
+    'Control time per game/s', 'Heal per game',
+    'Towers per Game', 'Turtles per Game', 'Lords per Game', 'First Blood Rate',
+]
+# Metrik per game yang dihitung dari kolom total
+PER_GAME = {
+    'Towers per Game': 'Towers Secured',
+    'Turtles per Game': 'Cryoturtle Secured',
+    'Lords per Game': 'Lord Secured',
+    'First Blood Rate': 'First Blood',
+}
+ROLES = ['Jungler', 'Gold', 'Mid', 'Roam', 'Exp']
+
+# Kolom identitas pool (diikuti kolom FEATURES)
+POOL_COLUMNS = ['Player', 'ID', 'Team', 'Season', 'Games Played', 'Games Win Ratio%', 'Role', 'Role Source']
+
+CAREER_SEASON = 'Karier'
+Z_CLIP = 4.0
+
+
+class PlayerIndex:
+    """Pool player-season + matriks fitur ter-normalisasi (dibangun lewat `player_index`)."""
+
+    def __init__(self, pool, vectors):
+        self.pool = pool
+        self.vectors = vectors
+        self._search_names = pool['Player'].str.lower().to_numpy()
+        self._ids = pool['ID'].fillna(pool['Player']).to_numpy()
+
+    def __len__(self):
+        return len(self.pool)
+
+    def search(self, text, limit=200):
+        """Posisi baris yang nama pemainnya mengandung `text` (maksimal `limit`)."""
+        if not text:
+            return np.arange(min(limit, len(self.pool)))
+        matches = np.flatnonzero(pd.Series(self._search_names).str.contains(text.lower(), regex=False).to_numpy())
+        return matches[:limit]
+
+    def label(self, position):
+        row = self.pool.iloc[position]
+        return f"{row['Player']} — {row['Team']} ({row['Season']})"
+
+    def similar(self, positions, k=10, role=None, min_games=0):
+        """
+        k pemain paling mirip untuk setiap posisi di `positions` (batch), tanpa
+        pemain itu sendiri (ID sama, di musim mana pun). Mengembalikan list
+        DataFrame (satu per query) berisi baris pool + kolom 'Similarity'
+        (cosine, -1..1).
+        """
+        positions = np.atleast_1d(positions)
+        mask = self.pool['Games Played'].to_numpy() >= min_games
+        if role:
+            mask &= self.pool['Role'].to_numpy() == role
+        candidates = np.flatnonzero(mask)
+
+        # (kandidat x query) cosine dalam satu perkalian matriks
+        scores = self.vectors[candidates] @ self.vectors[positions].T
+        results = []
+        for q, position in enumerate(positions):
+            column = scores[:, q].copy()
+            column[self._ids[candidates] == self._ids[position]] = -np.inf
+            n = min(k, np.count_nonzero(np.isfinite(column)))
+            top = np.argpartition(-column, n - 1)[:n] if n else np.array([], dtype='int64')
+            top = top[np.argsort(-column[top], kind='stable')]
+            result = self.pool.iloc[candidates[top]].copy()
+            result.insert(0, 'Similarity', column[top])
+            results.append(result)
+        return results
+
+
+# --- POOL ---
+def _sources():
+    """(season, team, nama dataset) untuk semua file pemain tim yang tersedia."""
+    sources = []
+    for season in data_store.list_seasons():
+        for team in data_store.load_team_stats(season)['Team Name']:
+            name = f'{data_store.team_code(team)}_player_stats'
+            if data_store.has_dataset(name, season):
+                sources.append((season, team, name))
+    return sources
+
+
+def _known_roles():
+    """(Season, Team, Player) -> role dari ROSTERS dan riwayat match NAVI (role yang paling sering dimainkan)."""
+    roles = {}
+    role_stats = analytics.player_role_stats().reset_index()
+    main_roles = role_stats.sort_values('Games', ascending=False).drop_duplicates('Player')
+    for player, role in zip(main_roles['Player'], main_roles['Role']):
+        roles[(data_store.CURRENT_SEASON, 'NAVI', player)] = role
+    for season, teams in comparison.ROSTERS.items():
+        for team, lineup in teams.items():
+            for role, player in lineup.items():
+                roles[(season, team, player)] = role
+    return roles
+
+
+def _standardize(values):
+    mean = np.nanmean(values, axis=0)
+    std = np.nanstd(values, axis=0)
+    z = np.divide(values - mean, std, out=np.zeros_like(values), where=std > 0)
+    z = np.clip(np.nan_to_num(z), -Z_CLIP, Z_CLIP)
+    norms = np.linalg.norm(z, axis=1, keepdims=True)
+    return np.divide(z, norms, out=np.zeros_like(z), where=norms > 0).astype('float32')
+
+
+def _build(sources):
+    frames = []
+    for season, team, name in sources:
+        df = data_store.load(name, season)
+        frames.append(df.assign(Season=season, Team=team, ID=df['Player No.']))
+    jungler_df = data_store.load('jungler_stats')
+    frames.append(jungler_df.assign(Season=CAREER_SEASON, Team='-', Role='Jungler'))
+    stats_df = pd.concat(frames, ignore_index=True)
+    stats_df = stats_df[stats_df['Games Played'] > 0].reset_index(drop=True)
+
+    games = stats_df['Games Played'].to_numpy(dtype='float64')
+    for column, total in PER_GAME.items():
+        stats_df[column] = stats_df[total].to_numpy(dtype='float64') / games
+    vectors = _standardize(stats_df[FEATURES].to_numpy(dtype='float64'))
+
+    known = _known_roles()
+    keys = zip(stats_df['Season'], stats_df['Team'], stats_df['Player'])
+    roles = stats_df['Role'].fillna(pd.Series([known.get(key) for key in keys])).to_numpy(dtype=object)
+    labelled = pd.notna(roles)
+    source = np.where(labelled, 'data', 'inferensi')
+
+    # Role yang tidak diketahui = role dengan centroid (rata-rata vektor) terdekat
+    known_roles = [role for role in ROLES if (roles == role).any()]
+    if known_roles and not labelled.all():
+        centroids = np.stack([vectors[roles == role].mean(axis=0) for role in known_roles])
+        nearest = (vectors[~labelled] @ centroids.T).argmax(axis=1)
+        roles[~labelled] = np.array(known_roles, dtype=object)[nearest]
+
+    pool = stats_df[POOL_COLUMNS[:6]].copy()
+    pool.insert(4, 'Role', pd.Categorical(roles, categories=ROLES))
+    pool.insert(5, 'Role Source', source)
+    pool[FEATURES] = stats_df[FEATURES]
+    return PlayerIndex(pool, vectors)
+
+
+def player_index():
+    """`PlayerIndex` untuk semua player-season yang tersedia, dibangun sekali per versi data."""
+    sources = _sources()
+    version = '|'.join([data_store.dataset_version('jungler_stats'), data_store.dataset_version('navi_match_history')]
+                       + [data_store.dataset_version(name, season) for season, _, name in sources])
+    return data_store.get_or_build(('derived', 'player_index'), version, lambda: _build(sources))
@@ -0,0 +1,122 @@
+"""
+Pengukuran cold start kedua dashboard di proses Python baru.
+
+Setiap dashboard dijalankan `--repeat` kali, masing-masing di interpreter
+baru (seperti container yang baru dinyalakan), lalu dicatat:
+- streamlit: waktu import Streamlit (di deployment sudah dibayar oleh server)
+- first_render: import modul dashboard + render pertama halaman default
+- modules: modul berat yang di-import oleh render pertama (belum dimuat Streamlit)
+- datasets: dataset yang dimuat proses (render pertama + thread background),
+  dicatat SETTLE_SECONDS setelah render agar pemuatan di background ikut terlihat
+
+Watcher file data ikut berjalan seperti di deployment (MLBB_WATCH tidak diubah).
+
+Secara bawaan spec figure di `.cache/figures` (lihat `figure_cache`) dipakai
+seperti restart biasa; `--fresh` memakai folder figure kosong di setiap run
+untuk mengukur start pertama setelah deploy.
+
+`--budget` (detik) membuat perintah keluar dengan kode 1 jika median
+first_render dashboard mana pun melewatinya, untuk dipakai di CI.
+
+    python startup.py --repeat 3 --budget 2.5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS = ['Main.py', 'Main-challange.py']
+
+# Jeda setelah render pertama sebelum dataset yang dimuat dicatat
+SETTLE_SECONDS = 1.0
+
+# Modul yang import-nya mahal, dilaporkan jika dimuat oleh render pertama
+HEAVY_MODULES = ['pandas', 'numpy', 'pyarrow', 'pyarrow.parquet', 'plotly.express', 'plotly.graph_objects',
+                 'PIL.Image', 'watchdog.observers']
+
+
+def measure(script):
+    """Dijalankan di proses baru: mengukur satu cold start `script`."""
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    streamlit_seconds = time.perf_counter() - start
+
+    preloaded = set(sys.modules)
+    start = time.perf_counter()
+    at = AppTest.from_file(script, default_timeout=600)
+    at.run()
+    first_render = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{script}: {at.exception[0].value}")
+
+    time.sleep(SETTLE_SECONDS)
+    data_store = sys.modules.get('data_store')
+    datasets = sorted(f'{name}/{season}' for name, season in data_store.loaded_datasets()) \
+        if data_store is not None else []
+    return {
+        'streamlit': streamlit_seconds,
+        'first_render': first_render,
+        'modules': [name for name in HEAVY_MODULES if name in sys.modules and name not in preloaded],
+        'datasets': datasets,
+    }
+
+
+def run(script, repeat, fresh=False):
+    runs = []
+    with tempfile.TemporaryDirectory(prefix='mlbb-startup-') as tmp:
+        output = Path(tmp) / 'startup.json'
+        env = dict(os.environ)
+        for i in range(repeat):
+            if fresh:
+                env['MLBB_FIGURE_DIR'] = str(Path(tmp) / f'figures-{i}')
+            subprocess.run([sys.executable, __file__, '--child', script, '--output', str(output)],
+                           env=env, check=True, cwd=Path(__file__).resolve().parent)
+            runs.append(json.loads(output.read_text(encoding='utf-8')))
+    return {
+        'streamlit': statistics.median(r['streamlit'] for r in runs),
+        'first_render': statistics.median(r['first_render'] for r in runs),
+        'first_render_min': min(r['first_render'] for r in runs),
+        'modules': runs[-1]['modules'],
+        'datasets': runs[-1]['datasets'],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mengukur waktu cold start (import + render pertama) dashboard.")
+    parser.add_argument('scripts', nargs='*', default=SCRIPTS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--budget', type=float, help="Batas median render pertama (detik)")
+    parser.add_argument('--fresh', action='store_true', help="Tanpa cache figure di disk (start pertama)")
+    parser.add_argument('--output', help="File hasil JSON")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        import logging
+        logging.disable(logging.CRITICAL)
+        Path(args.output).write_text(json.dumps(measure(args.child)), encoding='utf-8')
+        return
+
+    results = {script: run(script, args.repeat, args.fresh) for script in args.scripts}
+    for script, result in results.items():
+        print(f"{script:<20} streamlit {result['streamlit']:6.2f}s  render pertama {result['first_render']:6.2f}s "
+              f"(min {result['first_render_min']:.2f}s)")
+        print(f"{'':<20} modul: {', '.join(result['modules']) or '-'}")
+        print(f"{'':<20} dataset: {', '.join(result['datasets']) or '-'}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=1), encoding='utf-8')
+
+    over = [script for script, result in results.items()
+            if args.budget is not None and result['first_render'] > args.budget]
+    if over:
+        print(f"Melewati budget {args.budget:.2f}s: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+Generator data sintetis berskala liga besar dengan skema yang sama persis
+dengan CSV asli (header, separator, encoding dan tipe kolom).
+
+Baris asli selalu disertakan (ONIC ID, NAVI, pemain & hero yang disebut di
+halaman), lalu ditambah baris sintetis yang di-resample dari distribusi kolom
+data asli dengan sedikit noise. Hasilnya bisa langsung dipakai dashboard:
+
+    python synth.py --out /tmp/mlbb-large --preset large
+    MLBB_DATA_ROOT=/tmp/mlbb-large streamlit run Main-challange.py
+"""
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import data_store
+import validation
+
+# Ukuran bawaan: pemain = baris statistik jungler, games = total game di riwayat match
+PRESETS = {
+    'small': dict(players=1_000, games=50_000, teams=50, seasons=2, heroes=130),
+    'medium': dict(players=5_000, games=250_000, teams=200, seasons=3, heroes=130),
+    'large': dict(players=10_000, games=1_000_000, teams=500, seasons=5, heroes=130),
+}
+
+ROSTER_SIZE = 8
+HERO_POOL_SIZE = 8
+TEAM_HEROES = 60
+LINEUP_COLUMNS = ['Player_Mid', 'Player_Roam', 'Player_Gold', 'Player_Exp', 'Player_Jungler']
+
+
+# --- BACA / TULIS DENGAN SKEMA ASLI ---
+def read_seed(name):
+    """Dataset asli dari repo (bukan dari MLBB_DATA_ROOT), dengan tipe sesuai skema."""
+    spec = data_store.dataset_spec(name)
+    return pd.read_csv(data_store.BASE_DIR / spec.path, sep=spec.sep, dtype=spec.schema, encoding=spec.encoding)
+
+
+def write_dataset(df, root, name, season=None):
+    spec = data_store.dataset_spec(name, season)
+    path = Path(root) / spec.path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Noise per kolom membuat total, rata-rata dan rate tidak cocok lagi: hitung ulang sesuai
+    # cek validasi dataset agar data sintetis tidak dikarantina saat ingest
+    df = validation.repair(df, spec.checks)
+    df.to_csv(path, sep=spec.sep, index=False, encoding=spec.encoding)
+    return len(df)
+
+
+# --- RESAMPLING ---
+def resample(seed_df, n, rng, noise=0.2):
+    """
+    n baris hasil resample `seed_df`; kolom numerik dikalikan noise acak
+    (1 +- noise) per sel, kolom bilangan bulat dibulatkan, tidak ada nilai negatif.
+    """
+    sampled = seed_df.iloc[rng.integers(0, len(seed_df), n)].reset_index(drop=True)
+    for col in sampled.select_dtypes('number').columns:
+        values = sampled[col].to_numpy(dtype='float64') * rng.uniform(1 - noise, 1 + noise, n)
+        values = np.maximum(values, 0)
+        if pd.api.types.is_integer_dtype(sampled[col]):
+            sampled[col] = np.rint(values).astype(sampled[col].dtype)
+        else:
+            sampled[col] = values.round(2)
+    return sampled
+
+
+def names(prefix, n, start=1):
+    width = len(str(start + n))
+    return [f'{prefix}{i:0{width}d}' for i in range(start, start + n)]
+
+
+# --- DATASET ---
+def team_stats(seed_df, n_teams, rng):
+    extra = max(n_teams - len(seed_df), 0)
+    synthetic = resample(seed_df, extra, rng)
+    synthetic['Team Name'] = names('Team ', extra)
+    df = pd.concat([seed_df, synthetic], ignore_index=True)
+    df['No.'] = np.arange(1, len(df) + 1, dtype=df['No.'].dtype)
+    return df
+
+
+def team_players(seed_df, team, rng):
+    df = resample(seed_df, ROSTER_SIZE, rng)
+    code = data_store.team_code(team)
+    df['Player'] = names(f'{code}_p', ROSTER_SIZE)
+    df['Player No.'] = names(f'SY-{code}-', ROSTER_SIZE)
+    return df
+
+
+def team_heroes(seed_df, team, heroes, rng):
+    n = min(TEAM_HEROES, len(heroes))
+    df = resample(seed_df, n, rng)
+    df['Hero'] = rng.choice(heroes, n, replace=False)
+    df['Team'] = data_store.team_code(team).upper()
+    df['Team Code'] = f'SY-{data_store.team_code(team)}'
+    df['No.'] = np.arange(1, n + 1, dtype=df['No.'].dtype)
+    return df
+
+
+def hero_stats(seed_df, n_heroes, rng):
+    extra = max(n_heroes - len(seed_df), 0)
+    synthetic = resample(seed_df, extra, rng)
+    synthetic['Hero'] = names('Hero ', extra, start=len(seed_df) + 1)
+    return pd.concat([seed_df, synthetic], ignore_index=True)
+
+
+def jungler_stats(seed_df, n_players, rng):
+    extra = max(n_players - len(seed_df), 0)
+    synthetic = resample(seed_df, extra, rng)
+    synthetic['Player'] = names('Jungler ', extra)
+    synthetic['ID'] = names('SY-J', extra)
+    return pd.concat([seed_df, synthetic], ignore_index=True)
+
+
+def jungler_hero_pool(seed_df, players_df, heroes, rng):
+    synthetic_players = players_df[~players_df['ID'].isin(seed_df['Player ID'])]
+    n = len(synthetic_players) * HERO_POOL_SIZE
+    synthetic = resample(seed_df, n, rng)
+    synthetic['Player'] = np.repeat(synthetic_players['Player'].to_numpy(), HERO_POOL_SIZE)
+    synthetic['Player ID'] = np.repeat(synthetic_players['ID'].to_numpy(), HERO_POOL_SIZE)
+    # Hero berbeda untuk setiap pemain (pasangan Player ID + Hero unik)
+    picks = rng.permuted(np.tile(np.arange(len(heroes)), (len(synthetic_players), 1)), axis=1)
+    synthetic['Hero'] = np.asarray(heroes)[picks[:, :HERO_POOL_SIZE].reshape(-1)]
+    return pd.concat([seed_df, synthetic], ignore_index=True)
+
+
+def match_history(seed_df, n_games, opponents, rng):
+    """
+    Riwayat match Bo3 dengan total sekitar `n_games` game. Lineup diambil dari
+    pemain per role di data asli ditambah pemain sintetis, dengan pergantian
+    pemain antar game sesekali.
+    """
+    n_matches = max(int(n_games / 2.5), 1)
+    game_played = rng.choice(np.array([2, 3], dtype='int32'), n_matches)
+    win = rng.random(n_matches) < 0.5
+    score_navi = np.where(game_played == 2, np.where(win, 2, 0), np.where(win, 2, 1)).astype('int32')
+
+    df = pd.DataFrame({
+        'Match': np.arange(len(seed_df) + 1, len(seed_df) + n_matches + 1, dtype='int32'),
+        'Opponent': rng.choice(opponents, n_matches),
+        'Result': np.where(win, 'Win', 'Lose'),
+        'Score_NAVI': score_navi,
+        'Score_Opponent': (game_played - score_navi).astype('int32'),
+        'Game_Played': game_played,
+    })
+    for col in LINEUP_COLUMNS:
+        seed_players = seed_df[col].str.split(',').explode().str.strip().unique()
+        pool = np.concatenate([seed_players, names(f'navi_{col[len("Player_"):].lower()}_', 3)])
+        starter = rng.choice(pool, n_matches)
+        # Pemain cadangan masuk di ~10% game
+        games = [pd.Series(np.where(rng.random(n_matches) < 0.1, rng.choice(pool, n_matches), starter))
+                 for _ in range(3)]
+        two = games[0] + ',' + games[1]
+        df[col] = np.where(game_played == 3, two + ',' + games[2], two)
+    return pd.concat([seed_df, df], ignore_index=True)
+
+
+def league_results(teams, n_matches, seasons, rng):
+    """
+    Hasil match Bo3 seluruh liga (kolom `ratings.RESULT_COLUMNS`), urut per
+    musim. Setiap tim punya kekuatan tersembunyi sehingga hasilnya tidak acak murni.
+    """
+    teams = np.asarray(teams)
+    strength = rng.normal(0, 200, len(teams))
+    home = rng.integers(0, len(teams), n_matches)
+    away = (home + rng.integers(1, len(teams), n_matches)) % len(teams)
+    p = 1 / (1 + 10 ** ((strength[away] - strength[home]) / 400))
+    games = rng.random((n_matches, 3)) < p[:, None]
+    # Seri berhenti begitu satu tim menang 2 game
+    third = games[:, 0] != games[:, 1]
+    score_team = games[:, 0].astype('int32') + games[:, 1] + (third & games[:, 2])
+    game_played = np.where(third, 3, 2).astype('int32')
+    return pd.DataFrame({
+        'Season': np.repeat(seasons, -(-n_matches // len(seasons)))[:n_matches],
+        'Team': teams[home],
+        'Opponent': teams[away],
+        'Score_Team': score_team,
+        'Score_Opponent': game_played - score_team,
+    })
+
+
+def generate(root, players, games, teams, seasons, heroes, seed=0):
+    """
+    Menulis satu set data lengkap ke `root` (data/, data/seasons/<musim>/,
+    data_jungler/). Mengembalikan jumlah baris per dataset.
+    """
+    rng = np.random.default_rng(seed)
+    rows = {}
+
+    seed_teams = read_seed('team_stats')
+    seed_players = pd.concat([read_seed('navi_player_stats'), read_seed('onic_player_stats')], ignore_index=True)
+    seed_heroes = pd.concat([read_seed('navi_hero_stats'), read_seed('onic_hero_stats')], ignore_index=True)
+
+    meta_df = hero_stats(read_seed('hero_stats'), heroes, rng)
+    hero_names = meta_df['Hero'].to_numpy()
+    rows['hero_stats'] = write_dataset(meta_df, root, 'hero_stats')
+
+    current = int(data_store.CURRENT_SEASON[1:])
+    for season in [f'S{current - i}' for i in range(seasons)]:
+        teams_df = team_stats(seed_teams, teams, rng)
+        rows[f'team_stats/{season}'] = write_dataset(teams_df, root, 'team_stats', season)
+        for team in teams_df['Team Name']:
+            code = data_store.team_code(team)
+            if team in data_store.TEAM_CODES:
+                # File pemain/hero asli dipertahankan agar halaman yang menyebut nama pemain tetap jalan
+                players_df, heroes_df = read_seed(f'{code}_player_stats'), read_seed(f'{code}_hero_stats')
+            else:
+                players_df = team_players(seed_players, team, rng)
+                heroes_df = team_heroes(seed_heroes, team, hero_names, rng)
+            write_dataset(players_df, root, f'{code}_player_stats', season)
+            write_dataset(heroes_df, root, f'{code}_hero_stats', season)
+
+    opponents = teams_df.loc[teams_df['Team Name'] != 'NAVI', 'Team Name'].to_numpy()
+    rows['navi_match_history'] = write_dataset(
+        match_history(read_seed('navi_match_history'), games, opponents, rng), root, 'navi_match_history')
+
+    jungler_df = jungler_stats(read_seed('jungler_stats'), players, rng)
+    rows['jungler_stats'] = write_dataset(jungler_df, root, 'jungler_stats')
+    rows['jungler_hero_pool'] = write_dataset(
+        jungler_hero_pool(read_seed('jungler_hero_pool'), jungler_df, hero_names, rng), root, 'jungler_hero_pool')
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generator data liga sintetis dengan skema CSV asli.")
+    parser.add_argument('--out', required=True, help="Folder output (dipakai sebagai MLBB_DATA_ROOT)")
+    parser.add_argument('--preset', choices=PRESETS, default='small')
+    for option in PRESETS['small']:
+        parser.add_argument(f'--{option}', type=int, help=f"Override jumlah {option} dari preset")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    sizes = {option: getattr(args, option) or value for option, value in PRESETS[args.preset].items()}
+    start = time.perf_counter()
+    rows = generate(args.out, seed=args.seed, **sizes)
+    for name, count in rows.items():
+        print(f"{name:<24} {count:>10,} baris")
+    print(f"Selesai dalam {time.perf_counter() - start:.1f}s -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
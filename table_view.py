@@ -0,0 +1,133 @@
+"""
+Tabel dengan paginasi, sorting, filter, dan pilihan kolom di sisi server.
+
+Hanya potongan halaman yang terlihat (PAGE_SIZES baris x kolom terpilih)
+yang diserialisasi ke Arrow dan dikirim ke browser, jadi biaya membuka tabel
+sama untuk 60 maupun 600 ribu baris. Urutan sort (posisi baris) dihitung
+sekali per (tabel, kolom, arah, versi data) dan dibagi bersama oleh semua
+sesi lewat `data_store.get_or_build`. Hasil query (filter + sort) disimpan di
+LRU bersama berbatas ukuran (MAX_QUERY_BYTES), sehingga pindah halaman tidak
+menghitung ulang filter dan setiap sesi hanya menyimpan kunci query-nya
+(tidak tumbuh mengikuti ukuran tabel).
+
+Filter: teks biasa = "mengandung" (tanpa membedakan huruf besar/kecil);
+untuk kolom numerik bisa juga perbandingan seperti `>= 50`, `< 3`, `= 10`.
+"""
+import operator
+import re
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import data_store
+from caching import BoundedLRU
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+NO_SORT = "(urutan asli)"
+ALL_COLUMNS = "(semua kolom)"
+
+COMPARISONS = {'>=': operator.ge, '<=': operator.le, '>': operator.gt, '<': operator.lt,
+               '=': operator.eq, '==': operator.eq, '!=': operator.ne}
+_COMPARISON_RE = re.compile(r'^\s*(>=|<=|==|!=|>|<|=)\s*(-?\d+(?:\.\d+)?)\s*$')
+
+# Batas total ukuran hasil query (posisi baris) yang disimpan bersama oleh semua sesi
+MAX_QUERY_BYTES = 64 * 1024 * 1024
+
+
+# --- QUERY ---
+def sort_order(name, df, version, column, ascending=True):
+    """Posisi baris `df` terurut menurut `column` (stabil, NaN di akhir), di-cache per versi data."""
+    def build():
+        values = df[column].reset_index(drop=True)
+        return values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+    return data_store.get_or_build(('derived', 'table_order', name, column, ascending), version, build)
+
+
+def _text_values(name, df, version, column):
+    # Nilai kolom sebagai teks huruf kecil, di-cache agar filter teks tidak mengonversi ulang setiap query
+    return data_store.get_or_build(('derived', 'table_text', name, column), version,
+                                   lambda: df[column].astype(str).str.lower().to_numpy(dtype=object))
+
+
+def filter_mask(name, df, version, column, text):
+    """Mask boolean baris yang cocok dengan filter `text` pada `column` (atau semua kolom jika None)."""
+    columns = [column] if column else list(df.columns)
+    comparison = _COMPARISON_RE.match(text)
+    mask = np.zeros(len(df), dtype=bool)
+    for col in columns:
+        if comparison and pd.api.types.is_numeric_dtype(df[col]):
+            op, value = COMPARISONS[comparison.group(1)], float(comparison.group(2))
+            mask |= op(df[col].to_numpy(dtype='float64'), value)
+        else:
+            values = pd.Series(_text_values(name, df, version, col))
+            mask |= values.str.contains(text.strip().lower(), regex=False).to_numpy()
+    return mask
+
+
+def query(name, df, version, sort_by=None, ascending=True, filter_column=None, filter_text=''):
+    """Posisi baris hasil filter + sort (belum dipotong per halaman)."""
+    positions = sort_order(name, df, version, sort_by, ascending) if sort_by else np.arange(len(df))
+    if filter_text.strip():
+        positions = positions[filter_mask(name, df, version, filter_column, filter_text)[positions]]
+    return positions
+
+
+class QueryCache(BoundedLRU):
+    """Posisi baris per query; `get_or_build(key, build)` hanya memanggil `build()` saat miss."""
+
+    def __init__(self, max_bytes=MAX_QUERY_BYTES):
+        super().__init__(max_bytes, lambda positions: positions.nbytes)
+
+
+_queries = QueryCache()
+
+
+def page_slice(df, positions, page, page_size, columns=None):
+    """Baris di halaman `page` (mulai dari 1) dengan kolom `columns` saja."""
+    start = (page - 1) * page_size
+    rows = df.iloc[positions[start:start + page_size]]
+    return rows[columns] if columns else rows
+
+
+# --- KOMPONEN STREAMLIT ---
+@st.fragment
+def paginated_table(name, df, version, key=None):
+    """
+    Tabel `df` (dataset `name` pada `version`) dengan kontrol filter, sort,
+    kolom, dan halaman. Berjalan sebagai fragment: mengganti halaman/filter
+    hanya menjalankan ulang tabel ini.
+    """
+    key = key or f'table_{name}'
+    col1, col2, col3, col4 = st.columns([2, 3, 2, 1])
+    filter_column = col1.selectbox("Filter kolom", [ALL_COLUMNS] + list(df.columns), key=f'{key}_filter_col')
+    filter_text = col2.text_input("Filter", key=f'{key}_filter', placeholder="teks, atau >= 50 untuk angka")
+    sort_by = col3.selectbox("Urutkan", [NO_SORT] + list(df.columns), key=f'{key}_sort')
+    ascending = col4.toggle("Naik", value=True, key=f'{key}_asc')
+    columns = st.multiselect("Kolom", list(df.columns), key=f'{key}_columns', placeholder="Semua kolom")
+
+    # Hasil query dibagi bersama semua sesi; sesi hanya menyimpan kunci query terakhir
+    query_key = (version, filter_column, filter_text, sort_by, ascending)
+    positions = _queries.get_or_build(
+        (name,) + query_key,
+        lambda: query(name, df, version, None if sort_by == NO_SORT else sort_by, ascending,
+                      None if filter_column == ALL_COLUMNS else filter_column, filter_text))
+    previous = st.session_state.get(f'{key}_query')
+    if previous != query_key:
+        st.session_state[f'{key}_query'] = query_key
+        if previous is not None:
+            st.session_state[f'{key}_page'] = 1
+
+    col1, col2, col3 = st.columns([1, 1, 4], vertical_alignment='bottom')
+    page_size = col2.selectbox("Baris per halaman", PAGE_SIZES, index=1, key=f'{key}_page_size')
+    pages = max(1, -(-len(positions) // page_size))
+    if st.session_state.get(f'{key}_page', 1) > pages:
+        st.session_state[f'{key}_page'] = pages
+    page = col1.number_input("Halaman", min_value=1, max_value=pages, key=f'{key}_page')
+
+    st.dataframe(page_slice(df, positions, page, page_size, columns), hide_index=True)
+    start = (page - 1) * page_size
+    shown = f"{start + 1:,}–{min(start + page_size, len(positions)):,}" if len(positions) else "0"
+    filtered = f" (terfilter dari {len(df):,})" if len(positions) != len(df) else ""
+    col3.caption(f"Baris {shown} dari {len(positions):,}{filtered} · halaman {page} / {pages}")
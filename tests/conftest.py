@@ -0,0 +1,23 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+import data_store
+import incremental
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def data_root(tmp_path, monkeypatch):
+    # Salinan data sumber; cache Arrow, karantina dan state ditulis di bawah tmp_path
+    for name in ('data', 'data_jungler'):
+        shutil.copytree(REPO / name, tmp_path / name)
+    monkeypatch.setattr(data_store, 'DATA_ROOT', tmp_path)
+    monkeypatch.setattr(data_store, 'CACHE_DIR', tmp_path / '.cache' / 'columnar')
+    monkeypatch.setattr(data_store, 'QUARANTINE_DIR', tmp_path / '.cache' / 'quarantine')
+    monkeypatch.setattr(incremental, 'STATE_DIR', tmp_path / '.cache' / 'incremental')
+    for name in ('_frames', '_mapped', '_published', '_rejected'):
+        monkeypatch.setattr(data_store, name, {})
+    return tmp_path
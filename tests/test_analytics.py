@@ -0,0 +1,46 @@
+import math
+
+import pandas as pd
+
+import analytics
+
+
+def _history(rows):
+    columns = ['Match', 'Opponent', 'Result', 'Score_NAVI', 'Score_Opponent', 'Game_Played', *analytics.LINEUP_ROLES]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _role_stats(rows):
+    return analytics._player_role_stats(analytics._match_games(_history(rows)))
+
+
+def test_mixed_lineup_series_does_not_credit_full_score():
+    # Seperti match 7: Woshipaul hanya main game ketiga dari seri 1-2
+    stats = _role_stats([
+        (7, 'EVOS', 'Lose', 1, 2, 3, 'M,M,M', 'R,R,R', 'G,G,G', 'E,E,E', 'Aether,Aether,Woshipaul'),
+    ])
+    woshipaul = stats.loc[('Woshipaul', 'Jungler')]
+    assert woshipaul['Games'] == 1
+    assert math.isnan(woshipaul['Games Won'])
+    assert math.isnan(woshipaul['Win Rate%'])
+    # Pemain yang main semua game tetap mendapat skor seri
+    assert stats.loc[('M', 'Mid'), 'Games Won'] == 1
+
+
+def test_partial_series_with_determined_result():
+    # Seri 2-0: semua game yang dimainkan pasti menang; seri 0-2: pasti kalah
+    stats = _role_stats([
+        (1, 'RRQ', 'Win', 2, 0, 2, 'M,M', 'R,R', 'G,G', 'E,E', 'A,B'),
+        (2, 'TLID', 'Lose', 0, 2, 2, 'M,M', 'R,R', 'G,G', 'E,E', 'B,B'),
+    ])
+    assert stats.loc[('A', 'Jungler'), 'Games Won'] == 1
+    assert stats.loc[('B', 'Jungler'), 'Games Won'] == 1
+    assert stats.loc[('B', 'Jungler'), 'Games'] == 3
+    assert (stats['Games Won'].dropna() <= stats['Games']).all()
+
+
+def test_role_wins_never_exceed_games_on_real_history():
+    stats = analytics.player_role_stats()
+    won = stats['Games Won'].dropna()
+    assert (won <= stats.loc[won.index, 'Games']).all()
+    assert (stats['Win Rate%'].dropna() <= 100).all()
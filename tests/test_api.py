@@ -0,0 +1,71 @@
+import http.client
+import json
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import api
+import validation
+
+
+@pytest.fixture
+def server(data_root, monkeypatch):
+    monkeypatch.setattr(api, '_cache', api.ResponseCache())
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), api.Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_port
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def get(port, path, headers=None):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    conn.request('GET', path, headers=headers or {})
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+    return response, body
+
+
+def test_etag_matches_lists_and_weak_tags():
+    assert api.etag_matches('"a", W/"b"', '"b"')
+    assert api.etag_matches('*', '"b"')
+    assert not api.etag_matches('"a"', '"b"')
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('gzip, deflate', True),
+    ('gzip;q=0.5', True),
+    ('gzip;q=0', False),
+    ('deflate, gzip; q=0.0', False),
+    ('*', True),
+    ('*;q=0', False),
+    ('*, gzip;q=0', False),
+    ('identity', False),
+    ('', False),
+])
+def test_accepts_gzip_honours_q_values(header, expected):
+    assert api.accepts_gzip(header) is expected
+
+
+def test_unknown_team_is_not_found(server):
+    response, body = get(server, '/api/head-to-head?team_a=ONIC%20ID&team_b=Tidak%20Ada')
+    assert response.status == 404
+    assert 'error' in json.loads(body)
+
+
+def test_gzip_refused_with_q_zero(server):
+    response, _ = get(server, '/api/teams', {'Accept-Encoding': 'gzip;q=0'})
+    assert response.status == 200
+    assert response.getheader('Content-Encoding') is None
+
+
+def test_unexpected_error_returns_json_500(server, monkeypatch):
+    def broken(params):
+        raise validation.ValidationError("rusak")
+    monkeypatch.setitem(api.ENDPOINTS, '/api/teams', (api._teams_version, broken))
+    response, body = get(server, '/api/teams')
+    assert response.status == 500
+    assert json.loads(body) == {'error': "Kesalahan server"}
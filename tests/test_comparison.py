@@ -0,0 +1,38 @@
+import numpy as np
+
+import comparison
+import data_store
+
+
+def add_past_season(data_root, season='S14'):
+    # Musim lama: NAVI dengan Match Win Rate% 50 (musim berjalan 0)
+    season_dir = data_root / data_store.SEASONS_DIR / season
+    season_dir.mkdir(parents=True)
+    source = (data_root / 'data' / 'team_statistics.csv').read_text(encoding='utf-8-sig')
+    (season_dir / 'team_statistics.csv').write_text(source.replace('2;NAVI;16;0;0;', '2;NAVI;16;8;50;'),
+                                                    encoding='utf-8-sig')
+    return season
+
+
+def test_head_to_head_matches_pairwise_differences(data_root):
+    stats = data_store.load_team_stats().set_index('Team Name')[comparison.TEAM_METRICS]
+    deltas = comparison.head_to_head().loc[data_store.CURRENT_SEASON]
+    teams = stats.index
+    assert len(deltas) == len(teams) ** 2
+    for team in teams:
+        for opponent in teams:
+            expected = stats.loc[team].to_numpy(dtype='float64') - stats.loc[opponent].to_numpy(dtype='float64')
+            np.testing.assert_allclose(deltas.loc[(team, opponent)].to_numpy(), expected)
+
+
+def test_team_matchup_is_per_season(data_root):
+    season = add_past_season(data_root)
+    stats, deltas = comparison.team_matchup('ONIC ID', 'NAVI')
+    assert stats.loc['NAVI', 'Match Win Rate%'] == 0
+    assert deltas.loc['ONIC ID', 'Match Win Rate%'] == 70
+
+    stats, deltas = comparison.team_matchup('ONIC ID', 'NAVI', season)
+    assert list(stats.index) == ['ONIC ID', 'NAVI']
+    assert stats.loc['NAVI', 'Match Win Rate%'] == 50
+    assert deltas.loc['ONIC ID', 'Match Win Rate%'] == 20
+    assert deltas.loc['NAVI', 'Match Win Rate%'] == -20
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import confidence
+
+
+def test_wilson_matches_reference_values():
+    low, high = confidence.wilson([0, 2, 10], [10, 21, 10])
+    assert low == pytest.approx([0.0, 0.0265, 0.7225], abs=1e-3)
+    assert high == pytest.approx([0.2775, 0.2890, 1.0], abs=1e-3)
+    # Tanpa game: interval tidak informatif, bukan NaN
+    assert confidence.wilson(0, 0) == (0.0, 1.0)
+
+
+def test_kda_bootstrap_brackets_point_estimate_and_is_reproducible():
+    kills, deaths, assists = np.array([39, 0, 120]), np.array([138, 0, 40]), np.array([208, 3, 200])
+    low, high = confidence.kda_bootstrap(kills, deaths, assists)
+    kda = (kills + assists) / np.maximum(deaths, 1)
+    assert (low <= kda).all() and (kda <= high).all()
+    again = confidence.kda_bootstrap(kills, deaths, assists)
+    np.testing.assert_array_equal(low, again[0])
+    # Baris dengan total yang sama mendapat interval yang sama
+    twice = confidence.kda_bootstrap(np.repeat(kills, 2), np.repeat(deaths, 2), np.repeat(assists, 2))
+    np.testing.assert_array_equal(twice[0][::2], twice[0][1::2])
+
+
+def test_mean_interval_narrows_with_more_games():
+    low, high = confidence.mean_interval([2000.0, 2000.0, 2000.0], [5, 50, 0], cv=0.35)
+    assert low[0] < low[1] < 2000 < high[1] < high[0]
+    assert np.isnan(low[2]) and np.isnan(high[2])
+
+
+def test_per_minute_interval_is_labelled_as_model_based():
+    row = pd.Series({'Damage Per Minute CI Low': 1800.0, 'Damage Per Minute CI High': 2600.0,
+                     'KDA Ratio CI Low': 1.5, 'KDA Ratio CI High': 2.5})
+    assert confidence.describe(row, 'KDA Ratio').startswith('95% CI')
+    assert 'model' in confidence.describe(row, 'Damage Per Minute', '.0f')
+
+
+def test_team_intervals_are_slices_of_the_league_batch():
+    players, heroes = confidence.league_intervals()
+    navi = confidence.team_intervals('NAVI')
+    assert set(navi['Team']) == {'NAVI'}
+    assert len(navi) + len(confidence.team_intervals('ONIC ID')) == len(players)
+    assert {'Game Win Rate% CI Low', 'KDA CI High'} <= set(heroes.columns)
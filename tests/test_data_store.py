@@ -0,0 +1,39 @@
+import threading
+import time
+
+import data_store
+
+
+def test_slower_publish_never_installs_an_older_version(data_root, monkeypatch):
+    source = data_root / data_store.dataset_spec('jungler_stats').path
+    load_frame = data_store._load_frame
+    started = threading.Event()
+
+    def slow_first_load(*args):
+        if not started.is_set():
+            started.set()
+            time.sleep(0.3)
+        return load_frame(*args)
+    monkeypatch.setattr(data_store, '_load_frame', slow_first_load)
+
+    # Sesi memuat versi lama (lambat) sementara watcher mempublikasikan versi baru
+    session = threading.Thread(target=data_store.publish, args=('jungler_stats',))
+    session.start()
+    started.wait()
+    source.write_bytes(source.read_bytes() + b'\n')
+    watcher = threading.Thread(target=data_store.publish, args=('jungler_stats',))
+    watcher.start()
+    session.join()
+    watcher.join()
+
+    digest, frame = data_store._published[('jungler_stats', data_store.CURRENT_SEASON)]
+    assert digest == data_store._file_hash(source)
+    assert frame is data_store._mapped[('jungler_stats', data_store.CURRENT_SEASON)][1]
+
+
+def test_load_publishes_once_when_publish_on_load(data_root, monkeypatch):
+    monkeypatch.setattr(data_store, '_publish_on_load', True)
+    first = data_store.load('team_stats')
+    assert data_store.published_version('team_stats') == data_store.dataset_version('team_stats')
+    assert data_store.load('team_stats') is first
+    assert ('team_stats', data_store.CURRENT_SEASON) in data_store.loaded_datasets()
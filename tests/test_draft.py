@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+import draft
+
+
+def _model():
+    # 2 tim x 3 hero; NAVI nyaman dengan A, ONIC nyaman dengan C
+    heroes = np.array(['A', 'B', 'C'], dtype=object)
+    meta = np.array([0.5, 0.6, 0.4])
+    components = {
+        'comfort': np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]),
+        'team_wr': np.array([[0.7, 0.6, 0.4], [0.5, 0.6, 0.9]]),
+        'ban_risk': np.array([[0.2, 0.0, 0.0], [0.0, 0.0, 0.5]]),
+    }
+    return draft.DraftModel(heroes, ['NAVI', 'ONIC ID'], meta, components)
+
+
+def test_scores_are_weighted_component_sums():
+    total, contributions = _model().scores('NAVI', 'ONIC ID')
+    w = draft.DEFAULT_WEIGHTS
+    expected_a = w['meta'] * 0.5 + w['comfort'] * 1.0 + w['team_wr'] * 0.7 + w['ban_risk'] * 0.2
+    expected_c = w['meta'] * 0.4 + w['team_wr'] * 0.4 + w['deny'] * 1.0
+    assert total[0] == pytest.approx(expected_a)
+    assert total[2] == pytest.approx(expected_c)
+    np.testing.assert_allclose(contributions.sum(axis=0), total)
+
+
+def test_recommend_skips_unavailable_and_sorts_by_score():
+    result = _model().recommend('NAVI', 'ONIC ID', unavailable=['A', 'Tidak Ada'], n=10)
+    assert list(result.index) == ['B', 'C']
+    assert result['Skor'].is_monotonic_decreasing
+    assert list(result.columns) == ['Skor', *draft.COMPONENTS]
+
+
+def test_weights_override_defaults():
+    only_meta = {name: 0.0 for name in draft.COMPONENTS} | {'meta': 1.0}
+    result = _model().recommend('NAVI', 'ONIC ID', n=1, weights=only_meta)
+    assert list(result.index) == ['B']
+
+
+def test_recommend_bans_takes_the_opponent_view():
+    model = _model()
+    bans = model.recommend_bans('NAVI', 'ONIC ID', n=3)
+    picks = model.recommend('ONIC ID', 'NAVI', n=3)
+    assert list(bans.index) == list(picks.index)
+    assert bans.index[0] == 'C'
+
+
+def test_unknown_team_raises_key_error():
+    with pytest.raises(KeyError):
+        _model().recommend('EVOS', 'NAVI')
+
+
+def test_draft_model_from_data(data_root):
+    model = draft.draft_model()
+    result = model.recommend('NAVI', 'ONIC ID', unavailable=['Granger', 'Suyou'], n=5)
+    assert len(result) == 5
+    assert not {'Granger', 'Suyou'} & set(result.index)
+    assert draft.draft_model() is model
@@ -0,0 +1,33 @@
+import io
+
+import pandas as pd
+import pytest
+
+import export
+
+FRAME = pd.DataFrame({'Player': ['Aether', 'Woshipaul', 'Karss'], 'KDA Ratio': [2.5, 1.75, 1.79]})
+
+
+@pytest.mark.parametrize('fmt', export.available_formats())
+def test_export_round_trip(fmt):
+    cache = export.ExportCache()
+    artifact = cache.get_or_build(('test', 'players'), 'v1', fmt, lambda: FRAME)
+    assert artifact.size == len(artifact.read())
+    if fmt == 'Excel':
+        # Membaca xlsx butuh openpyxl (bukan dependensi); cukup pastikan berkas zip OOXML
+        assert artifact.read()[:2] == b'PK'
+        return
+    readers = {'CSV': pd.read_csv, 'Parquet': pd.read_parquet}
+    pd.testing.assert_frame_equal(readers[fmt](io.BytesIO(artifact.read())), FRAME)
+
+
+def test_new_version_replaces_old_and_hits_are_cached():
+    cache = export.ExportCache()
+    first = cache.get_or_build(('test', 'players'), 'v1', 'CSV', lambda: FRAME)
+    assert cache.get_or_build(('test', 'players'), 'v1', 'CSV', lambda: 1 / 0) is first
+    cache.get_or_build(('test', 'players'), 'v2', 'CSV', lambda: FRAME.head(1))
+    assert cache.stats()['entries'] == 1
+
+
+def test_excel_is_offered_with_requirements_installed():
+    assert 'Excel' in export.available_formats()
@@ -0,0 +1,40 @@
+import os
+
+import plotly.graph_objects as go
+
+import figure_cache
+
+
+def test_disk_store_scans_only_when_over_the_cap(tmp_path, monkeypatch):
+    store = figure_cache.DiskStore(tmp_path, max_bytes=250)
+    scans = []
+    files = store._files
+    monkeypatch.setattr(store, '_files', lambda: scans.append(1) or files())
+
+    for i in range(4):
+        store.put(('page', i), 'x' * 100)
+        # mtime berbeda agar urutan "paling lama ditulis" pasti
+        path = store._path(('page', i))
+        os.utime(path, (i, i))
+
+    # Scan awal + satu scan setiap kali total melewati batas (put ketiga dan keempat)
+    assert len(scans) == 3
+    assert store._total == sum(p.stat().st_size for p in tmp_path.glob('*.json'))
+    assert store._total <= 250
+    assert store.get(('page', 3)) is not None
+    assert store.get(('page', 0)) is None
+
+
+def test_get_figure_returns_an_independent_copy(monkeypatch):
+    monkeypatch.setattr(figure_cache, '_cache', figure_cache.FigureCache())
+
+    def build():
+        return go.Figure(go.Bar(x=['a', 'b'], y=[1, 2]), layout={'title': {'text': 'asli'}})
+
+    first = figure_cache.get_figure('Test', 'bar', 'v1', build)
+    first['layout']['title']['text'] = 'diubah'
+    first['data'][0]['y'][0] = 99
+
+    second = figure_cache.get_figure('Test', 'bar', 'v1', build)
+    assert second['layout']['title']['text'] == 'asli'
+    assert list(second['data'][0]['y']) == [1, 2]
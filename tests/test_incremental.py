@@ -0,0 +1,80 @@
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import data_store
+import incremental
+
+REPO = Path(__file__).resolve().parent.parent
+
+ROSTER = {'Mid': 'xMagic', 'Roam': 'Hanafi', 'Gold': 'Xyve', 'Exp': 'Karss', 'Jungler': 'Woshipaul'}
+EXACT = ['Matches', 'Match Wins', 'Games', 'Game Wins', 'Kills', 'Deaths', 'Assists']
+
+
+def _record(match, won):
+    games = 2
+    match_row = {'Match': match, 'Opponent': 'ONIC', 'Result': 'Win' if won else 'Lose',
+                 'Score_NAVI': 2 if won else 0, 'Score_Opponent': 0 if won else 2, 'Game_Played': games,
+                 **{f'Player_{role}': f'{player},{player}' for role, player in ROSTER.items()}}
+    players = [{'Game': game, 'Player': player, 'Hero': f'H{i}{game}', 'Win': won, 'Game Time/s': 900 + 60 * game,
+                'Kills': 3 + i, 'Deaths': 2, 'Assists': 5 + game, 'Gold': 9000 + 100 * i, 'Damage': 50000 + 1000 * i}
+               for game in range(1, games + 1) for i, player in enumerate(ROSTER.values())]
+    return {'match': match_row, 'players': players}
+
+
+def _clear_loaded():
+    data_store._frames.clear()
+    data_store._published.clear()
+
+
+def test_appended_totals_match_fresh_seed(data_root):
+    incremental.append_matches([_record(17, True), _record(18, False)])
+    state = incremental.load_state()
+    _clear_loaded()
+    fresh = incremental.seed()
+    for appended, seeded in ((state.teams, fresh.teams), (state.players, fresh.players)):
+        seeded = seeded.loc[appended.index]
+        exact = [col for col in EXACT if col in appended.columns]
+        pd.testing.assert_frame_equal(appended[exact].astype('float64'), seeded[exact].astype('float64'))
+        # Kolom rata-rata di CSV dibulatkan, jadi total yang dibalik darinya hanya mendekati
+        numeric = appended.select_dtypes('number').columns
+        assert appended[numeric].to_numpy(dtype='float64') == pytest.approx(
+            seeded[numeric].to_numpy(dtype='float64'), rel=1e-2, abs=1e-6)
+    assert state.teams.loc['NAVI', 'Matches'] == fresh.teams.loc['NAVI', 'Matches']
+
+
+def test_batched_append_equals_sequential_appends(data_root):
+    incremental.append_matches([_record(17, True), _record(18, False)])
+    batched = {path: path.read_bytes() for path in (data_root / 'data').glob('*.csv')}
+    for name in ('data', 'data_jungler'):
+        shutil.rmtree(data_root / name)
+        shutil.copytree(REPO / name, data_root / name)
+    shutil.rmtree(data_root / '.cache')
+    _clear_loaded()
+    incremental.append_match(**_record(17, True))
+    _clear_loaded()
+    incremental.append_match(**_record(18, False))
+    assert {path: path.read_bytes() for path in (data_root / 'data').glob('*.csv')} == batched
+
+
+def test_append_keeps_source_header_and_file_ending(data_root):
+    sources = ['data/team_statistics.csv', 'data/player_navi_statistics.csv', 'data/navi_match_history_s15.csv']
+    before = {name: (data_root / name).read_bytes() for name in sources}
+    incremental.append_matches([_record(17, True)])
+    for name in sources:
+        after = (data_root / name).read_bytes()
+        # Header ganda 'Enemy Cryoturtle Kill Count' dan BOM tetap seperti aslinya
+        assert after.split(b'\n', 1)[0] == before[name].split(b'\n', 1)[0]
+        assert after.endswith(b'\n') == before[name].endswith(b'\n')
+    history = data_store.load('navi_match_history')
+    assert history['Match'].max() == 17
+
+
+def test_duplicate_match_is_rejected_without_writing(data_root):
+    incremental.append_matches([_record(17, True)])
+    before = (data_root / 'data/team_statistics.csv').read_bytes()
+    with pytest.raises(ValueError):
+        incremental.append_matches([_record(18, True), _record(17, True)])
+    assert (data_root / 'data/team_statistics.csv').read_bytes() == before
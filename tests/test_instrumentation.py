@@ -0,0 +1,40 @@
+import threading
+import tracemalloc
+
+import instrumentation
+
+
+def test_tracemalloc_stops_after_last_profiled_rerun(tmp_path, monkeypatch):
+    monkeypatch.setattr(instrumentation, 'LOG_PATH', tmp_path / 'profile.jsonl')
+    assert not tracemalloc.is_tracing()
+    inside, release = threading.Event(), threading.Event()
+
+    def other_session():
+        with instrumentation.rerun('app', enabled=True):
+            inside.set()
+            release.wait()
+    thread = threading.Thread(target=other_session)
+    thread.start()
+    inside.wait()
+
+    with instrumentation.rerun('app', enabled=True) as record:
+        with instrumentation.span('page', 'Test'):
+            bytearray(1024)
+    # Sesi lain masih mengukur: tracemalloc tetap jalan
+    assert tracemalloc.is_tracing()
+    assert record['page'] == 'Test'
+
+    release.set()
+    thread.join()
+    assert not tracemalloc.is_tracing()
+
+
+def test_tracemalloc_started_elsewhere_is_left_running(tmp_path, monkeypatch):
+    monkeypatch.setattr(instrumentation, 'LOG_PATH', tmp_path / 'profile.jsonl')
+    tracemalloc.start()
+    try:
+        with instrumentation.rerun('app', enabled=True):
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
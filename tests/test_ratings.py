@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+
+import ratings
+
+
+def _results(scores):
+    return pd.DataFrame({
+        'Season': 'S15',
+        'Team': 'NAVI',
+        'Opponent': [opponent for opponent, _, _ in scores],
+        'Score_Team': [score for _, score, _ in scores],
+        'Score_Opponent': [score for _, _, score in scores],
+        'Lineups': [('A · B · C · D · E',) * (a + b) for _, a, b in scores],
+        'Key': [f'S15/{match}' for match in range(1, len(scores) + 1)],
+    })
+
+
+@pytest.fixture
+def history(monkeypatch):
+    current = {}
+    monkeypatch.setattr(ratings, '_latest', {})
+    monkeypatch.setattr(ratings, 'match_results', lambda seasons: _results(current['scores']))
+
+    def build(scores):
+        current['scores'] = scores
+        return ratings._build('S15', ['S15'])
+    return build
+
+
+def test_appended_match_continues_previous_engine(history):
+    scores = [('ONIC', 1, 2), ('RRQ', 2, 1)]
+    history(scores)
+    engine = history(scores + [('EVOS', 2, 0)])
+    fresh = ratings.RatingEngine().replay(_results(scores + [('EVOS', 2, 0)]))
+    assert engine.rating('NAVI') == pytest.approx(fresh.rating('NAVI'))
+    assert engine.matches == 3
+
+
+def test_corrected_score_on_counted_match_replays_from_start(history):
+    history([('ONIC', 1, 2), ('RRQ', 2, 1)])
+    # Skor match 1 dikoreksi jadi 2-0 (key sama, isi berbeda)
+    corrected = [('ONIC', 2, 0), ('RRQ', 2, 1)]
+    engine = history(corrected)
+    fresh = ratings.RatingEngine().replay(_results(corrected))
+    assert engine.rating('NAVI') == pytest.approx(fresh.rating('NAVI'))
+    assert engine.games('NAVI') == 5
+
+
+def test_rating_exchange_is_zero_sum_between_established_teams():
+    engine = ratings.RatingEngine()
+    engine.teams.games[:] = ratings.PROVISIONAL_GAMES
+    engine.update('NAVI', 'ONIC', 2, 1, season='S15')
+    assert engine.rating('NAVI') + engine.rating('ONIC') == pytest.approx(2 * ratings.INITIAL_RATING)
+    assert engine.rating('NAVI') > ratings.INITIAL_RATING
+
+
+def test_series_win_probability():
+    assert ratings.series_win_probability(0.5) == pytest.approx(0.5)
+    assert ratings.series_win_probability(0.6, best_of=3) == pytest.approx(0.6 ** 2 + 2 * 0.6 ** 2 * 0.4)
+    assert ratings.series_win_probability(0.6, best_of=5) > ratings.series_win_probability(0.6, best_of=3)
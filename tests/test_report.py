@@ -0,0 +1,31 @@
+import plotly.graph_objects as go
+
+import analytics
+import data_store
+import report
+
+
+def add_past_season(data_root, season='S14'):
+    # Musim lama dengan meta hero yang berbeda: Granger tidak pernah di-ban
+    season_dir = data_root / data_store.SEASONS_DIR / season
+    season_dir.mkdir(parents=True)
+    for name in ('team_statistics.csv', 'hero_pick_ban_winrate.csv'):
+        (season_dir / name).write_bytes((data_root / 'data' / name).read_bytes())
+    hero_csv = season_dir / 'hero_pick_ban_winrate.csv'
+    hero_csv.write_text(hero_csv.read_text(encoding='utf-8').replace('Granger;119;80;', 'Granger;119;0;'),
+                        encoding='utf-8')
+    return season
+
+
+def test_meta_hero_stats_follows_season(data_root):
+    season = add_past_season(data_root)
+    assert analytics.meta_hero_stats().loc['Granger', 'Contest Count'] == 199
+    assert analytics.meta_hero_stats(season).loc['Granger', 'Contest Count'] == 119
+
+
+def test_render_league_uses_requested_season(data_root, tmp_path, monkeypatch):
+    season = add_past_season(data_root)
+    seen = []
+    monkeypatch.setattr(report.charts, 'top_contested_bar', lambda df: seen.append(df) or go.Figure())
+    report.render_league(tmp_path / 'out', season)
+    assert seen[0].loc['Granger', 'Contest Count'] == 119
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+import similarity
+
+
+def _index():
+    # Karss muncul di dua musim (ID sama): tidak boleh dianggap mirip dengan dirinya sendiri
+    pool = pd.DataFrame({
+        'Player': ['Karss', 'Karss', 'Kairi', 'Hanafi', 'Xyve'],
+        'ID': [1, 1, 2, 3, 4],
+        'Team': ['NAVI', 'NAVI', 'ONIC ID', 'NAVI', 'NAVI'],
+        'Season': ['S15', 'S14', 'S15', 'S15', 'S15'],
+        'Games Played': [20, 15, 30, 2, 25],
+        'Role': ['Exp', 'Exp', 'Jungler', 'Roam', 'Jungler'],
+    })
+    vectors = similarity._standardize(np.array([
+        [1.0, 0.0, 0.0], [0.9, 0.1, 0.0], [0.8, 0.3, 0.1], [1.0, 0.05, 0.0], [0.0, 1.0, 0.0],
+    ]))
+    return similarity.PlayerIndex(pool, vectors)
+
+
+def test_standardize_rows_have_unit_length():
+    vectors = similarity._standardize(np.array([[1.0, 2.0], [3.0, 1.0], [2.0, 2.0], [5.0, np.nan]]))
+    assert vectors.dtype == np.float32
+    np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1, rtol=1e-6)
+
+
+def test_similar_excludes_same_player_and_sorts_by_cosine():
+    index = _index()
+    (result,) = index.similar(0, k=10)
+    assert 'Karss' not in set(result['Player'])
+    assert result['Similarity'].is_monotonic_decreasing
+    expected = index.vectors[result.index] @ index.vectors[0]
+    np.testing.assert_allclose(result['Similarity'].to_numpy(), expected, rtol=1e-6)
+
+
+def test_similar_filters_role_and_min_games():
+    index = _index()
+    (result,) = index.similar(0, k=10, role='Jungler')
+    assert set(result['Player']) == {'Kairi', 'Xyve'}
+    (result,) = index.similar(0, k=10, min_games=10)
+    assert 'Hanafi' not in set(result['Player'])
+
+
+def test_similar_batch_matches_single_queries():
+    index = _index()
+    batch = index.similar([0, 2], k=2)
+    for position, result in zip([0, 2], batch):
+        (single,) = index.similar(position, k=2)
+        pd.testing.assert_frame_equal(result, single)
+
+
+def test_search_is_case_insensitive():
+    assert list(_index().search('karss')) == [0, 1]
+
+
+def test_player_index_from_data(data_root):
+    index = similarity.player_index()
+    position = int(index.search('Karss')[0])
+    (result,) = index.similar(position, k=5)
+    assert len(result) == 5
+    assert result['Similarity'].between(-1, 1.0001).all()
+    assert index.pool['Role'].notna().all()
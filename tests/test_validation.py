@@ -0,0 +1,54 @@
+import pytest
+
+import validation
+
+SCHEMA = {'Player': 'string', 'Games': 'int64'}
+CHECKS = [validation.NonNegative(['Games'])]
+
+
+def _read(tmp_path, games):
+    source = tmp_path / 'stats.csv'
+    source.write_text('Player,Games\n' + ''.join(f'P{i},{g}\n' for i, g in enumerate(games)))
+    return validation.read_csv(source, schema=SCHEMA, checks=CHECKS)
+
+
+def test_single_bad_row_in_small_file_is_quarantined(tmp_path):
+    # Seperti jungler_stats (6 baris): 10% dari 6 < 1, tapi satu baris rusak tidak boleh menolak file
+    clean, report, quarantined = _read(tmp_path, [5, 4, -1, 3, 2, 1])
+    assert len(clean) == 5
+    assert report['quarantined'] == 1
+    assert quarantined['Baris'].tolist() == [4]
+
+
+def test_too_many_bad_rows_rejects_file(tmp_path):
+    with pytest.raises(validation.ValidationError):
+        _read(tmp_path, [5, -4, -1, 3, 2, 1])
+
+
+def test_file_without_valid_rows_is_rejected(tmp_path):
+    with pytest.raises(validation.ValidationError):
+        _read(tmp_path, [-1])
+
+
+def test_quarantine_limit_has_absolute_floor():
+    assert validation.quarantine_limit(2) == 1
+    assert validation.quarantine_limit(6) == 1
+    assert validation.quarantine_limit(100) == 10
+    assert validation.quarantine_limit(101) == 11
+
+
+def test_quarantined_required_row_rejects_file(tmp_path):
+    source = tmp_path / 'stats.csv'
+    source.write_text('Player,Games\n' + ''.join(f'P{i},{g}\n' for i, g in enumerate([5, 4, -1, 3, 2, 1])))
+    # P2 dipakai langsung oleh halaman: dikarantina = file ditolak
+    with pytest.raises(validation.ValidationError, match='P2'):
+        validation.read_csv(source, schema=SCHEMA, checks=CHECKS, key='Player', required=('P0', 'P2'))
+    clean, _, _ = validation.read_csv(source, schema=SCHEMA, checks=CHECKS, key='Player', required=('P0',))
+    assert 'P2' not in set(clean['Player'])
+
+
+def test_missing_required_row_rejects_file(tmp_path):
+    source = tmp_path / 'stats.csv'
+    source.write_text('Player,Games\nP0,1\nP1,2\n')
+    with pytest.raises(validation.ValidationError, match='P9'):
+        validation.read_csv(source, schema=SCHEMA, checks=CHECKS, key='Player', required=('P9',))
@@ -0,0 +1,361 @@
+"""
+Validasi skema dan kualitas data saat CSV dikonversi ke Arrow (`data_store.ingest`).
+
+Setiap file dibaca sekali dan diperiksa secara vektor per kolom:
+- header: kolom skema yang hilang, kolom tak dikenal, header ganda (pandas
+  menamai ulang duplikat menjadi '<nama>.1') dan BOM yang ikut terbaca
+- tipe: kolom numerik skema yang berisi teks, atau kolom bilangan bulat yang
+  kosong / berisi pecahan / di luar rentang tipenya
+- cek deklaratif per dataset (lihat skema di `data_store`): rentang nilai,
+  batas antar kolom (menang <= main), keunikan kunci, dan konsistensi total
+  vs rata-rata (`Total Kills / Games Played ~ Average Kills per game`)
+
+Masalah header membuat file tidak bisa dipakai: `ValidationError` dilempar dan
+versi lama tetap dipakai (lihat `watcher`). Baris yang gagal cek tipe/data
+dikarantina: dibuang dari dataset dan disimpan beserta alasannya di
+`.cache/quarantine/`. Jika lebih dari `quarantine_limit(baris)` baris gagal
+(MAX_QUARANTINE_FRACTION, minimal MIN_QUARANTINE_ROWS agar satu baris rusak di
+file kecil seperti team_stats tidak menolak seluruh file) atau tidak ada baris
+yang lolos, file dianggap ekspor rusak dan juga ditolak. Begitu pula jika baris
+wajib dataset (pemain/tim/hero yang dibaca langsung oleh halaman) ikut gagal. Ringkasan hasilnya
+disimpan di metadata cache dan dibaca lewat `data_store.validation_report`.
+
+    python validation.py                       # semua dataset musim berjalan
+    python validation.py --season S14 team_stats
+"""
+import argparse
+import codecs
+import csv
+import math
+import sys
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Lebih dari porsi baris ini yang gagal = ekspor rusak, seluruh file ditolak...
+MAX_QUARANTINE_FRACTION = 0.1
+# ...tapi sejumlah baris ini selalu boleh dikarantina (file kecil: 10% dari 6 baris < 1)
+MIN_QUARANTINE_ROWS = 1
+
+# Jumlah nomor baris contoh per masalah di laporan
+EXAMPLES = 5
+
+BOM = '\ufeff'
+
+
+def quarantine_limit(rows):
+    """Jumlah baris gagal terbanyak yang masih dikarantina (bukan menolak file) untuk file `rows` baris."""
+    return max(MIN_QUARANTINE_ROWS, math.ceil(MAX_QUARANTINE_FRACTION * rows))
+
+
+class ValidationError(ValueError):
+    """File sumber ditolak; `report` berisi laporan lengkapnya."""
+
+    def __init__(self, message, report=None):
+        super().__init__(message)
+        self.report = report
+
+
+def _tolerance(decimals):
+    # Sumber membulatkan ke `decimals` angka desimal: selisih maksimal setengah digit terakhir
+    return 0.5 * 10 ** -decimals + 1e-6
+
+
+def _numeric(df, columns):
+    return df[list(columns)].to_numpy(dtype='float64')
+
+
+# --- CEK DEKLARATIF ---
+# Setiap cek menghasilkan pasangan (label, mask baris yang melanggar). `repair`
+# membuat data memenuhi cek (dipakai `synth` agar data sintetis tetap konsisten).
+@dataclass(frozen=True)
+class NonNegative:
+    columns: tuple
+
+    def violations(self, df):
+        bad = _numeric(df, self.columns) < 0
+        for i in np.flatnonzero(bad.any(axis=0)):
+            yield f'{self.columns[i]} negatif', bad[:, i]
+
+    def repair(self, df):
+        for col in self.columns:
+            df[col] = df[col].clip(lower=0)
+
+
+@dataclass(frozen=True)
+class Between:
+    columns: tuple
+    low: float
+    high: float
+
+    def violations(self, df):
+        values = _numeric(df, self.columns)
+        bad = (values < self.low) | (values > self.high)
+        for i in np.flatnonzero(bad.any(axis=0)):
+            yield f'{self.columns[i]} di luar {self.low:g}..{self.high:g}', bad[:, i]
+
+    def repair(self, df):
+        for col in self.columns:
+            df[col] = df[col].clip(self.low, self.high)
+
+
+@dataclass(frozen=True)
+class AtMost:
+    """`column` <= `limit` (misal jumlah menang <= jumlah main)."""
+    column: str
+    limit: str
+
+    def violations(self, df):
+        yield f'{self.column} > {self.limit}', (df[self.column] > df[self.limit]).to_numpy()
+
+    def repair(self, df):
+        df[self.column] = np.minimum(df[self.column], df[self.limit]).astype(df[self.column].dtype)
+
+
+@dataclass(frozen=True)
+class SumOf:
+    column: str
+    parts: tuple
+
+    def violations(self, df):
+        total = _numeric(df, self.parts).sum(axis=1)
+        yield f'{self.column} != {" + ".join(self.parts)}', df[self.column].to_numpy() != total
+
+    def repair(self, df):
+        df[self.column] = df[list(self.parts)].sum(axis=1).astype(df[self.column].dtype)
+
+
+@dataclass(frozen=True)
+class PerGame:
+    """`average` ~ `total` / `games` x `scale` (dibulatkan `decimals` angka); total harus 0 jika games = 0."""
+    average: str
+    total: str
+    games: str
+    scale: float = 1.0
+    decimals: int = 2
+
+    def _expected(self, df):
+        games = df[self.games].to_numpy(dtype='float64')
+        total = df[self.total].to_numpy(dtype='float64')
+        return np.divide(total * self.scale, games, out=np.zeros(len(df)), where=games > 0), games, total
+
+    def violations(self, df):
+        expected, games, total = self._expected(df)
+        off = np.abs(df[self.average].to_numpy(dtype='float64') - expected) > _tolerance(self.decimals)
+        yield f'{self.average} != {self.total} / {self.games}', np.where(games > 0, off, total != 0)
+
+    def repair(self, df):
+        df[self.average] = self._expected(df)[0].round(self.decimals)
+
+
+@dataclass(frozen=True)
+class KdaRatio:
+    """`column` ~ (kill + assist) / max(death, 1)."""
+    column: str
+    kills: str = 'Total Kills'
+    deaths: str = 'Total Deaths'
+    assists: str = 'Total Assists'
+    decimals: int = 2
+
+    def _expected(self, df):
+        kills, deaths, assists = _numeric(df, (self.kills, self.deaths, self.assists)).T
+        return (kills + assists) / np.maximum(deaths, 1)
+
+    def violations(self, df):
+        off = np.abs(df[self.column].to_numpy(dtype='float64') - self._expected(df)) > _tolerance(self.decimals)
+        yield f'{self.column} != ({self.kills} + {self.assists}) / {self.deaths}', off
+
+    def repair(self, df):
+        df[self.column] = self._expected(df).round(self.decimals)
+
+
+@dataclass(frozen=True)
+class Unique:
+    """Kombinasi `columns` unik; kemunculan kedua dan seterusnya dikarantina."""
+    columns: tuple
+
+    def violations(self, df):
+        yield f'{" + ".join(self.columns)} ganda', df.duplicated(list(self.columns)).to_numpy()
+
+
+@dataclass(frozen=True)
+class NotNull:
+    column: str
+
+    def violations(self, df):
+        yield f'{self.column} kosong', df[self.column].isna().to_numpy()
+
+
+def basic_checks(schema):
+    """Cek bawaan dari skema: kolom numerik tidak negatif, kolom rate% (bukan rasio x/y%) di 0..100."""
+    numeric = tuple(col for col, dtype in schema.items() if _is_numeric(dtype))
+    rates = tuple(col for col in numeric if col.endswith('%') and '/' not in col)
+    return (NonNegative(numeric), Between(rates, 0, 100))
+
+
+def repair(df, checks):
+    """Salinan `df` yang memenuhi `checks`, diterapkan berurutan (cek tanpa `repair` dilewati)."""
+    df = df.copy()
+    for check in checks:
+        if hasattr(check, 'repair'):
+            check.repair(df)
+    return df
+
+
+# --- HEADER & TIPE ---
+def _is_numeric(dtype):
+    return pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(dtype))
+
+
+def _read_header(source, sep, encoding):
+    # (nama kolom mentah sebelum pandas mengganti nama duplikat, apakah file diawali BOM)
+    with open(source, 'rb') as f:
+        line = f.readline()
+    names = next(csv.reader([line.decode(encoding, errors='replace').rstrip('\r\n')], delimiter=sep), [])
+    return names, line.startswith(codecs.BOM_UTF8)
+
+
+def _header_issues(header, bom, columns, schema):
+    # (level, pesan); level 'error' = file ditolak
+    issues = []
+    if header and header[0].startswith(BOM):
+        issues.append(('error', f"Header diawali BOM ('{header[0]}'): baca file dengan encoding utf-8-sig"))
+    elif bom:
+        issues.append(('info', "BOM di awal header dibuang oleh encoding utf-8-sig"))
+    seen = set()
+    for name in header:
+        if name in seen:
+            continue
+        seen.add(name)
+        count = header.count(name)
+        if count > 1:
+            renamed = [name] + [f'{name}.{i}' for i in range(1, count)]
+            # Duplikat yang sudah dipetakan skema (misal header asli team_statistics) hanya dicatat
+            level = 'info' if all(col in schema for col in renamed) else 'error'
+            issues.append((level, f"Header '{name}' muncul {count}x, dibaca sebagai {', '.join(renamed)}"))
+    missing = [col for col in schema if col not in columns]
+    if missing:
+        issues.append(('error', f"Kolom skema tidak ada: {', '.join(missing)}"))
+    extra = [col for col in columns if col not in schema]
+    if schema and extra:
+        issues.append(('warning', f"Kolom di luar skema: {', '.join(extra)}"))
+    return issues
+
+
+def _type_violations(df, schema):
+    # Kolom numerik yang berisi teks diganti hasil konversinya (sel rusak = NaN) di `df`
+    for col, dtype in schema.items():
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if not pd.api.types.is_numeric_dtype(dtype):
+            continue
+        values = df[col]
+        not_number = np.zeros(len(df), dtype=bool)
+        if not pd.api.types.is_numeric_dtype(values.dtype):
+            # Kolom berisi teks: pandas tidak bisa menebak tipe numerik
+            coerced = pd.to_numeric(values, errors='coerce')
+            not_number = (coerced.isna() & values.notna()).to_numpy()
+            yield f'{col} bukan angka', not_number
+            df[col] = values = coerced
+        if pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_integer_dtype(values.dtype):
+            numbers = values.to_numpy(dtype='float64')
+            info = np.iinfo(dtype)
+            yield f'{col} kosong atau bukan bilangan bulat', ~not_number & (
+                np.isnan(numbers) | (numbers % 1 != 0) | (numbers < info.min) | (numbers > info.max))
+
+
+# --- VALIDASI ---
+def read_csv(source, sep=',', schema=None, encoding='utf-8', checks=(), key=None, required=()):
+    """
+    Membaca dan memvalidasi satu CSV. `required`: nilai kolom `key` yang barisnya
+    dipakai langsung oleh halaman; jika salah satunya hilang atau dikarantina,
+    seluruh file ditolak (bukan dikarantina) agar halaman menampilkan pesan validasi.
+    Mengembalikan (DataFrame bersih bertipe skema, laporan, baris karantina).
+    Laporan: {'rows', 'quarantined', 'issues': [{'level', 'check', 'rows', 'lines'}]},
+    dengan `lines` = contoh nomor baris di file sumber (header = baris 1).
+    """
+    schema = schema or {}
+    # Kolom numerik dibaca tanpa tipe paksa agar satu sel rusak tidak menggagalkan seluruh file
+    df = pd.read_csv(source, sep=sep, encoding=encoding,
+                     dtype={col: dtype for col, dtype in schema.items() if not _is_numeric(dtype)})
+
+    issues = [{'level': level, 'check': message, 'rows': 0, 'lines': []}
+              for level, message in _header_issues(*_read_header(source, sep, encoding), df.columns, schema)]
+    report = {'rows': len(df), 'quarantined': 0, 'issues': issues}
+    if any(issue['level'] == 'error' for issue in issues):
+        raise ValidationError(f"{source.name}: {issues[0]['check']}", report)
+
+    # Nilai asli (sebelum konversi tipe) untuk file karantina
+    raw = df.copy(deep=False)
+    violations = list(_type_violations(df, schema))
+    # Cek data hanya berjalan pada baris yang tipenya valid (sel rusak bernilai NaN)
+    typed = ~np.logical_or.reduce([mask for _, mask in violations]) if violations else np.ones(len(df), bool)
+    for check in checks:
+        violations.extend((label, mask & typed) for label, mask in check.violations(df))
+
+    bad = np.zeros(len(df), dtype=bool)
+    reasons = pd.Series('', index=df.index)
+    for label, mask in violations:
+        if not mask.any():
+            continue
+        rows = np.flatnonzero(mask)
+        issues.append({'level': 'quarantine', 'check': label, 'rows': len(rows),
+                       'lines': (rows[:EXAMPLES] + 2).tolist()})
+        bad |= mask
+        reasons[mask] += label + '; '
+
+    report['quarantined'] = int(bad.sum())
+    limit = quarantine_limit(len(df))
+    if report['quarantined'] > limit or (len(df) and report['quarantined'] == len(df)):
+        raise ValidationError(f"{source.name}: {report['quarantined']} dari {len(df)} baris gagal validasi "
+                              f"(batas {limit} baris)", report)
+    if required:
+        valid_keys = set(df.loc[~bad, key].astype(str))
+        missing = [value for value in required if value not in valid_keys]
+        if missing:
+            raise ValidationError(f"{source.name}: baris wajib {', '.join(missing)} tidak ada atau gagal validasi",
+                                  report)
+
+    quarantined = raw[bad].assign(Baris=np.flatnonzero(bad) + 2, Alasan=reasons[bad].str.rstrip('; '))
+    clean = df[~bad].astype({col: dtype for col, dtype in schema.items() if _is_numeric(dtype)})
+    return clean.reset_index(drop=True), report, quarantined
+
+
+def format_report(report):
+    lines = [f"{report['rows']} baris, {report['quarantined']} dikarantina"]
+    for issue in report['issues']:
+        where = f" ({issue['rows']} baris, mis. baris {', '.join(map(str, issue['lines']))})" if issue['rows'] else ''
+        lines.append(f"[{issue['level']}] {issue['check']}{where}")
+    return lines
+
+
+def main(argv=None):
+    import data_store
+    # Kelas yang dilempar data_store (modul ini sendiri berjalan sebagai __main__)
+    from validation import ValidationError
+
+    parser = argparse.ArgumentParser(description="Laporan validasi dataset (skema, tipe, konsistensi).")
+    parser.add_argument('datasets', nargs='*', default=list(data_store.DATASETS))
+    parser.add_argument('--season', default=data_store.CURRENT_SEASON)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name in args.datasets:
+        if not data_store.has_dataset(name, args.season):
+            continue
+        try:
+            report = data_store.validation_report(name, args.season)
+        except ValidationError as e:
+            report, failed = e.report, True
+            print(f"{name}: DITOLAK - {e}")
+        else:
+            print(f"{name}:")
+            failed = failed or report['quarantined'] > 0
+        for line in format_report(report or {'rows': 0, 'quarantined': 0, 'issues': []}):
+            print(f"  {line}")
+    # Kode 1 jika ada file ditolak atau baris dikarantina (untuk dipakai di CI)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
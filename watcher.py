@@ -0,0 +1,204 @@
+"""
+Watcher file data di background dengan hot reload per dataset.
+
+Observer watchdog memantau `data/` (termasuk `data/seasons/<musim>/`) dan
+`data_jungler/`. Setiap event file dipetakan ke (dataset, musim); event yang
+beruntun untuk file yang sama digabung (debounce) lalu hanya dataset itu yang
+dikonversi dan dimuat ulang di thread worker lewat `data_store.publish`.
+Versi baru ditukar secara atomik, jadi sesi yang sedang berjalan tetap memakai
+versi lama sampai versi baru siap dan tidak pernah menunggu proses reload.
+
+Dataset tidak dimuat saat watcher mulai: `data_store.load` mempublikasikan
+setiap dataset saat pertama kali dibutuhkan, dan setelah itu `load` /
+`dataset_version` untuk dataset tersebut tidak lagi mengecek file sama sekali.
+Perubahan file dataset yang belum pernah dimuat diabaikan (pemuatan pertama
+membaca file terbaru).
+
+Aktif otomatis di kedua dashboard; set MLBB_WATCH=0 untuk mematikan.
+Jalankan `python watcher.py` untuk melihat log reload tanpa Streamlit.
+"""
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+import data_store
+
+WATCH_DIRS = ['data', 'data_jungler']
+
+# Jeda sejak event terakhir sebelum dataset dimuat ulang (file bisa ditulis bertahap)
+DEBOUNCE_SECONDS = 0.5
+
+# Event yang bisa mengubah isi file (bukan sekadar dibuka/dibaca)
+CHANGE_EVENTS = {'created', 'modified', 'moved', 'deleted', 'closed'}
+
+log = logging.getLogger(__name__)
+
+
+def dataset_for_path(path):
+    """(nama dataset, musim) untuk file sumber di `path`, atau None jika bukan file dataset."""
+    try:
+        relative = Path(os.path.abspath(path)).relative_to(data_store.DATA_ROOT)
+    except ValueError:
+        return None
+    parts = relative.parts
+    if len(parts) == 4 and Path(*parts[:2]) == Path(data_store.SEASONS_DIR):
+        season = parts[2]
+    elif len(parts) == 2:
+        season = data_store.CURRENT_SEASON
+    else:
+        return None
+
+    filename = parts[-1]
+    names = list(data_store.DATASETS)
+    if match := re.fullmatch(r'player_(.+)_statistics\.csv', filename):
+        names.append(f'{match.group(1)}_player_stats')
+    if match := re.fullmatch(r'(.+)_hero\.csv', filename):
+        names.append(f'{match.group(1)}_hero_stats')
+    for name in names:
+        if Path(data_store.dataset_spec(name, season).path) == relative:
+            return name, season
+    return None
+
+
+class _Handler(FileSystemEventHandler):
+    def __init__(self, watcher):
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in CHANGE_EVENTS:
+            return
+        for path in (event.src_path, getattr(event, 'dest_path', '')):
+            dataset = dataset_for_path(path) if path else None
+            if dataset is not None:
+                self.watcher.schedule(*dataset)
+
+
+class Watcher:
+    def __init__(self, root=None, debounce=DEBOUNCE_SECONDS):
+        self.root = Path(root or data_store.DATA_ROOT)
+        self.debounce = debounce
+        self.reloads = []
+        self._pending = {}
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._observer = None
+        self._thread = None
+
+    def start(self, publish_existing=False):
+        """`publish_existing`: muat ulang di background dataset yang sudah dimuat sebelum watcher mulai."""
+        self._observer = Observer()
+        for directory in WATCH_DIRS:
+            path = self.root / directory
+            if path.is_dir():
+                self._observer.schedule(_Handler(self), str(path), recursive=True)
+        self._observer.daemon = True
+        self._observer.start()
+        self._thread = threading.Thread(target=self._run, name='mlbb-data-watcher', daemon=True)
+        self._thread.start()
+        data_store.publish_on_load()
+        if publish_existing:
+            for name, season in sorted(data_store.loaded_datasets()):
+                self.schedule(name, season, delay=0)
+        return self
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+        if self._thread is not None:
+            self._thread.join()
+        data_store.publish_on_load(False)
+
+    def schedule(self, name, season, delay=None):
+        """Menjadwalkan reload dataset; event baru untuk dataset yang sama memundurkan jadwalnya."""
+        with self._cond:
+            self._pending[(name, season)] = time.monotonic() + (self.debounce if delay is None else delay)
+            self._cond.notify()
+
+    def idle(self):
+        """True jika tidak ada reload yang menunggu."""
+        with self._cond:
+            return not self._pending
+
+    def _next_due(self):
+        # Dipanggil dengan self._cond terkunci
+        while not self._stopped:
+            now = time.monotonic()
+            due = [key for key, deadline in self._pending.items() if deadline <= now]
+            if due:
+                for key in due:
+                    del self._pending[key]
+                return due
+            timeout = min(self._pending.values()) - now if self._pending else None
+            self._cond.wait(timeout)
+        return None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                due = self._next_due()
+            if due is None:
+                return
+            for name, season in due:
+                self._reload(name, season)
+
+    def _reload(self, name, season):
+        if (name, season) not in data_store.loaded_datasets():
+            return
+        start = time.perf_counter()
+        try:
+            if not data_store.has_dataset(name, season):
+                data_store.unpublish(name, season)
+                log.info("%s (%s) dihapus", name, season)
+                return
+            previous = data_store.published_version(name, season)
+            digest = data_store.publish(name, season)
+        except Exception:
+            # Versi lama tetap dipakai jika file baru belum valid (misal masih ditulis)
+            log.exception("Gagal memuat ulang %s (%s)", name, season)
+            return
+        if digest != previous:
+            seconds = time.perf_counter() - start
+            self.reloads.append({'dataset': name, 'season': season, 'version': digest[:12], 'seconds': seconds})
+            del self.reloads[:-100]
+            log.info("%s (%s) dimuat ulang dalam %.1f ms", name, season, seconds * 1000)
+
+
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def enabled():
+    return os.environ.get('MLBB_WATCH', '1').lower() not in ('0', 'false', 'no')
+
+
+def start():
+    """Menjalankan watcher tunggal untuk proses ini (idempoten); None jika dimatikan lewat MLBB_WATCH=0."""
+    global _watcher
+    if not enabled():
+        return None
+    if _watcher is None:
+        with _watcher_lock:
+            if _watcher is None:
+                _watcher = Watcher().start()
+    return _watcher
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    watcher = Watcher().start()
+    print(f"Memantau {', '.join(WATCH_DIRS)} di {watcher.root} (Ctrl+C untuk berhenti)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        watcher.stop()